@@ -0,0 +1,68 @@
+"""
+Compare per-record and batched (JSON Lines) `avro-json` throughput.
+
+Run it with: python benchmarks/avro_json_batch.py
+"""
+import dataclasses
+import io
+import timeit
+import typing
+
+from dataclasses_avroschema import AvroModel
+
+RECORDS = 10_000
+REPEAT = 3
+
+
+@dataclasses.dataclass
+class Address(AvroModel):
+    street: str
+    street_number: int
+
+
+@dataclasses.dataclass
+class User(AvroModel):
+    name: str
+    age: int
+    addresses: typing.List[Address]
+    tags: typing.Dict[str, str]
+
+
+def report(name: str, seconds: float) -> None:
+    print(f"{name:<30} {RECORDS / seconds:>12,.0f} records/s")
+
+
+def main() -> None:
+    users = [
+        User(name=f"user {n}", age=n, addresses=[Address(street="street", street_number=n)], tags={"n": str(n)})
+        for n in range(RECORDS)
+    ]
+    single_records = [user.serialize(serialization_type="avro-json") for user in users]
+    json_lines = User.serialize_many(users, serialization_type="avro-json")
+
+    def encode_per_record() -> None:
+        for user in users:
+            user.serialize(serialization_type="avro-json")
+
+    def encode_batch() -> None:
+        User.serialize_many(users, serialization_type="avro-json")
+
+    def decode_per_record() -> None:
+        for data in single_records:
+            User.deserialize(data, serialization_type="avro-json", create_instance=False)
+
+    def decode_batch() -> None:
+        for _ in User.load_jsonl(io.BytesIO(json_lines), create_instance=False):
+            pass
+
+    for name, func in (
+        ("encode per record", encode_per_record),
+        ("encode batch (serialize_many)", encode_batch),
+        ("decode per record", decode_per_record),
+        ("decode batch (load_jsonl)", decode_batch),
+    ):
+        report(name, min(timeit.repeat(func, number=1, repeat=REPEAT)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Compare the validating and the trusted (`class Meta: trusted = True`) paths of AvroBaseModel.
+
+Run it with: python benchmarks/avrodantic_trusted.py
+"""
+import enum
+import timeit
+import typing
+
+from dataclasses_avroschema.avrodantic import AvroBaseModel
+
+RECORDS = 10_000
+REPEAT = 3
+
+
+class Color(enum.Enum):
+    BLUE = "BLUE"
+    GREEN = "GREEN"
+
+
+class Address(AvroBaseModel):
+    street: str
+    street_number: int
+
+
+class User(AvroBaseModel):
+    name: str
+    age: int
+    color: Color
+    addresses: typing.List[Address]
+    tags: typing.Dict[str, str]
+
+
+class TrustedUser(User):
+    class Meta:
+        schema_name = "User"
+        trusted = True
+
+
+def report(name: str, seconds: float) -> None:
+    print(f"{name:<30} {RECORDS / seconds:>12,.0f} records/s")
+
+
+def main() -> None:
+    users = [
+        User(
+            name=f"user {n}",
+            age=n,
+            color=Color.BLUE,
+            addresses=[Address(street="street", street_number=n)],
+            tags={"n": str(n)},
+        )
+        for n in range(RECORDS)
+    ]
+    # deserialize_many renders the schema once, so the benchmark measures the creation of the instances
+    data = User.serialize_many(users)
+    trusted_users = TrustedUser.deserialize_many(data)
+
+    def decode(model: typing.Type[User]) -> typing.Callable[[], None]:
+        def run() -> None:
+            model.deserialize_many(data)
+
+        return run
+
+    def to_dict(instances: typing.Sequence[User]) -> typing.Callable[[], None]:
+        def run() -> None:
+            for instance in instances:
+                instance.asdict()
+
+        return run
+
+    for name, func in (
+        ("deserialize_many (validating)", decode(User)),
+        ("deserialize_many (trusted)", decode(TrustedUser)),
+        ("asdict (validating)", to_dict(users)),
+        ("asdict (trusted)", to_dict(trusted_users)),
+    ):
+        report(name, min(timeit.repeat(func, number=1, repeat=REPEAT)))
+
+
+if __name__ == "__main__":
+    main()
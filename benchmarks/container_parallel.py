@@ -0,0 +1,63 @@
+"""
+Compare reading a container file in one process and with `read_container_parallel`.
+
+Run it with: python benchmarks/container_parallel.py
+"""
+import dataclasses
+import os
+import tempfile
+import time
+import typing
+
+import fastavro
+
+from dataclasses_avroschema import AvroModel
+from dataclasses_avroschema.container import ContainerReader, read_container_parallel
+
+RECORDS = 200_000
+
+
+@dataclasses.dataclass
+class User(AvroModel):
+    name: str
+    age: int
+    tags: typing.Dict[str, str]
+
+
+def report(name: str, seconds: float) -> None:
+    print(f"{name:<40} {RECORDS / seconds:>12,.0f} records/s")
+
+
+def measure(name: str, func: typing.Callable[[], typing.Any]) -> None:
+    start = time.perf_counter()
+    func()
+    report(name, time.perf_counter() - start)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "users.avro")
+        with open(path, "wb") as fileobj:
+            records = ({"name": f"user {n}", "age": n, "tags": {"n": str(n)}} for n in range(RECORDS))
+            fastavro.writer(fileobj, User.avro_schema_to_python(), records, "deflate")
+
+        def read_sequential() -> None:
+            with ContainerReader(path, User) as reader:
+                for _ in reader:
+                    pass
+
+        measure("ContainerReader", read_sequential)
+        for workers in sorted({1, 2, os.cpu_count() or 1}):
+            measure(f"read_container_parallel({workers})", lambda: list(read_container_parallel(path, User, workers)))
+            measure(
+                f"read_container_parallel({workers}, unordered)",
+                lambda: list(read_container_parallel(path, User, workers, ordered=False)),
+            )
+            measure(
+                f"read_container_parallel({workers}, columns)",
+                lambda: list(read_container_parallel(path, User, workers, columns=True)),
+            )
+
+
+if __name__ == "__main__":
+    main()
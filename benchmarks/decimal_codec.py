@@ -0,0 +1,85 @@
+"""
+Compare `serialization.DecimalCodec` with the previous decimal functions, that built
+the unscaled integer digit by digit and shared a module level `decimal.Context`.
+
+Run it with: python benchmarks/decimal_codec.py
+"""
+import decimal
+import random
+import timeit
+import typing
+
+from dataclasses_avroschema import serialization
+
+VALUES = 100_000
+REPEAT = 3
+PRECISION = 18
+SCALE = 6
+
+decimal_context = decimal.Context()
+
+
+def previous_prepare_bytes_decimal(data: decimal.Decimal, precision: int, scale: int = 0) -> bytes:
+    sign, digits, exp = data.as_tuple()
+
+    if len(digits) > precision:
+        raise ValueError("The decimal precision is bigger than allowed by schema")
+
+    delta = int(exp) + scale
+
+    if delta < 0:
+        raise ValueError("Scale provided in schema does not match the decimal")
+
+    unscaled_datum = 0
+    for digit in digits:
+        unscaled_datum = (unscaled_datum * 10) + digit
+
+    unscaled_datum = 10**delta * unscaled_datum
+
+    bytes_req = (unscaled_datum.bit_length() + 8) // 8
+
+    if sign:
+        unscaled_datum = -unscaled_datum
+
+    return unscaled_datum.to_bytes(bytes_req, byteorder="big", signed=True)
+
+
+def previous_bytes_to_decimal(value: bytes, precision: int, scale: int = 0) -> decimal.Decimal:
+    unscaled_datum = int.from_bytes(value, byteorder="big", signed=True)
+    decimal_context.prec = precision
+
+    return decimal_context.create_decimal(unscaled_datum).scaleb(-scale, decimal_context)
+
+
+def report(name: str, seconds: float) -> None:
+    print(f"{name:<30} {VALUES / seconds:>12,.0f} values/s")
+
+
+def main() -> None:
+    rng = random.Random(0)
+    values = [
+        decimal.Decimal(rng.randint(-(10**PRECISION) + 1, 10**PRECISION - 1)).scaleb(-SCALE) for _ in range(VALUES)
+    ]
+    codec = serialization.get_decimal_codec(PRECISION, SCALE)
+    encoded = codec.encode_many(values)
+
+    assert encoded == [previous_prepare_bytes_decimal(value, PRECISION, SCALE) for value in values]
+    assert codec.decode_many(encoded) == values
+
+    def encode_previous() -> typing.List[bytes]:
+        return [previous_prepare_bytes_decimal(value, PRECISION, SCALE) for value in values]
+
+    def decode_previous() -> typing.List[decimal.Decimal]:
+        return [previous_bytes_to_decimal(value, PRECISION, SCALE) for value in encoded]
+
+    for name, func in (
+        ("encode (previous)", encode_previous),
+        ("encode_many (codec)", lambda: codec.encode_many(values)),
+        ("decode (previous)", decode_previous),
+        ("decode_many (codec)", lambda: codec.decode_many(encoded)),
+    ):
+        report(name, min(timeit.repeat(func, number=1, repeat=REPEAT)))
+
+
+if __name__ == "__main__":
+    main()
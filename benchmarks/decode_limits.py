@@ -0,0 +1,60 @@
+"""
+Measure the cost of the decode limits: deserialize a typical message without limits,
+with limits that it can not exceed because of its size (only the size is checked)
+and with limits that are smaller than the message, so it is walked before it is decoded.
+
+Run it with: python benchmarks/decode_limits.py
+"""
+import dataclasses
+import timeit
+import typing
+
+from dataclasses_avroschema import AvroModel
+from dataclasses_avroschema.limits import DecodeLimits
+
+NUMBER = 20_000
+
+
+@dataclasses.dataclass
+class Address(AvroModel):
+    street: str
+    street_number: int
+
+
+@dataclasses.dataclass
+class User(AvroModel):
+    name: str
+    age: int
+    tags: typing.List[str]
+    addresses: typing.List[Address]
+    attributes: typing.Dict[str, str]
+    email: typing.Optional[str] = None
+
+
+def measure(name: str, function: typing.Callable[[], typing.Any]) -> None:
+    elapsed = min(timeit.repeat(function, number=NUMBER, repeat=5)) / NUMBER
+    print(f"{name:<40} {elapsed * 1_000_000:>8.2f} µs")
+
+
+def main() -> None:
+    user = User(
+        name="john",
+        age=20,
+        tags=["a", "b", "c"],
+        addresses=[Address(street="test", street_number=number) for number in range(3)],
+        attributes={"key": "value"},
+        email="john@example.com",
+    )
+    data = user.serialize()
+    print(f"payload of {len(data)} bytes")
+
+    limits = DecodeLimits(max_bytes=1_000_000, max_collection_length=1000, max_string_length=1000, max_depth=10)
+    small_limits = DecodeLimits(max_collection_length=10, max_string_length=20, max_depth=10)
+
+    measure("without limits", lambda: User.deserialize(data))
+    measure("with limits (size check)", lambda: User.deserialize(data, limits=limits))
+    measure("with limits (payload walked)", lambda: User.deserialize(data, limits=small_limits))
+
+
+if __name__ == "__main__":
+    main()
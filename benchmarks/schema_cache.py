@@ -0,0 +1,108 @@
+"""
+Compare the cold start of models with and without the persistent schema cache:
+each measurement is a new process that gets the schema, parsed schema and fingerprint
+of all the models, and then serializes and deserializes a first instance of each of them.
+
+Run it with: python benchmarks/schema_cache.py
+"""
+import dataclasses
+import datetime
+import enum
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import typing
+
+from dataclasses_avroschema import AvroModel, schema_cache
+
+MODELS = 200
+
+
+class Status(enum.Enum):
+    ACTIVE = "ACTIVE"
+    INACTIVE = "INACTIVE"
+
+
+@dataclasses.dataclass
+class Address(AvroModel):
+    street: str
+    street_number: int
+    city: typing.Optional[str] = None
+
+
+def create_model(number: int) -> typing.Type[AvroModel]:
+    model = dataclasses.make_dataclass(
+        f"User{number}",
+        [
+            ("name", str),
+            ("age", int),
+            ("status", Status),
+            ("created", datetime.datetime),
+            ("addresses", typing.List[Address]),
+            ("tags", typing.Dict[str, str]),
+            ("score", typing.Optional[float], None),
+        ],
+        bases=(AvroModel,),
+    )
+    model.__module__ = __name__
+    return model
+
+
+MODEL_CLASSES = [create_model(number) for number in range(MODELS)]
+
+
+def create_instance(model: typing.Type[AvroModel]) -> AvroModel:
+    return model(
+        name="john",
+        age=20,
+        status=Status.ACTIVE,
+        created=datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+        addresses=[Address(street="main", street_number=1)],
+        tags={"team": "data"},
+    )
+
+
+def start(cache_path: typing.Optional[str]) -> typing.Tuple[float, float]:
+    if cache_path is not None:
+        schema_cache.enable(cache_path)
+
+    start_time = time.perf_counter()
+    for model in MODEL_CLASSES:
+        model.avro_schema_to_python()
+        model.get_parsed_schema()
+        model.get_fingerprint()
+    schemas_time = time.perf_counter() - start_time
+
+    instances = [create_instance(model) for model in MODEL_CLASSES]
+    start_time = time.perf_counter()
+    for instance in instances:
+        instance.deserialize(instance.serialize())
+    return schemas_time, time.perf_counter() - start_time
+
+
+def measure(name: str, cache_path: typing.Optional[str]) -> None:
+    arguments = [sys.executable, __file__, "child"] + ([cache_path] if cache_path is not None else [])
+    output = subprocess.run(arguments, check=True, capture_output=True, text=True).stdout
+    schemas_time, first_use_time = (float(value) for value in output.split())
+    print(
+        f"{name:<30} {schemas_time * 1000:>10.1f} ms schemas"
+        f" {first_use_time * 1000:>10.1f} ms first serialize/deserialize for {MODELS} models"
+    )
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        cache_path = os.path.join(directory, "schemas.json")
+
+        measure("without cache", None)
+        measure("cache miss (first start)", cache_path)
+        measure("cache hit", cache_path)
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["child"]:
+        print(*start(sys.argv[2] if len(sys.argv) > 2 else None))
+    else:
+        main()
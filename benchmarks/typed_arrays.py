@@ -0,0 +1,55 @@
+"""
+Compare the serialization and deserialization of models with large arrays of numbers
+when the values are lists and when they are typed arrays (array.array).
+
+Run it with: python benchmarks/typed_arrays.py
+"""
+import array
+import dataclasses
+import random
+import timeit
+import typing
+
+from dataclasses_avroschema import AvroModel, types
+
+ITEMS = 10_000
+NUMBER = 100
+
+
+@dataclasses.dataclass
+class Measurements(AvroModel):
+    counts: typing.List[int]
+    values: typing.List[float]
+    small_values: typing.List[types.Float32]
+
+
+@dataclasses.dataclass
+class TypedMeasurements(Measurements):
+    class Meta:
+        typed_arrays = True
+
+
+def measure(name: str, function: typing.Callable[[], typing.Any]) -> None:
+    elapsed = min(timeit.repeat(function, number=NUMBER, repeat=3)) / NUMBER
+    print(f"{name:<40} {elapsed * 1000:>8.2f} ms")
+
+
+def main() -> None:
+    counts = [random.randint(-(2**40), 2**40) for _ in range(ITEMS)]
+    values = [random.random() for _ in range(ITEMS)]
+    small_values = list(array.array("f", values))
+
+    lists = Measurements(counts=counts, values=values, small_values=small_values)
+    typed = Measurements(
+        counts=array.array("q", counts), values=array.array("d", values), small_values=array.array("f", small_values)
+    )
+    data = lists.serialize()
+
+    measure("serialize lists", lists.serialize)
+    measure("serialize typed arrays", typed.serialize)
+    measure("deserialize into lists", lambda: Measurements.deserialize(data))
+    measure("deserialize into typed arrays", lambda: TypedMeasurements.deserialize(data))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
 from .field_utils import *  # noqa: 401
+from .model_generator.builder import ModelBuilder  # noqa: 401
+from .model_generator.directory import DirectoryModelGenerator  # noqa: 401
 from .model_generator.generator import BaseClassEnum, ModelGenerator  # noqa: 401
 from .schema_generator import AvroModel  # noqa: 401
 from .types import *  # noqa: 401
@@ -1,16 +1,56 @@
-from typing import Any, Dict, Type, TypeVar
+import datetime
+import decimal
+import enum
+import inspect
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
 
 from fastavro.validation import validate
 
 from .schema_generator import AvroModel, JsonDict
+from .types import Decimal
+from .utils import SchemaMetadata
 
 try:
-    from pydantic import BaseModel  # pragma: no cover
+    from pydantic import BaseModel, ValidationError  # pragma: no cover
+    from pydantic.fields import SHAPE_DICT, SHAPE_LIST, SHAPE_MAPPING, SHAPE_SINGLETON, ModelField  # pragma: no cover
 except ImportError as ex:  # pragma: no cover
     raise Exception("pydantic must be installed in order to use AvroBaseModel") from ex  # pragma: no cover
 
 CT = TypeVar("CT", bound="AvroBaseModel")
 
+# Types that fastavro already decodes to the python value of the field, so they are used as they are
+TRUSTED_TYPES = (
+    str,
+    int,
+    float,
+    bool,
+    bytes,
+    datetime.date,
+    datetime.time,
+    datetime.datetime,
+    uuid.UUID,
+    type(None),
+)
+
+Converter = Callable[[Any], Any]
+
+
+def to_python(value: Any) -> Any:
+    """
+    Convert a value into its python representation, the same result
+    that `dict` followed by `standardize_custom_type` produce
+    """
+    if isinstance(value, AvroBaseModel):
+        return value.asdict()
+    elif isinstance(value, BaseModel):
+        return to_python(value.dict())
+    elif isinstance(value, dict):
+        return {key: to_python(item) for key, item in value.items()}
+    elif isinstance(value, (list, tuple)):
+        return [to_python(item) for item in value]
+    return AvroModel.standardize_custom_type(value)
+
 
 class AvroBaseModel(BaseModel, AvroModel):  # type: ignore
     @classmethod
@@ -19,8 +59,15 @@ class AvroBaseModel(BaseModel, AvroModel):  # type: ignore
 
     def asdict(self) -> JsonDict:
         """
-        Document this. asdict vs dict
+        Returns the python representation of the instance: nested models are converted
+        to dicts and enums, decimals and fixed to their values.
+
+        With `trusted = True` in `class Meta` a plan precomputed from the fields is used
+        instead of `dict` followed by `standardize_custom_type` over all the values.
         """
+        if self._is_trusted():
+            return self.get_asdict_plan()(self)
+
         data = self.dict()
 
         # te standardize called can be replaced if we have a custom implementation of asdict
@@ -38,6 +85,159 @@ class AvroBaseModel(BaseModel, AvroModel):  # type: ignore
     def parse_obj(cls: Type["AvroBaseModel"], data: Dict) -> "AvroBaseModel":
         return super().parse_obj(data)
 
+    @classmethod
+    def _create_instance(cls: Type[CT], data: Dict) -> CT:
+        """
+        Create an instance from a decoded payload. The payload was already validated
+        with the avro schema, so trusted models skip the pydantic validation.
+        """
+        if cls._is_trusted():
+            return cls.get_construct_plan()(data)
+        return cls.parse_obj(data)  # type: ignore
+
+    @classmethod
+    def warmup(cls: Type[CT]) -> None:
+        super().warmup()
+
+        if cls._is_trusted():
+            cls.get_construct_plan()
+            cls.get_asdict_plan()
+
+    @classmethod
+    def _is_trusted(cls: Type[CT]) -> bool:
+        class_cache = cls._get_class_cache()
+
+        if "trusted" not in class_cache:
+            class_cache["trusted"] = SchemaMetadata.create(getattr(cls, "Meta", type)).trusted
+        return class_cache["trusted"]
+
+    @classmethod
+    def get_construct_plan(cls: Type[CT]) -> Callable[[Dict], CT]:
+        """
+        Returns a function that creates an instance from a decoded payload using `construct`,
+        the pydantic constructor without validation.
+
+        Nested models and enums are created according to the type of each field, which is
+        inspected only once. Fields with types that can not be created directly,
+        for example unions of records, are validated by pydantic. The plan is cached per class.
+        """
+        class_cache = cls._get_class_cache()
+
+        if "construct_plan" not in class_cache:
+            converters = []
+            for model_field in cls.__fields__.values():
+                converter = cls._get_construct_converter(model_field)
+                if converter is not None:
+                    converters.append((model_field.name, converter))
+
+            def plan(data: Dict) -> CT:
+                for name, converter in converters:
+                    value = data.get(name)
+                    if value is not None:
+                        data[name] = converter(value)
+                return cls.construct(**data)
+
+            class_cache["construct_plan"] = plan
+        return class_cache["construct_plan"]
+
+    @classmethod
+    def _get_construct_converter(cls: Type[CT], model_field: ModelField) -> Optional[Converter]:
+        python_type = model_field.type_
+        item_converter: Optional[Converter]
+
+        if not inspect.isclass(python_type):
+            # for example unions, the whole value is validated by pydantic
+            return cls._get_validator(model_field)
+        elif issubclass(python_type, AvroBaseModel):
+            # the plan of the nested model is taken on the first use, so self relationships work
+            record_type = python_type
+
+            def item_converter(value: Any) -> Any:
+                return record_type.get_construct_plan()(value) if isinstance(value, dict) else value
+
+        elif issubclass(python_type, enum.Enum):
+            enum_type = python_type
+
+            def item_converter(value: Any) -> Any:
+                return value if isinstance(value, enum_type) else enum_type(value)
+
+        elif python_type in TRUSTED_TYPES or python_type is decimal.Decimal:
+            item_converter = None
+        else:
+            return cls._get_validator(model_field)
+
+        return cls._get_shape_converter(model_field, item_converter)
+
+    @classmethod
+    def _get_validator(cls: Type[CT], model_field: ModelField) -> Converter:
+        def validator(value: Any) -> Any:
+            value, errors = model_field.validate(value, {}, loc=model_field.alias, cls=cls)  # type: ignore
+            if errors:
+                raise ValidationError([errors], cls)  # type: ignore
+            return value
+
+        return validator
+
+    @classmethod
+    def _get_shape_converter(
+        cls: Type[CT], model_field: ModelField, item_converter: Optional[Converter]
+    ) -> Optional[Converter]:
+        if model_field.shape == SHAPE_SINGLETON:
+            return item_converter
+        elif item_converter is None and model_field.shape in (SHAPE_LIST, SHAPE_DICT, SHAPE_MAPPING):
+            return None
+        elif model_field.shape == SHAPE_LIST:
+            return lambda values: [item_converter(value) for value in values]  # type: ignore
+        elif model_field.shape in (SHAPE_DICT, SHAPE_MAPPING):
+            return lambda values: {key: item_converter(value) for key, value in values.items()}  # type: ignore
+
+        # tuples, sets and other shapes are validated by pydantic
+        return cls._get_validator(model_field)
+
+    @classmethod
+    def get_asdict_plan(cls: Type[CT]) -> Callable[["AvroBaseModel"], JsonDict]:
+        """
+        Returns a function that converts an instance into its python representation,
+        the same result of `asdict`. The converter of each field is chosen only once,
+        according to its type. The plan is cached per class.
+        """
+        class_cache = cls._get_class_cache()
+
+        if "asdict_plan" not in class_cache:
+            converters: List[Tuple[str, Optional[Converter]]] = [
+                (model_field.name, cls._get_asdict_converter(model_field)) for model_field in cls.__fields__.values()
+            ]
+
+            def plan(instance: "AvroBaseModel") -> JsonDict:
+                values = instance.__dict__
+                data = {}
+
+                for name, converter in converters:
+                    value = values[name]
+                    data[name] = value if value is None or converter is None else converter(value)
+                return data
+
+            class_cache["asdict_plan"] = plan
+        return class_cache["asdict_plan"]
+
+    @staticmethod
+    def _get_asdict_converter(model_field: ModelField) -> Optional[Converter]:
+        python_type = model_field.type_
+
+        if model_field.shape == SHAPE_SINGLETON and inspect.isclass(python_type):
+            if issubclass(python_type, AvroBaseModel):
+                return lambda value: value.asdict() if isinstance(value, AvroBaseModel) else to_python(value)
+            elif issubclass(python_type, enum.Enum):
+                return lambda value: value.value if isinstance(value, enum.Enum) else value
+            elif python_type in TRUSTED_TYPES:
+                return None
+            elif python_type is decimal.Decimal:
+                # decimal fields can keep the types.Decimal default
+                return lambda value: value.default if isinstance(value, Decimal) else value
+
+        # containers are always copied and the rest of values converted one by one
+        return to_python
+
     @classmethod
     def fake(cls: Type[CT], **data: Dict[str, Any]) -> "AvroBaseModel":
         """
@@ -2,7 +2,7 @@ import typing
 
 import stringcase
 
-from .field_utils import ENUM
+from .field_utils import ARRAY, ENUM, MAP, RECORD
 
 # Summary from https://github.com/okunishinishi/python-stringcase
 # stringcase.camelcase('foo_bar_baz') # => "fooBarBaz"
@@ -70,10 +70,150 @@ def case_record(avro_schema_dict: typing.Dict, case_type: str) -> typing.Dict:
         for field in fields:
             new_field = case_item(field, case_type)
             new_fields.append(new_field)
-        avro_schema_dict["fields"] = new_fields
-        return avro_schema_dict
+        # return a new dict so the original schema is never modified
+        return {**avro_schema_dict, "fields": new_fields}
     elif avro_schema_dict["type"] == ENUM:
         # enums should not be case, like records
         return avro_schema_dict
     else:
         return case_item(avro_schema_dict, case_type)
+
+
+Renamer = typing.Callable[[typing.Any], typing.Any]
+
+
+class FieldsMapping:
+    """
+    Precomputed mapping between the field names of two schemas with the same structure,
+    for example a schema and one of its case variants.
+
+    Calling the instance with a python dict that follows the source schema returns a new dict
+    with the field names of the target schema. Nested records, arrays, maps and unions are
+    renamed as well. The case functions are never called when a value is renamed.
+    """
+
+    def __init__(self, source_schema: typing.Dict, target_schema: typing.Dict) -> None:
+        # renamers and field names of the named records by name and fullname
+        self.named_renamers: typing.Dict[str, typing.Optional[Renamer]] = {}
+        self.named_field_names: typing.Dict[str, typing.Set[str]] = {}
+        self.renamer, _ = self.build_renamer(source_schema, target_schema)
+
+    def __call__(self, value: typing.Dict) -> typing.Dict:
+        if self.renamer is None:
+            return value
+        return self.renamer(value)
+
+    def build_renamer(
+        self, source: typing.Any, target: typing.Any, namespace: typing.Optional[str] = None
+    ) -> typing.Tuple[typing.Optional[Renamer], typing.Optional[typing.Set[str]]]:
+        """
+        Returns the function that renames a value of the source type into the target type,
+        or None if the value does not need it, and the field names in case of records
+        """
+        if isinstance(source, str):
+            name = f"{namespace}.{source}" if f"{namespace}.{source}" in self.named_renamers else source
+
+            if name not in self.named_renamers:
+                # primitive types, enums and fixed do not need renaming
+                return None, None
+
+            # the renamer is looked up when it is used because the record could be a self reference
+            def named_renamer(value: typing.Any) -> typing.Any:
+                renamer = self.named_renamers[name]
+                return value if renamer is None else renamer(value)
+
+            return named_renamer, self.named_field_names[name]
+        elif isinstance(source, list):
+            return self.build_union_renamer(source, target, namespace), None
+        elif isinstance(source, dict):
+            avro_type = source["type"]
+
+            if avro_type == RECORD:
+                return self.build_record_renamer(source, target, namespace)
+            elif avro_type == ARRAY:
+                items_renamer, _ = self.build_renamer(source["items"], target["items"], namespace)
+
+                if items_renamer is not None:
+                    return (lambda value: [None if item is None else items_renamer(item) for item in value]), None
+            elif avro_type == MAP:
+                values_renamer, _ = self.build_renamer(source["values"], target["values"], namespace)
+
+                if values_renamer is not None:
+                    return (
+                        lambda value: {
+                            key: None if item is None else values_renamer(item) for key, item in value.items()
+                        }
+                    ), None
+            elif isinstance(avro_type, (dict, list)):
+                return self.build_renamer(avro_type, target["type"], namespace)
+
+        return None, None
+
+    def build_record_renamer(
+        self, source: typing.Dict, target: typing.Dict, namespace: typing.Optional[str]
+    ) -> typing.Tuple[Renamer, typing.Set[str]]:
+        namespace = source.get("namespace", namespace)
+        names = [source["name"]]
+        if namespace:
+            names.append(f"{namespace}.{source['name']}")
+
+        field_names = {field["name"] for field in source["fields"]}
+        for name in names:
+            self.named_renamers[name] = None
+            self.named_field_names[name] = field_names
+
+        fields = []
+        for source_field, target_field in zip(source["fields"], target["fields"]):
+            field_renamer, _ = self.build_renamer(source_field["type"], target_field["type"], namespace)
+            fields.append((source_field["name"], target_field["name"], field_renamer))
+
+        def renamer(value: typing.Dict) -> typing.Dict:
+            return {
+                target_name: value[source_name]
+                if field_renamer is None or value[source_name] is None
+                else field_renamer(value[source_name])
+                for source_name, target_name, field_renamer in fields
+            }
+
+        for name in names:
+            self.named_renamers[name] = renamer
+
+        return renamer, field_names
+
+    def build_union_renamer(
+        self, source: typing.List, target: typing.List, namespace: typing.Optional[str]
+    ) -> typing.Optional[Renamer]:
+        record_branches = []
+        array_renamer = None
+        map_renamer = None
+
+        for source_branch, target_branch in zip(source, target):
+            branch_renamer, field_names = self.build_renamer(source_branch, target_branch, namespace)
+
+            if branch_renamer is None:
+                continue
+            elif field_names is not None:
+                record_branches.append((field_names, branch_renamer))
+            elif source_branch["type"] == ARRAY:
+                array_renamer = branch_renamer
+            else:
+                map_renamer = branch_renamer
+
+        if not record_branches and array_renamer is None and map_renamer is None:
+            return None
+
+        def renamer(value: typing.Any) -> typing.Any:
+            if isinstance(value, dict):
+                # the value belongs to the record that has the same fields
+                value_fields = set(value)
+                for field_names, record_renamer in record_branches:
+                    if field_names == value_fields:
+                        return record_renamer(value)
+
+                if map_renamer is not None:
+                    return map_renamer(value)
+            elif isinstance(value, list) and array_renamer is not None:
+                return array_renamer(value)
+            return value
+
+        return renamer
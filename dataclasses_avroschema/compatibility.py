@@ -0,0 +1,127 @@
+import json
+import typing
+
+from . import schema_ir, serialization
+from .schema_ir import Node
+
+BACKWARD = "backward"
+FORWARD = "forward"
+FULL = "full"
+COMPATIBILITY_MODES = (BACKWARD, FORWARD, FULL)
+
+# primitive types that a reader can use to read data of the writer type, as the avro schema resolution defines
+PROMOTIONS = {
+    "int": ("long", "float", "double"),
+    "long": ("float", "double"),
+    "float": ("double",),
+    "string": ("bytes",),
+    "bytes": ("string",),
+}
+
+
+def is_compatible(new: schema_ir.RecordNode, old: schema_ir.RecordNode, mode: str = BACKWARD) -> bool:
+    """
+    Whether the schema new is compatible with the schema old, according to the avro schema resolution rules:
+
+        * backward: data written with old can be read with new
+        * forward: data written with new can be read with old
+        * full: backward and forward
+    """
+    if mode not in COMPATIBILITY_MODES:
+        raise ValueError(f"Invalid compatibility mode {mode}. Expected one of {COMPATIBILITY_MODES}")
+
+    if mode in (BACKWARD, FULL) and not can_read(new, old):
+        return False
+    if mode in (FORWARD, FULL) and not can_read(old, new):
+        return False
+    return True
+
+
+def can_read(reader: Node, writer: Node) -> bool:
+    """
+    Whether data written with the writer schema can be read with the reader schema
+    """
+    return _Resolver(reader, writer).can_read(reader, writer)
+
+
+def _get_property(node: typing.Any, name: str, default: typing.Any = None) -> typing.Any:
+    for key, value in node.properties:
+        if key == name:
+            return json.loads(value)
+    return default
+
+
+def _has_property(node: typing.Any, name: str) -> bool:
+    return any(key == name for key, _ in node.properties)
+
+
+class _Resolver:
+    def __init__(self, reader: Node, writer: Node) -> None:
+        self.reader_types = schema_ir.get_named_types(reader)
+        self.writer_types = schema_ir.get_named_types(writer)
+
+        # results of the named types already compared. A pair that is being compared
+        # is considered compatible, so recursive types end
+        self.results: typing.Dict[typing.Tuple[str, str], bool] = {}
+
+    def can_read(self, reader: Node, writer: Node) -> bool:
+        if isinstance(reader, schema_ir.ReferenceNode):
+            reader = self.reader_types[reader.fullname]
+        if isinstance(writer, schema_ir.ReferenceNode):
+            writer = self.writer_types[writer.fullname]
+
+        if isinstance(writer, schema_ir.UnionNode):
+            # any branch of the writer can be in the data
+            return all(self.can_read(reader, writer_type) for writer_type in writer.types)
+        elif isinstance(reader, schema_ir.UnionNode):
+            return any(self.can_read(reader_type, writer) for reader_type in reader.types)
+        elif isinstance(reader, schema_ir.PrimitiveNode):
+            return isinstance(writer, schema_ir.PrimitiveNode) and (
+                reader.type == writer.type or reader.type in PROMOTIONS.get(writer.type, ())
+            )
+        elif isinstance(reader, schema_ir.ArrayNode):
+            return isinstance(writer, schema_ir.ArrayNode) and self.can_read(reader.items, writer.items)
+        elif isinstance(reader, schema_ir.MapNode):
+            return isinstance(writer, schema_ir.MapNode) and self.can_read(reader.values, writer.values)
+        elif type(reader) is not type(writer) or not self.names_match(reader, writer):  # type: ignore
+            return False
+
+        key = (reader.fullname, writer.fullname)  # type: ignore
+        if key not in self.results:
+            self.results[key] = True
+            self.results[key] = self.can_read_named_type(reader, writer)
+        return self.results[key]
+
+    def can_read_named_type(self, reader: typing.Any, writer: typing.Any) -> bool:
+        if isinstance(reader, schema_ir.FixedNode):
+            return reader.size == writer.size
+        elif isinstance(reader, schema_ir.EnumNode):
+            return _has_property(reader, "default") or set(writer.symbols) <= set(reader.symbols)
+        return self.can_read_record(reader, writer)
+
+    def can_read_record(self, reader: schema_ir.RecordNode, writer: schema_ir.RecordNode) -> bool:
+        writer_fields = {field.name: field for field in writer.fields}
+
+        for reader_field in reader.fields:
+            names = [reader_field.name] + _get_property(reader_field, "aliases", [])
+            writer_field = next((writer_fields[name] for name in names if name in writer_fields), None)
+
+            if writer_field is None:
+                # the value is not in the data, so the reader must have a default
+                if not _has_property(reader_field, "default"):
+                    return False
+            elif not self.can_read(reader_field.type, writer_field.type):
+                return False
+
+        # the fields of the writer that are not in the reader are skipped
+        return True
+
+    @staticmethod
+    def names_match(reader: typing.Any, writer: typing.Any) -> bool:
+        if reader.fullname == writer.fullname or reader.fullname.rsplit(".", 1)[-1] == writer.name.rsplit(".", 1)[-1]:
+            return True
+
+        # the aliases of the reader are resolved with its namespace
+        namespace = reader.fullname.rsplit(".", 1)[0] if "." in reader.fullname else None
+        aliases = _get_property(reader, "aliases", [])
+        return writer.fullname in {serialization._get_fullname(alias, namespace) for alias in aliases}
@@ -0,0 +1,391 @@
+import bisect
+import collections
+import json
+import mmap
+import os
+import typing
+from concurrent import futures
+
+import fastavro
+from fastavro.read import BLOCK_READERS, HEADER_SCHEMA, MAGIC, SYNC_SIZE
+
+from . import schema_ir
+from .schema_generator import AvroModel
+from .types import BytesLike, JsonDict
+
+# version of the format of the persisted block indexes
+INDEX_VERSION = 1
+
+PARSED_HEADER_SCHEMA = fastavro.parse_schema(HEADER_SCHEMA)
+
+# state of the worker processes of read_container_parallel, set once when each process starts.
+# Each process has its own, the blocks decoded in the current process use a local state
+_worker: typing.Dict[str, typing.Any] = {}
+
+
+class BlockIndex(typing.NamedTuple):
+    """
+    Position of the blocks of a container file
+
+    Attributes:
+        offsets: offset in the file where each block starts (its records count)
+        counts: amount of records of each block
+        starts: index of the first record of each block
+    """
+
+    offsets: typing.List[int]
+    counts: typing.List[int]
+    starts: typing.List[int]
+
+    @classmethod
+    def create(cls, offsets: typing.List[int], counts: typing.List[int]) -> "BlockIndex":
+        starts = []
+        total = 0
+        for count in counts:
+            starts.append(total)
+            total += count
+        return cls(offsets, counts, starts)
+
+    @property
+    def records_count(self) -> int:
+        return self.starts[-1] + self.counts[-1] if self.counts else 0
+
+
+def read_long(data: typing.Union[BytesLike, mmap.mmap], position: int) -> typing.Tuple[int, int]:
+    """
+    Returns the avro long (zig-zag and variable-length encoded) that starts at position
+    and the position where it ends
+    """
+    byte = data[position]
+    value = byte & 0x7F
+    shift = 7
+    position += 1
+
+    while byte & 0x80:
+        byte = data[position]
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        position += 1
+
+    return (value >> 1) ^ -(value & 1), position
+
+
+def decode_block(
+    buffer: mmap.mmap,
+    offset: int,
+    codec: str,
+    model: typing.Type[AvroModel],
+    writer_schema: typing.Optional[JsonDict],
+    create_instance: bool,
+) -> typing.List[typing.Any]:
+    """
+    Returns the records of the block that starts at offset
+    """
+    _, size_offset = read_long(buffer, offset)
+    buffer.seek(size_offset)
+    data = BLOCK_READERS[codec](buffer).getvalue()
+
+    return model.deserialize_many(data, writer_schema=writer_schema, create_instance=create_instance)
+
+
+class ContainerReader:
+    """
+    Random access reader of avro container (object container) files.
+
+    The file is memory-mapped and an index with the offset and the records count of
+    each block is built by jumping from block to block, without decoding them.
+    `reader[i]` and `reader.blocks(start, stop)` decode only the blocks that contain
+    the requested records, into instances of the model (or python dicts).
+
+    The index can be persisted in `index_path`: it is loaded when it belongs to the file
+    (same size and sync marker) and created again otherwise.
+
+    A reader is not thread-safe, use a reader per thread.
+
+    Attributes:
+        path: the container file
+        model: AvroModel (or AvroBaseModel) of the records
+        index_path: optional file to persist the block index
+        create_instance: whether to return instances of the model or python dicts
+    """
+
+    def __init__(
+        self,
+        path: typing.Union[str, os.PathLike],
+        model: typing.Type[AvroModel],
+        index_path: typing.Optional[typing.Union[str, os.PathLike]] = None,
+        create_instance: bool = True,
+    ) -> None:
+        self.path = path
+        self.model = model
+        self.create_instance = create_instance
+
+        with open(path, "rb") as fileobj:
+            self.buffer = mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self.buffer[: len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not an avro container file")
+
+        header: typing.Any = fastavro.schemaless_reader(self.buffer, PARSED_HEADER_SCHEMA)  # type: ignore
+
+        self.header_end = self.buffer.tell()
+        self.sync_marker: bytes = header["sync"]
+        self.metadata: typing.Dict[str, bytes] = header["meta"]
+        self.codec = self.metadata.get("avro.codec", b"null").decode()
+        self.writer_schema: JsonDict = json.loads(self.metadata["avro.schema"])
+
+        if self.codec not in BLOCK_READERS:
+            self.close()
+            raise ValueError(f"Unsupported codec {self.codec}")
+
+        # the data can be read with the model schema when the schemas have the same canonical form
+        if schema_ir.fingerprint(schema_ir.build(self.writer_schema)) == model.get_fingerprint():
+            self.model_writer_schema: typing.Optional[JsonDict] = None
+        else:
+            self.model_writer_schema = self.writer_schema
+
+        index = self.load_index(index_path) if index_path is not None else None
+        if index is None:
+            index = self.create_index()
+            if index_path is not None:
+                self.save_index(index_path, index)
+        self.index = index
+
+        # the last decoded block, so consecutive records do not decode it again
+        self.cached_block: typing.Tuple[int, typing.List[typing.Any]] = (-1, [])
+
+    def __enter__(self) -> "ContainerReader":
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.buffer.close()
+
+    def __len__(self) -> int:
+        return self.index.records_count
+
+    @property
+    def blocks_count(self) -> int:
+        return len(self.index.offsets)
+
+    def __getitem__(self, position: int) -> typing.Any:
+        records_count = len(self)
+        if position < 0:
+            position += records_count
+        if not 0 <= position < records_count:
+            raise IndexError("record index out of range")
+
+        block = bisect.bisect_right(self.index.starts, position) - 1
+        return self.read_block(block)[position - self.index.starts[block]]
+
+    def __iter__(self) -> typing.Iterator[typing.Any]:
+        for records in self.blocks():
+            yield from records
+
+    def blocks(self, start: int = 0, stop: typing.Optional[int] = None) -> typing.Iterator[typing.List[typing.Any]]:
+        """
+        Yields the records of each block from start (included) to stop (excluded)
+        """
+        for block in range(*slice(start, stop).indices(self.blocks_count)):
+            yield self.read_block(block)
+
+    def read_block(self, block: int) -> typing.List[typing.Any]:
+        """
+        Returns the records of the block
+        """
+        cached_block, records = self.cached_block
+        if cached_block == block:
+            return records
+
+        records = decode_block(
+            self.buffer,
+            self.index.offsets[block],
+            self.codec,
+            self.model,
+            self.model_writer_schema,
+            self.create_instance,
+        )
+        self.cached_block = (block, records)
+        return records
+
+    def create_index(self) -> BlockIndex:
+        buffer = self.buffer
+        position = self.header_end
+        offsets = []
+        counts = []
+
+        while position < len(buffer):
+            offsets.append(position)
+            count, position = read_long(buffer, position)
+            size, position = read_long(buffer, position)
+            position += size
+
+            if buffer[position : position + SYNC_SIZE] != self.sync_marker:
+                raise ValueError(f"Invalid sync marker at position {position} of {self.path}")
+
+            counts.append(count)
+            position += SYNC_SIZE
+
+        return BlockIndex.create(offsets, counts)
+
+    def load_index(self, index_path: typing.Union[str, os.PathLike]) -> typing.Optional[BlockIndex]:
+        try:
+            with open(index_path) as fileobj:
+                data = json.load(fileobj)
+        except (OSError, ValueError):
+            return None
+
+        if (
+            data.get("version") != INDEX_VERSION
+            or data.get("size") != len(self.buffer)
+            or data.get("sync") != self.sync_marker.hex()
+        ):
+            return None
+        return BlockIndex.create(data["offsets"], data["counts"])
+
+    def save_index(self, index_path: typing.Union[str, os.PathLike], index: BlockIndex) -> None:
+        data = {
+            "version": INDEX_VERSION,
+            "size": len(self.buffer),
+            "sync": self.sync_marker.hex(),
+            "offsets": index.offsets,
+            "counts": index.counts,
+        }
+        with open(index_path, "w") as fileobj:
+            json.dump(data, fileobj)
+
+
+def read_container_parallel(
+    path: typing.Union[str, os.PathLike],
+    model: typing.Type[AvroModel],
+    workers: typing.Optional[int] = None,
+    ordered: bool = True,
+    create_instance: bool = True,
+    columns: bool = False,
+    blocks_per_task: int = 4,
+    index_path: typing.Optional[typing.Union[str, os.PathLike]] = None,
+) -> typing.Iterator[typing.Any]:
+    """
+    Decodes the blocks of a container file in worker processes.
+
+    The file is split at the sync markers, so each task is a group of `blocks_per_task` blocks.
+    The model and the writer schema are sent once to each worker, the tasks only contain
+    the offsets of the blocks and each worker reads them from its own memory map of the file.
+
+    Arguments:
+        path: the container file
+        model: AvroModel (or AvroBaseModel) of the records. It must be importable by the workers
+        workers: number of processes. With 1 the blocks are decoded in the current process
+        ordered: yield the records in the order of the file. Otherwise they are yielded
+            as soon as their task is decoded
+        create_instance: whether to yield instances of the model or python dicts
+        columns: yield a batch per task, a dict with the values of each field
+            ({"name": ["john", ...], "age": [20, ...]}) instead of the records
+        blocks_per_task: amount of blocks decoded by each task
+        index_path: optional file to persist the block index, as in `ContainerReader`
+    """
+    with ContainerReader(path, model, index_path=index_path) as reader:
+        offsets = reader.index.offsets
+        codec = reader.codec
+        writer_schema = reader.model_writer_schema
+
+    tasks = [offsets[start : start + blocks_per_task] for start in range(0, len(offsets), blocks_per_task)]
+    field_names = [field["name"] for field in model.avro_schema_to_python()["fields"]] if columns else None
+    initargs = (path, model, codec, writer_schema, create_instance and not columns, field_names)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(tasks) <= 1:
+        # a local state, so generators consumed at the same time do not share it
+        state = _create_state(*initargs)
+        try:
+            for task in tasks:
+                yield from _yield_result(_decode_blocks(task, state), columns)
+        finally:
+            state["buffer"].close()
+        return
+
+    with futures.ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as executor:
+        # only some tasks are submitted in advance, so the decoded records of a big file are not all in memory
+        max_pending = 2 * workers
+        pending_tasks = iter(tasks)
+        pending: typing.Deque[futures.Future] = collections.deque()
+
+        def submit() -> None:
+            task = next(pending_tasks, None)
+            if task is not None:
+                pending.append(executor.submit(_decode_blocks, task))
+
+        for _ in range(max_pending):
+            submit()
+
+        while pending:
+            if ordered:
+                future = pending.popleft()
+            else:
+                done, _ = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+                future = done.pop()
+                pending.remove(future)
+
+            submit()
+            yield from _yield_result(future.result(), columns)
+
+
+def _yield_result(result: typing.Any, columns: bool) -> typing.Iterator[typing.Any]:
+    if columns:
+        yield result
+    else:
+        yield from result
+
+
+def _create_state(
+    path: typing.Union[str, os.PathLike],
+    model: typing.Type[AvroModel],
+    codec: str,
+    writer_schema: typing.Optional[JsonDict],
+    create_instance: bool,
+    field_names: typing.Optional[typing.List[str]],
+) -> typing.Dict[str, typing.Any]:
+    with open(path, "rb") as fileobj:
+        buffer = mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+
+    return {
+        "buffer": buffer,
+        "model": model,
+        "codec": codec,
+        "writer_schema": writer_schema,
+        "create_instance": create_instance,
+        "field_names": field_names,
+    }
+
+
+def _init_worker(*args: typing.Any) -> None:
+    _worker.update(_create_state(*args))
+
+
+def _decode_blocks(
+    offsets: typing.List[int], state: typing.Optional[typing.Dict[str, typing.Any]] = None
+) -> typing.Any:
+    """
+    Decode the blocks at offsets with the state of the worker process, or the given one
+    """
+    state = _worker if state is None else state
+    records = []
+    for offset in offsets:
+        records.extend(
+            decode_block(
+                state["buffer"],
+                offset,
+                state["codec"],
+                state["model"],
+                state["writer_schema"],
+                state["create_instance"],
+            )
+        )
+
+    field_names = state["field_names"]
+    if field_names is None:
+        return records
+    return {name: [record[name] for record in records] for name in field_names}
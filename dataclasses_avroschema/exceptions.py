@@ -28,3 +28,17 @@ class InvalidMap(Exception):
 
     def __str__(self) -> str:
         return f"Invalid map on field {self.field_name}. Keys must be string not {self.key_type}"
+
+
+class DecodeLimitExceeded(Exception):
+    def __init__(self, limit: str, value: int, maximum: int) -> None:
+        self.limit = limit
+        self.value = value
+        self.maximum = maximum
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return f"{class_name} {self.limit}"
+
+    def __str__(self) -> str:
+        return f"The payload exceeds the decode limit {self.limit}: {self.value} is greater than {self.maximum}"
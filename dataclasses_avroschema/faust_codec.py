@@ -0,0 +1,90 @@
+import typing
+
+from . import serialization
+from .schema_generator import AVRO, AvroModel
+from .utils import is_faust_model
+
+try:
+    from faust.serializers import codecs  # pragma: no cover
+except ImportError as ex:  # pragma: no cover
+    raise Exception("faust must be installed in order to use AvroCodec") from ex  # pragma: no cover
+
+# key added by faust to the representation of the records
+FAUST_METADATA_KEY = "__faust"
+
+
+def to_payload(value: typing.Any) -> typing.Any:
+    """
+    Convert a value into data that fastavro can encode. The faust records keep nested records
+    and enums in `asdict` and in their representation, so they are converted recursively.
+    """
+    if isinstance(value, AvroModel):
+        return to_payload(value.asdict()) if is_faust_model(type(value)) else value.asdict()
+    elif isinstance(value, dict):
+        return {key: to_payload(item) for key, item in value.items() if key != FAUST_METADATA_KEY}
+    elif isinstance(value, (list, tuple)):
+        return [to_payload(item) for item in value]
+    return AvroModel.standardize_custom_type(value)
+
+
+class AvroCodec(codecs.Codec):
+    """
+    faust codec that encodes and decodes the records of a model with its avro schema.
+
+    The schema is parsed only once per model (`AvroModel.get_parsed_schema`),
+    and the decoded values are instances of the model.
+
+    Attributes:
+        model: AvroModel (or AvroBaseModel) of the values
+        serialization_type: `avro` or `avro-json`
+        many: whether each value is a list of records, encoded as `serialize_many` does
+    """
+
+    def __init__(
+        self,
+        model: typing.Type[AvroModel],
+        serialization_type: str = AVRO,
+        many: bool = False,
+        **kwargs: typing.Any,
+    ) -> None:
+        # faust clones codecs (for example when they are chained) with the same keyword arguments
+        super().__init__(model=model, serialization_type=serialization_type, many=many, **kwargs)
+        self.model = model
+        self.serialization_type = serialization_type
+        self.many = many
+
+    def _dumps(self, obj: typing.Any) -> bytes:
+        schema = self.model.get_parsed_schema()
+
+        if self.many:
+            return serialization.serialize_many(
+                (to_payload(record) for record in obj), schema, serialization_type=self.serialization_type
+            )
+        return serialization.serialize(to_payload(obj), schema, serialization_type=self.serialization_type)
+
+    def _loads(self, s: bytes) -> typing.Any:
+        schema = self.model.get_parsed_schema()
+        return_record_name = self.model._return_record_name(True, None, None)
+
+        if self.many:
+            payloads = serialization.deserialize_many(
+                s, schema, serialization_type=self.serialization_type, return_record_name=return_record_name
+            )
+            return [self.model._payload_to_output(payload) for payload in payloads]
+
+        payload = serialization.deserialize(
+            s, schema, serialization_type=self.serialization_type, return_record_name=return_record_name
+        )
+        return self.model._payload_to_output(payload)
+
+
+def register_codec(
+    name: str, model: typing.Type[AvroModel], serialization_type: str = AVRO, many: bool = False
+) -> AvroCodec:
+    """
+    Create an `AvroCodec` for the model and register it in faust with name,
+    so it can be used as `key_serializer` or `value_serializer` of topics.
+    """
+    codec = AvroCodec(model, serialization_type=serialization_type, many=many)
+    codecs.register(name, codec)
+    return codec
@@ -35,6 +35,30 @@ logger = logging.getLogger(__name__)
 fake = Faker()
 p = inflect.engine()
 
+# inflect is slow and the same names are rendered many times, so the singular names are cached
+SINGULAR_NAMES: typing.Dict[str, str] = {}
+
+JsonConverter = typing.Optional[typing.Callable[[typing.Any], typing.Any]]
+
+
+def to_json_value(value: typing.Any) -> typing.Any:
+    """
+    Convert a value into its json representation checking its type.
+
+    Used when the type of a value is not known in advance, for example in unions
+    """
+    if isinstance(value, schema_generator.AvroModel):
+        return value.get_json_plan()(value)
+    elif isinstance(value, enum.Enum):
+        return value.value
+    elif isinstance(value, (types.Decimal, types.Fixed)):
+        return to_json_value(value.default)
+    elif isinstance(value, dict):
+        return {key: to_json_value(item) for key, item in value.items()}
+    elif isinstance(value, (list, tuple)):
+        return [to_json_value(item) for item in value]
+    return serialization.serialize_value(value=value)
+
 
 @dataclasses.dataclass  # type: ignore
 class BaseField:
@@ -67,13 +91,15 @@ class BaseField:
 
     @staticmethod
     def get_singular_name(name: str) -> str:
+        if name in SINGULAR_NAMES:
+            return SINGULAR_NAMES[name]
+
         singular = p.singular_noun(name)
 
         # do the check because of mypy.
         # p.singular_noun returns Union[str, bool]
-        if isinstance(singular, str):
-            return singular
-        return name
+        SINGULAR_NAMES[name] = singular if isinstance(singular, str) else name
+        return SINGULAR_NAMES[name]
 
     def get_metadata(self) -> typing.List[typing.Tuple[str, str]]:
         meta_data_for_template = []
@@ -143,6 +169,13 @@ class BaseField:
     def fake(self) -> typing.Any:
         return None
 
+    def get_json_converter(self) -> JsonConverter:
+        """
+        Returns the function that converts a (not None) value of the field into its json representation.
+        None means that the value does not need any conversion.
+        """
+        return to_json_value
+
     def exist_type(self) -> int:
         # filter by the same field types
         same_types = [
@@ -162,6 +195,9 @@ class ImmutableField(BaseField):
             return [field_utils.NULL, self.avro_type]
         return self.avro_type
 
+    def get_json_converter(self) -> JsonConverter:
+        return None
+
 
 @dataclasses.dataclass
 class StringField(ImmutableField):
@@ -226,6 +262,9 @@ class BytesField(ImmutableField):
     def to_avro(item: bytes) -> str:
         return item.decode()
 
+    def get_json_converter(self) -> JsonConverter:
+        return self.to_avro
+
     def fake(self) -> bytes:
         return fake.pystr().encode()
 
@@ -302,6 +341,20 @@ class ListField(ContainerField):
 
         self.items_type = self.internal_field.get_avro_type()
 
+    def get_json_converter(self) -> JsonConverter:
+        items_field = AvroField(
+            self.name, self.type.__args__[0], model_metadata=self.model_metadata, parent=self.parent
+        )
+        items_converter = items_field.get_json_converter()
+
+        if items_converter is None:
+            return list
+
+        def converter(value: typing.Iterable) -> typing.List:
+            return [None if item is None else items_converter(item) for item in value]
+
+        return converter
+
     def fake(self) -> typing.List:
         return [self.internal_field.fake()]
 
@@ -351,6 +404,20 @@ class DictField(ContainerField):
         self.internal_field = AvroField(self.name, values_type, model_metadata=self.model_metadata, parent=self.parent)
         self.values_type = self.internal_field.get_avro_type()
 
+    def get_json_converter(self) -> JsonConverter:
+        values_field = AvroField(
+            self.name, self.type.__args__[1], model_metadata=self.model_metadata, parent=self.parent
+        )
+        values_converter = values_field.get_json_converter()
+
+        if values_converter is None:
+            return dict
+
+        def converter(value: typing.Mapping) -> JsonDict:
+            return {key: None if item is None else values_converter(item) for key, item in value.items()}
+
+        return converter
+
     def fake(self) -> typing.Dict[str, typing.Any]:
         # return a dict of one element with the items type specified
         return {fake.pystr(): self.internal_field.fake()}
@@ -433,7 +500,7 @@ class FixedField(BaseField):
     def get_avro_type(self) -> JsonDict:
         avro_type = {
             "type": field_utils.FIXED,
-            "name": self.get_singular_name(self.name),
+            "name": self.default.name or self.get_singular_name(self.name),
             "size": int(self.default.size),
         }
 
@@ -498,6 +565,9 @@ class EnumField(BaseField):
             ), f"The default value should be one of {self.get_symbols()}. Current is {self.default}"
             return self.default.value
 
+    def get_json_converter(self) -> JsonConverter:
+        return lambda value: value.value if isinstance(value, enum.Enum) else value
+
     def fake(self) -> typing.Any:
         return random.choice(self.get_symbols())
 
@@ -565,6 +635,9 @@ class DateField(LogicalTypeField):
 
         return int(ts / (3600 * 24))
 
+    def get_json_converter(self) -> JsonConverter:
+        return serialization.date_to_str
+
     def fake(self) -> datetime.date:
         return fake.date_object()
 
@@ -605,6 +678,9 @@ class TimeMilliField(LogicalTypeField):
 
         return int((((hour * 60 + minutes) * 60 + seconds) * 1000) + (microseconds / 1000))
 
+    def get_json_converter(self) -> JsonConverter:
+        return serialization.time_to_str
+
     def fake(self) -> datetime.time:
         return fake.time_object()
 
@@ -645,6 +721,9 @@ class TimeMicroField(LogicalTypeField):
 
         return int((((hour * 60 + minutes) * 60 + seconds) * 1000000) + microseconds)
 
+    def get_json_converter(self) -> JsonConverter:
+        return serialization.time_to_str
+
     def fake(self) -> datetime.time:
         datetime_object: datetime.datetime = fake.date_time(tzinfo=utc)
         datetime_object = datetime_object + datetime.timedelta(microseconds=random.randint(0, 999))
@@ -685,6 +764,9 @@ class DatetimeField(LogicalTypeField):
 
         return int(ts * 1000)
 
+    def get_json_converter(self) -> JsonConverter:
+        return serialization.datetime_to_str
+
     def fake(self) -> datetime.datetime:
         return fake.date_time(tzinfo=utc)
 
@@ -723,6 +805,9 @@ class DatetimeMicroField(LogicalTypeField):
 
         return int(ts * 1000000)
 
+    def get_json_converter(self) -> JsonConverter:
+        return serialization.datetime_to_str
+
     def fake(self) -> datetime.datetime:
         datetime_object: datetime.datetime = fake.date_time(tzinfo=utc)
         return datetime_object + datetime.timedelta(microseconds=random.randint(0, 999))
@@ -744,6 +829,9 @@ class UUIDField(LogicalTypeField):
     def to_avro(uuid: uuid.UUID) -> str:
         return str(uuid)
 
+    def get_json_converter(self) -> JsonConverter:
+        return str
+
     def fake(self) -> uuid.UUID:
         return uuid.uuid4()
 
@@ -777,6 +865,9 @@ class RecordField(BaseField):
             return [field_utils.NULL, record_type]
         return record_type
 
+    def get_json_converter(self) -> JsonConverter:
+        return self.type.get_json_plan()
+
     def fake(self) -> typing.Any:
         return self.type.fake()
 
@@ -827,6 +918,13 @@ class DecimalField(BaseField):
             #
             # self.precision = decimal.Context().prec
 
+    @property
+    def codec(self) -> serialization.DecimalCodec:
+        """
+        Codec of the decimals of the field, shared by the fields with the same precision and scale
+        """
+        return serialization.get_decimal_codec(self.precision, self.scale)
+
     def get_avro_type(self) -> typing.Union[JsonDict, typing.List[typing.Union[str, JsonDict]]]:
         avro_type = {
             "type": field_utils.BYTES,
@@ -850,7 +948,10 @@ class DecimalField(BaseField):
         if default is None:
             return None
 
-        return serialization.decimal_to_str(default, self.precision, self.scale)
+        return self.codec.to_str(default)
+
+    def get_json_converter(self) -> JsonConverter:
+        return lambda value: str(value.default if isinstance(value, types.Decimal) else value)
 
     def fake(self) -> decimal.Decimal:
         return fake.pydecimal(right_digits=self.scale, left_digits=self.precision - self.scale)
@@ -0,0 +1,629 @@
+import array
+import datetime
+import decimal
+import enum
+import io
+import numbers
+import struct
+import sys
+import typing
+import uuid
+
+import fastavro
+from fastavro.read import LOGICAL_READERS
+from fastavro.write import LOGICAL_WRITERS
+
+from . import schema_ir, types, utils
+from .fields import DictField, EnumField, ListField, NoneField, RecordField, UnionField
+from .types import BytesLike, JsonDict
+
+# python types of the values of each logical type, used to choose the branch of unions
+LOGICAL_TYPES_VALUES = {
+    "decimal": decimal.Decimal,
+    "uuid": uuid.UUID,
+    "date": datetime.date,
+    "time-millis": datetime.time,
+    "time-micros": datetime.time,
+    "timestamp-millis": datetime.datetime,
+    "timestamp-micros": datetime.datetime,
+    "local-timestamp-millis": datetime.datetime,
+    "local-timestamp-micros": datetime.datetime,
+}
+
+INT_RANGE = (-(2**31), 2**31 - 1)
+LONG_RANGE = (-(2**63), 2**63 - 1)
+
+
+def _is_integer(value: typing.Any, value_range: typing.Tuple[int, int]) -> bool:
+    return (
+        isinstance(value, numbers.Integral)
+        and not isinstance(value, bool)
+        and value_range[0] <= value <= value_range[1]  # type: ignore
+    )
+
+
+# the values that match each primitive type in a union, the same rules that fastavro validates
+PRIMITIVE_VALUES: typing.Dict[str, typing.Callable[[typing.Any], bool]] = {
+    "null": lambda value: value is None,
+    "boolean": lambda value: isinstance(value, bool),
+    "int": lambda value: _is_integer(value, INT_RANGE),
+    "long": lambda value: _is_integer(value, LONG_RANGE),
+    "float": lambda value: isinstance(value, numbers.Real) and not isinstance(value, bool),
+    "double": lambda value: isinstance(value, numbers.Real) and not isinstance(value, bool),
+    "bytes": lambda value: isinstance(value, (bytes, bytearray)),
+    "string": lambda value: isinstance(value, str),
+}
+
+# array.array type codes of the numeric types, the arrays of numbers are encoded and decoded in bulk
+TYPECODES = {"int": "i", "long": "q", "float": "f", "double": "d"}
+
+# avro encodes float and double in little-endian
+BIG_ENDIAN = sys.byteorder == "big"
+
+
+class PrimitiveOp:
+    __slots__ = ("type", "schema", "logical_writer", "logical_reader")
+
+    def __init__(self, avro_type: str, schema: JsonDict) -> None:
+        self.type = avro_type
+        self.schema = schema
+
+        logical_type = f"{avro_type}-{schema.get('logicalType')}"
+        self.logical_writer = LOGICAL_WRITERS.get(logical_type)
+        self.logical_reader = LOGICAL_READERS.get(logical_type)
+
+
+class FixedOp(PrimitiveOp):
+    __slots__ = ("size",)
+
+    def __init__(self, size: int, schema: JsonDict) -> None:
+        super().__init__("fixed", schema)
+        self.size = size
+
+
+class EnumOp:
+    __slots__ = ("symbols", "indexes", "enum_type")
+
+    def __init__(self, symbols: typing.Tuple[str, ...], enum_type: typing.Optional[typing.Type[enum.Enum]]) -> None:
+        self.symbols = symbols
+        self.indexes = {symbol: index for index, symbol in enumerate(symbols)}
+        self.enum_type = enum_type
+
+
+class ArrayOp:
+    __slots__ = ("items", "typecode", "schema")
+
+    def __init__(self, items: "Op") -> None:
+        self.items = items
+
+        # arrays of numbers without logical types. The integers are variable-length encoded,
+        # so their blocks are encoded and decoded by fastavro with the schema of the array
+        is_number = isinstance(items, PrimitiveOp) and items.type in TYPECODES and items.logical_writer is None
+        self.typecode = TYPECODES[items.type] if is_number else None  # type: ignore
+        self.schema = (
+            fastavro.parse_schema({"type": "array", "items": items.type})  # type: ignore
+            if self.typecode in ("i", "q")
+            else None
+        )
+
+
+class MapOp:
+    __slots__ = ("values",)
+
+    def __init__(self, values: "Op") -> None:
+        self.values = values
+
+
+class UnionOp:
+    __slots__ = ("branches",)
+
+    def __init__(self, branches: typing.List["Op"]) -> None:
+        self.branches = branches
+
+
+class RecordOp:
+    __slots__ = ("klass", "fields")
+
+    def __init__(self, klass: typing.Optional[type]) -> None:
+        self.klass = klass
+        self.fields: typing.List[typing.Tuple[str, Op]] = []
+
+
+Op = typing.Union[PrimitiveOp, EnumOp, ArrayOp, MapOp, UnionOp, RecordOp]
+
+STRING = PrimitiveOp("string", {})
+
+# marks the end of the blocks of an array or map when encoding
+END_OF_BLOCKS = object()
+
+
+class RecordCodec:
+    """
+    Encode and decode avro binary data of a model without recursion: the nested values
+    are kept in an explicit stack, so the depth of the data is only limited by the memory.
+    It is used for models with self relationships (linked lists, trees), which
+    `fastavro` and the recursive conversions can not handle when they are deep.
+
+    It is also used to encode models with arrays of numbers (int, long, float and double items),
+    because the arrays are encoded in bulk and they can be lists, `array.array` or NumPy 1-D arrays.
+
+    The values are checked as fastavro does: the fixed values must have the size of the schema
+    and the branch of each union is chosen with the rules of fastavro's validation.
+
+    Attributes:
+        record: the operations to encode and decode the model, created from its schema IR and fields
+        recursive: whether the model has self relationships
+        number_arrays: whether the model has arrays of numbers
+        typed_arrays: decode the arrays of numbers into `array.array` instead of lists
+    """
+
+    def __init__(self, record: RecordOp, recursive: bool, number_arrays: bool, typed_arrays: bool = False) -> None:
+        self.record = record
+        self.recursive = recursive
+        self.number_arrays = number_arrays
+        self.typed_arrays = typed_arrays
+
+    @classmethod
+    def create(
+        cls, node: schema_ir.RecordNode, klass: type, fields: typing.List, typed_arrays: bool = False
+    ) -> "RecordCodec":
+        compiler = _Compiler()
+        record = compiler.compile_record(node, klass, fields)
+        return cls(record, compiler.recursive, compiler.number_arrays, typed_arrays=typed_arrays)
+
+    @staticmethod
+    def get_features(node: schema_ir.RecordNode) -> JsonDict:
+        """
+        Returns whether the schema has self relationships and arrays of numbers,
+        the features that decide if a model uses the codec, without its classes
+        """
+        compiler = _Compiler()
+        compiler.compile_record(node, None, [])
+        return {"recursive": compiler.recursive, "number_arrays": compiler.number_arrays}
+
+    @property
+    def decodes(self) -> bool:
+        """
+        Whether the data is decoded with the codec. Otherwise it is only used to encode
+        """
+        return self.recursive or (self.number_arrays and self.typed_arrays)
+
+    def encode(self, value: typing.Any) -> bytes:
+        output = bytearray()
+        write_long = _write_long
+        stack: typing.List[typing.Tuple[typing.Any, typing.Any]] = [(self.record, value)]
+
+        while stack:
+            op, value = stack.pop()
+
+            if op is END_OF_BLOCKS:
+                output.append(0)
+            elif isinstance(op, RecordOp):
+                get_value = value.get if isinstance(value, dict) else value.__getattribute__
+                for name, field_op in reversed(op.fields):
+                    stack.append((field_op, get_value(name)))
+            elif isinstance(op, UnionOp):
+                index = _get_union_index(op, value)
+                write_long(output, index)
+                stack.append((op.branches[index], value))
+            elif isinstance(op, ArrayOp):
+                if op.typecode is not None:
+                    _write_number_array(output, op, value)
+                elif value:
+                    write_long(output, len(value))
+                    stack.append((END_OF_BLOCKS, None))
+                    stack.extend((op.items, item) for item in reversed(value))
+                else:
+                    output.append(0)
+            elif isinstance(op, MapOp):
+                if value:
+                    write_long(output, len(value))
+                    stack.append((END_OF_BLOCKS, None))
+                    for key, item in reversed(list(value.items())):
+                        stack.append((op.values, item))
+                        stack.append((STRING, key))
+                else:
+                    output.append(0)
+            elif isinstance(op, EnumOp):
+                symbol = value.value if isinstance(value, enum.Enum) else value
+                write_long(output, op.indexes[symbol])
+            else:
+                _write_primitive(output, op, value)
+
+        return bytes(output)
+
+    def decode(self, data: BytesLike, offset: int = 0, create_instance: bool = True) -> typing.Tuple[typing.Any, int]:
+        """
+        Decode the record that starts at offset. Returns the record and the offset where it ends
+        """
+        decoder = _Decoder(data, offset, create_instance, self.typed_arrays)
+        return decoder.decode(self.record), decoder.position
+
+
+class _Compiler:
+    def __init__(self) -> None:
+        self.named_ops: typing.Dict[str, Op] = {}
+        self.in_progress: typing.Set[str] = set()
+        self.recursive = False
+        self.number_arrays = False
+
+    def compile_record(self, node: schema_ir.RecordNode, klass: typing.Optional[type], fields: typing.List) -> RecordOp:
+        record = RecordOp(klass)
+        self.named_ops[node.fullname] = record
+        self.in_progress.add(node.fullname)
+
+        fields_by_name = {field.name: field for field in fields}
+        record.fields = [
+            (field_node.name, self.compile(fields_by_name.get(field_node.name), field_node.type))
+            for field_node in node.fields
+        ]
+
+        self.in_progress.discard(node.fullname)
+        return record
+
+    def compile(self, field: typing.Any, node: schema_ir.Node) -> Op:
+        if isinstance(node, schema_ir.ReferenceNode):
+            # a named type defined before, or the record itself
+            self.recursive = self.recursive or node.fullname in self.in_progress
+            return self.named_ops[node.fullname]
+        elif isinstance(node, schema_ir.UnionNode):
+            return UnionOp(self.compile_union(field, node))
+        elif isinstance(node, schema_ir.RecordNode):
+            klass = field.type if isinstance(field, RecordField) else None
+            return self.compile_record(node, klass, klass.get_fields() if klass is not None else [])
+        elif isinstance(node, schema_ir.EnumNode):
+            enum_op = EnumOp(node.symbols, field.type if isinstance(field, EnumField) else None)
+            self.named_ops[node.fullname] = enum_op
+            return enum_op
+        elif isinstance(node, schema_ir.FixedNode):
+            fixed_op = FixedOp(node.size, {"type": "fixed", "size": node.size, **schema_ir.to_python(node)})
+            self.named_ops[node.fullname] = fixed_op
+            return fixed_op
+        elif isinstance(node, schema_ir.ArrayNode):
+            array_op = ArrayOp(self.compile(field.internal_field if isinstance(field, ListField) else None, node.items))
+            self.number_arrays = self.number_arrays or array_op.typecode is not None
+            return array_op
+        elif isinstance(node, schema_ir.MapNode):
+            return MapOp(self.compile(field.internal_field if isinstance(field, DictField) else None, node.values))
+
+        schema = schema_ir.to_python(node)
+        return PrimitiveOp(node.type, schema if isinstance(schema, dict) else {"type": schema})  # type: ignore
+
+    def compile_union(self, field: typing.Any, node: schema_ir.UnionNode) -> typing.List[Op]:
+        if not isinstance(field, UnionField):
+            # fields with None as default, for example [null, record]
+            return [self.compile(field, union_type) for union_type in node.types]
+
+        # the null type that is added when the default is None does not have an internal field
+        internal_fields = iter(field.internal_fields)
+        has_null = any(isinstance(internal_field, NoneField) for internal_field in field.internal_fields)
+        branches = []
+
+        for union_type in node.types:
+            is_null = isinstance(union_type, schema_ir.PrimitiveNode) and union_type.type == "null"
+            internal_field = None if is_null and not has_null else next(internal_fields, None)
+            branches.append(self.compile(internal_field, union_type))
+
+        return branches
+
+
+def _write_long(output: bytearray, value: int) -> None:
+    # zig-zag encoding followed by the variable-length encoding
+    value = (value << 1) if value >= 0 else ((-value) << 1) - 1
+
+    while value > 0x7F:
+        output.append((value & 0x7F) | 0x80)
+        value >>= 7
+    output.append(value)
+
+
+def _write_primitive(output: bytearray, op: PrimitiveOp, value: typing.Any) -> None:
+    if isinstance(value, (types.Decimal, types.Fixed)):
+        value = value.default
+    if op.logical_writer is not None:
+        value = op.logical_writer(value, op.schema)
+
+    avro_type = op.type
+    if avro_type == "null":
+        return
+    elif avro_type == "boolean":
+        output.append(1 if value else 0)
+    elif avro_type in ("int", "long"):
+        _write_long(output, value)
+    elif avro_type == "float":
+        output += struct.pack("<f", value)
+    elif avro_type == "double":
+        output += struct.pack("<d", value)
+    elif avro_type == "fixed":
+        if len(value) != op.size:  # type: ignore
+            raise ValueError(f"data of length {len(value)} does not match schema size: {op.schema}")
+        output += value
+    elif avro_type == "string":
+        value = value.encode()
+        _write_long(output, len(value))
+        output += value
+    else:
+        if not isinstance(value, (bytes, bytearray)):
+            raise TypeError(f"{value!r} (type {type(value)}) is not bytes")
+        _write_long(output, len(value))
+        output += value
+
+
+def _write_number_array(output: bytearray, op: ArrayOp, values: typing.Any) -> None:
+    """
+    Write the array of numbers in one block. values can be a list, an `array.array` or a NumPy 1-D array
+    """
+    if len(values) == 0:
+        output.append(0)
+    elif op.schema is not None:
+        stream = io.BytesIO()
+        # tolist converts arrays to python ints at once
+        fastavro.schemaless_writer(stream, op.schema, values.tolist() if hasattr(values, "tolist") else values)
+        output += stream.getvalue()
+    else:
+        _write_long(output, len(values))
+        output += _to_little_endian_bytes(values, op.typecode)  # type: ignore
+        output.append(0)
+
+
+def _to_little_endian_bytes(values: typing.Any, typecode: str) -> bytes:
+    if not BIG_ENDIAN and not isinstance(values, (list, tuple)):
+        try:
+            view = memoryview(values)
+        except TypeError:
+            pass
+        else:
+            # array.array and NumPy arrays of the same type are copied as they are
+            if view.format == typecode and view.ndim == 1 and view.c_contiguous:
+                return view.tobytes()
+
+    numbers = array.array(typecode, values)
+    if BIG_ENDIAN:
+        numbers.byteswap()  # pragma: no cover
+    return numbers.tobytes()
+
+
+def _matches(op: Op, value: typing.Any) -> bool:
+    if isinstance(op, RecordOp):
+        if op.klass is not None and not isinstance(value, dict):
+            return isinstance(value, op.klass)
+        return isinstance(value, dict) and all(name in value for name, _ in op.fields)
+    elif isinstance(op, EnumOp):
+        if isinstance(value, enum.Enum):
+            return op.enum_type is None or isinstance(value, op.enum_type)
+        return isinstance(value, str) and value in op.indexes
+    elif isinstance(op, ArrayOp):
+        return isinstance(value, (list, tuple)) or (op.typecode is not None and utils.is_typed_array(value))
+    elif isinstance(op, MapOp):
+        return isinstance(value, dict)
+    elif isinstance(op, UnionOp):
+        return False
+    elif isinstance(op, FixedOp):
+        logical_type = op.schema.get("logicalType")
+        if logical_type in LOGICAL_TYPES_VALUES:
+            return isinstance(value, LOGICAL_TYPES_VALUES[logical_type])
+        return isinstance(value, bytes) and len(value) == op.size
+
+    logical_type = op.schema.get("logicalType")
+    if logical_type in LOGICAL_TYPES_VALUES and isinstance(value, LOGICAL_TYPES_VALUES[logical_type]):
+        # datetime is a subclass of date
+        return not (logical_type == "date" and isinstance(value, datetime.datetime))
+    return PRIMITIVE_VALUES[op.type](value)
+
+
+def _get_union_index(op: UnionOp, value: typing.Any) -> int:
+    if isinstance(value, (types.Decimal, types.Fixed)):
+        value = value.default
+
+    for index, branch in enumerate(op.branches):
+        if _matches(branch, value):
+            if isinstance(branch, PrimitiveOp) and branch.type == "float":
+                # as fastavro, a double later in the union is preferred, so the value keeps its precision
+                for double_index in range(index + 1, len(op.branches)):
+                    double_branch = op.branches[double_index]
+                    if isinstance(double_branch, PrimitiveOp) and double_branch.type == "double":
+                        return double_index
+            return index
+    raise ValueError(f"{value!r} (type {type(value)}) does not match any type of the union")
+
+
+class _Frame:
+    """
+    A record, array or map that is being decoded. The values of its children
+    are added when they are decoded, and the value of the frame is created at the end
+    """
+
+    __slots__ = ("op", "value", "name", "pending")
+
+    def __init__(self, op: typing.Any, value: typing.Any) -> None:
+        self.op = op
+        self.value = value
+        # the next field of a record or the key of a map
+        self.name: typing.Any = 0
+        # items of the current block of arrays and maps
+        self.pending = 0
+
+
+# marks that the value of an operation is a frame that is not complete yet
+PENDING = object()
+
+
+class _Decoder:
+    """
+    Read the values of the data. When the data is truncated EOFError is raised, as fastavro does
+    """
+
+    def __init__(self, data: BytesLike, position: int, create_instance: bool, typed_arrays: bool = False) -> None:
+        self.data = data
+        self.size = len(data)
+        self.position = position
+        self.create_instance = create_instance
+        self.typed_arrays = typed_arrays
+
+    def decode(self, op: Op) -> typing.Any:
+        stack: typing.List[_Frame] = []
+        value = self.start(op, stack)
+
+        while stack:
+            frame = stack[-1]
+            child_op = frame.op
+
+            if isinstance(child_op, RecordOp):
+                if value is not PENDING:
+                    frame.value[child_op.fields[frame.name][0]] = value
+                    frame.name += 1
+
+                if frame.name < len(child_op.fields):
+                    value = self.start(child_op.fields[frame.name][1], stack)
+                    continue
+
+                stack.pop()
+                value = self.create_record(child_op, frame.value)
+                continue
+
+            if value is not PENDING:
+                if isinstance(child_op, ArrayOp):
+                    frame.value.append(value)
+                else:
+                    frame.value[frame.name] = value
+                frame.pending -= 1
+
+            if frame.pending == 0:
+                frame.pending = self.read_block_count()
+
+            if frame.pending == 0:
+                stack.pop()
+                value = frame.value
+            elif isinstance(child_op, ArrayOp):
+                value = self.start(child_op.items, stack)
+            else:
+                frame.name = self.read_bytes().decode()
+                value = self.start(child_op.values, stack)
+
+        return value
+
+    def start(self, op: Op, stack: typing.List[_Frame]) -> typing.Any:
+        """
+        Decode the value of op when it has no children. Otherwise a frame
+        for it is added to the stack and PENDING is returned
+        """
+        while isinstance(op, UnionOp):
+            op = op.branches[self.read_long()]
+
+        if isinstance(op, RecordOp):
+            stack.append(_Frame(op, {}))
+            return PENDING
+        elif isinstance(op, ArrayOp):
+            if op.typecode is not None:
+                return self.read_number_array(op)
+            stack.append(_Frame(op, []))
+            return PENDING
+        elif isinstance(op, MapOp):
+            stack.append(_Frame(op, {}))
+            return PENDING
+        elif isinstance(op, EnumOp):
+            symbol = op.symbols[self.read_long()]
+            return symbol if op.enum_type is None else op.enum_type(symbol)
+        return self.read_primitive(op)
+
+    def create_record(self, op: RecordOp, values: JsonDict) -> typing.Any:
+        if not self.create_instance or op.klass is None:
+            return values
+        elif utils.is_pydantic_model(op.klass):
+            return op.klass._create_instance(values)  # type: ignore
+        return op.klass(**values)
+
+    def read_long(self) -> int:
+        data = self.data
+        position = self.position
+
+        try:
+            byte = data[position]
+            value = byte & 0x7F
+            shift = 7
+            position += 1
+
+            while byte & 0x80:
+                byte = data[position]
+                value |= (byte & 0x7F) << shift
+                shift += 7
+                position += 1
+        except IndexError:
+            raise EOFError from None
+
+        self.position = position
+        return (value >> 1) ^ -(value & 1)
+
+    def read_block_count(self) -> int:
+        count = self.read_long()
+        if count < 0:
+            # the size in bytes of the block is also written
+            self.read_long()
+            return -count
+        return count
+
+    def read_number_array(self, op: ArrayOp) -> typing.Any:
+        """
+        Read all the blocks of an array of numbers, as an `array.array` or a list
+        """
+        if op.schema is not None:
+            stream = io.BytesIO(self.data)
+            stream.seek(self.position)
+            values = fastavro.schemaless_reader(stream, op.schema, None)
+            self.position = stream.tell()
+            return array.array(op.typecode, values) if self.typed_arrays else values  # type: ignore
+
+        numbers = array.array(op.typecode)  # type: ignore
+        count = self.read_block_count()
+        while count:
+            end = self.check_size(count * numbers.itemsize)
+            numbers.frombytes(self.data[self.position : end])
+            self.position = end
+            count = self.read_block_count()
+
+        if BIG_ENDIAN:
+            numbers.byteswap()  # pragma: no cover
+        return numbers if self.typed_arrays else numbers.tolist()
+
+    def check_size(self, size: int) -> int:
+        """
+        Returns the position after the next size bytes, EOFError is raised when the data is shorter
+        """
+        end = self.position + size
+        if end > self.size:
+            raise EOFError(f"Expected {size} bytes, read {self.size - self.position}")
+        return end
+
+    def read_bytes(self, size: typing.Optional[int] = None) -> bytes:
+        size = self.read_long() if size is None else size
+        start = self.position
+        self.position = self.check_size(size)
+        return bytes(self.data[start : self.position])
+
+    def read_primitive(self, op: PrimitiveOp) -> typing.Any:
+        avro_type = op.type
+        value: typing.Any
+
+        if avro_type == "null":
+            return None
+        elif avro_type == "boolean":
+            end = self.check_size(1)
+            value = self.data[self.position] == 1
+            self.position = end
+        elif avro_type in ("int", "long"):
+            value = self.read_long()
+        elif avro_type in ("float", "double"):
+            size = 4 if avro_type == "float" else 8
+            end = self.check_size(size)
+            (value,) = struct.unpack_from("<f" if size == 4 else "<d", self.data, self.position)
+            self.position = end
+        elif avro_type == "fixed":
+            value = self.read_bytes(op.size)  # type: ignore
+        else:
+            value = self.read_bytes()
+            if avro_type == "string":
+                value = value.decode()
+
+        if op.logical_reader is not None:
+            return op.logical_reader(value, op.schema, op.schema)
+        return value
@@ -0,0 +1,108 @@
+import io
+import typing
+
+import fastavro
+
+from .types import BytesLike, JsonDict
+
+
+class LazyRecord:
+    """
+    Read-only view over an avro encoded record.
+
+    A field is decoded only when it is accessed for the first time and the result is cached.
+    The fields before it are skipped (not decoded) in order to locate it, and the position
+    where each decoded field ends is remembered, so the next access starts from there.
+
+    Attributes:
+        model: AvroModel class used to encode the data
+        data: avro binary data
+        writer_schema: schema used to encode the data in case that it is not the model schema
+    """
+
+    __slots__ = (
+        "_model",
+        "_stream",
+        "_writer_schema",
+        "_field_names",
+        "_values",
+        "_offsets",
+        "_self_reference",
+        "_skip_fields",
+    )
+
+    def __init__(
+        self,
+        model: typing.Any,
+        data: BytesLike,
+        writer_schema: typing.Optional[JsonDict] = None,
+    ) -> None:
+        object.__setattr__(self, "_model", model)
+        object.__setattr__(self, "_stream", io.BytesIO(data))
+        object.__setattr__(
+            self, "_writer_schema", fastavro.parse_schema(writer_schema) if writer_schema is not None else None
+        )
+        object.__setattr__(self, "_field_names", [field.name for field in model.get_fields()])
+        object.__setattr__(self, "_values", {})
+        # position in the stream where each decoded field ends
+        object.__setattr__(self, "_offsets", {})
+        object.__setattr__(self, "_self_reference", model._has_self_reference())
+        # Skipping only the fields before the requested one is possible only when the data was encoded
+        # with the model schema and the record does not reference itself, otherwise the whole record must be read
+        object.__setattr__(self, "_skip_fields", writer_schema is None and not self._self_reference)
+
+    def __getattr__(self, name: str) -> typing.Any:
+        if name.startswith("_"):
+            # the private attributes are not set yet, for example when copy or pickle create the record
+            raise AttributeError(name)
+        if name not in self._field_names:
+            raise AttributeError(f"{self._model.__name__} has no field {name}")
+
+        if name not in self._values:
+            self._values[name] = self._decode_field(name)
+        return self._values[name]
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is read-only")
+
+    def __reduce__(self) -> typing.Tuple[typing.Any, ...]:
+        return (self.__class__, (self._model, self._stream.getvalue(), self._writer_schema))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._model.__name__}, decoded={list(self._values)})"
+
+    def _decode_field(self, name: str) -> typing.Any:
+        if self._self_reference:
+            # the self reference points to the whole record, so the reader schema can not be projected
+            # and the whole record is decoded: all the fields are cached so it is decoded only once
+            reader_schema = self._model.get_projected_schema(self._field_names)
+        else:
+            reader_schema = self._model.get_projected_schema([name])
+
+        if self._skip_fields:
+            index = self._field_names.index(name)
+            # find the closest field before the requested one which end position is known
+            start_index = max((position for position in self._offsets if position < index), default=-1)
+            start = self._offsets.get(start_index, 0)
+            writer_schema = self._model.get_projected_schema(self._field_names[start_index + 1 : index + 1])
+        else:
+            index = None
+            start = 0
+            writer_schema = self._writer_schema or self._model.get_projected_schema(self._field_names)
+
+        self._stream.seek(start)
+        payload = fastavro.schemaless_reader(self._stream, writer_schema, reader_schema)
+
+        if index is not None:
+            self._offsets[index] = self._stream.tell()
+
+        values = self._model._deserialize_complex_types(payload)
+        if self._self_reference:
+            self._values.update(values)
+        return values[name]
+
+    def to_dict(self) -> JsonDict:
+        """
+        Decode all the fields that were not decoded yet and return them as a python dict
+        """
+        return {name: getattr(self, name) for name in self._field_names}
@@ -0,0 +1,280 @@
+import dataclasses
+import typing
+
+import fastavro
+
+from .exceptions import DecodeLimitExceeded
+from .types import BytesLike, JsonDict
+
+# kinds of the nodes of a PayloadChecker
+SKIP, LONG, BYTES, ARRAY, MAP, UNION, RECORD = range(7)
+
+# the keys of the maps
+STRING = [BYTES, None]
+
+# sizes of the primitive types that are not length prefixed
+FIXED_SIZES = {"null": 0, "boolean": 1, "float": 4, "double": 8}
+
+
+@dataclasses.dataclass(frozen=True)
+class DecodeLimits:
+    """
+    Limits of the avro binary payloads that are decoded. The payloads that exceed a limit
+    raise `DecodeLimitExceeded` before anything is decoded. `None` means no limit.
+
+    Attributes:
+        max_bytes: size of the whole payload in bytes
+        max_collection_length: number of items of each array or map
+        max_string_length: size in bytes of each string or bytes value
+        max_depth: nesting of records, arrays and maps. The top level record has depth 1
+    """
+
+    max_bytes: typing.Optional[int] = None
+    max_collection_length: typing.Optional[int] = None
+    max_string_length: typing.Optional[int] = None
+    max_depth: typing.Optional[int] = None
+
+
+class PayloadChecker:
+    """
+    Checks the decode limits of avro binary payloads of a schema by walking the bytes,
+    without creating any value. The walk keeps the nested values in an explicit stack.
+
+    Most payloads are never walked: an array of N items needs at least N bytes (unless the
+    items can be empty, like null), a string of N bytes needs more than N bytes and only
+    recursive schemas can nest deeper than their definition. So the payloads that are not
+    bigger than the limits can not exceed them and only their size is checked. A smaller
+    payload that claims a longer string or array is truncated and the decoder fails as usual.
+
+    Attributes:
+        root: the node of the schema. Nodes are lists `[kind, argument]`
+        has_strings: whether the schema has strings or bytes
+        has_collections: whether the schema has arrays or maps
+        empty_items: whether the schema has arrays whose items can take 0 bytes
+        recursive: whether the schema has named types that contain themselves
+        depth: the maximum depth of the payloads when the schema is not recursive
+    """
+
+    def __init__(self, schema: JsonDict) -> None:
+        named_schemas: typing.Dict[str, JsonDict] = {}
+        parsed_schema = fastavro.parse_schema(schema, named_schemas)
+        self.has_strings = False
+        self.has_collections = False
+        self.empty_items = False
+        self.recursive = False
+
+        self._named_schemas = named_schemas
+        self._named_nodes: typing.Dict[str, typing.List] = {}
+        self._depths: typing.Dict[int, int] = {}
+        self._arrays: typing.List[typing.List] = []
+        self.root = self.compile(parsed_schema)
+        self.empty_items = any(self.get_min_size(array[1], set()) == 0 for array in self._arrays)
+        self.depth = self.get_depth(self.root, set())
+
+    def compile(self, schema: typing.Any) -> typing.List:
+        if isinstance(schema, list):
+            return [UNION, [self.compile(branch) for branch in schema]]
+        elif isinstance(schema, str):
+            if schema in self._named_nodes:
+                return self._named_nodes[schema]
+            elif schema in self._named_schemas:
+                return self.compile(self._named_schemas[schema])
+            schema = {"type": schema}
+
+        node: typing.List[typing.Any]
+        avro_type = schema["type"]
+        if avro_type in FIXED_SIZES:
+            return [SKIP, FIXED_SIZES[avro_type]]
+        elif avro_type in ("int", "long", "enum"):
+            node = [LONG, None]
+        elif avro_type in ("string", "bytes"):
+            self.has_strings = True
+            return [BYTES, None]
+        elif avro_type == "fixed":
+            node = [SKIP, schema["size"]]
+        elif avro_type == "array":
+            self.has_collections = True
+            node = [ARRAY, self.compile(schema["items"])]
+            self._arrays.append(node)
+            return node
+        elif avro_type == "map":
+            self.has_collections = True
+            self.has_strings = True
+            return [MAP, self.compile(schema["values"])]
+        elif avro_type in ("record", "error"):
+            # the node is registered before the fields are compiled, so the fields can use it
+            node = [RECORD, []]
+            self._named_nodes[schema["name"]] = node
+            node[1] = [self.compile(field["type"]) for field in schema["fields"]]
+            return node
+        else:
+            return self.compile(avro_type)
+
+        if "name" in schema:
+            self._named_nodes[schema["name"]] = node
+        return node
+
+    def get_min_size(self, node: typing.List, seen: typing.Set[int]) -> int:
+        """
+        Returns the minimum number of bytes of the values of node. Records that contain
+        themselves are counted as 0
+        """
+        kind = node[0]
+        if kind == SKIP:
+            return node[1]
+        elif kind != RECORD:
+            # varints, length prefixes, union indexes and block counts
+            return 1
+        elif id(node) in seen:
+            return 0
+
+        seen.add(id(node))
+        size = sum(self.get_min_size(field, seen) for field in node[1])
+        seen.discard(id(node))
+        return size
+
+    def get_depth(self, node: typing.List, seen: typing.Set[int]) -> int:
+        kind = node[0]
+        if kind == UNION:
+            return max(self.get_depth(branch, seen) for branch in node[1])
+        elif kind in (ARRAY, MAP):
+            return 1 + self.get_depth(node[1], seen)
+        elif kind != RECORD:
+            return 0
+        elif id(node) in seen:
+            self.recursive = True
+            return 0
+        elif id(node) in self._depths:
+            return self._depths[id(node)]
+
+        seen.add(id(node))
+        depth = 1 + max((self.get_depth(field, seen) for field in node[1]), default=0)
+        seen.discard(id(node))
+        self._depths[id(node)] = depth
+        return depth
+
+    def needs_walk(self, limits: DecodeLimits, size: int) -> bool:
+        """
+        Whether a payload of size bytes can exceed the limits, so it has to be walked
+        """
+        max_collection_length = limits.max_collection_length
+        max_string_length = limits.max_string_length
+
+        return (
+            (max_string_length is not None and self.has_strings and size > max_string_length)
+            or (
+                max_collection_length is not None
+                and self.has_collections
+                and (self.empty_items or size > max_collection_length)
+            )
+            or (limits.max_depth is not None and (self.recursive or self.depth > limits.max_depth))
+        )
+
+    def check(self, data: BytesLike, limits: DecodeLimits, many: bool = False) -> None:
+        """
+        Raise DecodeLimitExceeded when the payload exceeds the limits. With many the payload
+        is a sequence of records, like the ones created by `serialize_many`
+        """
+        size = len(data)
+        if limits.max_bytes is not None and size > limits.max_bytes:
+            raise DecodeLimitExceeded("max_bytes", size, limits.max_bytes)
+
+        if not self.needs_walk(limits, size):
+            return
+
+        position = self.walk(data, limits, 0)
+        while many and 0 < position < size:
+            position = self.walk(data, limits, position)
+
+    def walk(self, data: BytesLike, limits: DecodeLimits, position: int) -> int:
+        """
+        Walk the record that starts at position and return the position where it ends.
+        When the payload is not valid the walk stops and -1 is returned, the decoder reports the error
+        """
+        max_collection_length = limits.max_collection_length
+        max_string_length = limits.max_string_length
+        max_depth = limits.max_depth
+        size = len(data)
+
+        # (node, depth, items left in the current block of a collection, items of the collection so far)
+        stack: typing.List[typing.Tuple[typing.List, int, int, int]] = [(self.root, 1, 0, -1)]
+
+        try:
+            while stack:
+                node, depth, pending, count = stack.pop()
+                kind = node[0]
+
+                if position > size:
+                    return -1
+                elif kind == SKIP:
+                    position += node[1]
+                elif kind == LONG:
+                    while data[position] & 0x80:
+                        position += 1
+                    position += 1
+                elif kind == BYTES:
+                    length, position = _read_long(data, position)
+                    if max_string_length is not None and length > max_string_length:
+                        raise DecodeLimitExceeded("max_string_length", length, max_string_length)
+                    elif length < 0:
+                        return -1
+                    position += length
+                elif kind == UNION:
+                    index, position = _read_long(data, position)
+                    if not 0 <= index < len(node[1]):
+                        return -1
+                    stack.append((node[1][index], depth, 0, -1))
+                elif kind == RECORD:
+                    if max_depth is not None and depth > max_depth:
+                        raise DecodeLimitExceeded("max_depth", depth, max_depth)
+                    stack.extend((field, depth + 1, 0, -1) for field in reversed(node[1]))
+                else:
+                    # arrays and maps, count is -1 when the collection starts
+                    if count < 0:
+                        if max_depth is not None and depth > max_depth:
+                            raise DecodeLimitExceeded("max_depth", depth, max_depth)
+                        count = 0
+
+                    if pending == 0:
+                        pending, position = _read_long(data, position)
+                        if pending < 0:
+                            # the size in bytes of the block is also written
+                            pending = -pending
+                            _, position = _read_long(data, position)
+                        if pending == 0:
+                            continue
+
+                        count += pending
+                        if max_collection_length is not None and count > max_collection_length:
+                            raise DecodeLimitExceeded("max_collection_length", count, max_collection_length)
+
+                    items = node[1]
+                    if kind == ARRAY and items[0] == SKIP:
+                        position += pending * items[1]
+                        stack.append((node, depth, 0, count))
+                        continue
+
+                    stack.append((node, depth, pending - 1, count))
+                    stack.append((items, depth + 1, 0, -1))
+                    if kind == MAP:
+                        stack.append((STRING, depth, 0, -1))
+        except IndexError:
+            # the payload is truncated
+            return -1
+
+        return position if position <= size else -1
+
+
+def _read_long(data: BytesLike, position: int) -> typing.Tuple[int, int]:
+    byte = data[position]
+    value = byte & 0x7F
+    shift = 7
+    position += 1
+
+    while byte & 0x80:
+        byte = data[position]
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        position += 1
+
+    return (value >> 1) ^ -(value & 1), position
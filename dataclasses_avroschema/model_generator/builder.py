@@ -0,0 +1,347 @@
+import builtins
+import copy
+import dataclasses
+import datetime
+import decimal
+import enum
+import hashlib
+import json
+import sys
+import typing
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+import fastavro
+
+from dataclasses_avroschema import field_utils, serialization, types
+from dataclasses_avroschema.types import JsonDict
+
+from . import avro_to_python_utils
+from .generator import BaseClassEnum
+
+# modules used by the python types of avro_to_python_utils.AVRO_TYPE_TO_PYTHON
+PYTHON_TYPES_MODULES = {"types": types, "datetime": datetime, "decimal": decimal, "uuid": uuid}
+
+PY_VER = sys.version_info
+
+
+class Factory(typing.NamedTuple):
+    """
+    Default value that must be created for each instance, for example a list
+    """
+
+    factory: typing.Callable[[], typing.Any]
+
+
+def get_python_type(avro_type: str) -> typing.Any:
+    """
+    Returns the python type of an avro primitive or logical type, for example `types.Int32` for `int`
+    """
+    if avro_type == field_utils.UUID:
+        # uuid.uuid4 is used in the generated code, but for pydantic models the type must be a class
+        return uuid.UUID
+
+    python_type = avro_to_python_utils.AVRO_TYPE_TO_PYTHON[avro_type]
+    if "." in python_type:
+        module, name = python_type.split(".")
+        return getattr(PYTHON_TYPES_MODULES[module], name)
+    return getattr(builtins, python_type)
+
+
+def get_fingerprint(schema: JsonDict) -> str:
+    """
+    Returns the fingerprint of a schema. All the attributes are included (docs, defaults, aliases)
+    because they are part of the generated model
+    """
+    return hashlib.sha256(json.dumps(schema, sort_keys=True).encode()).hexdigest()
+
+
+@dataclass
+class ModelBuilder:
+    """
+    Build python models (classes) from avro schemas at runtime, without rendering code.
+
+    The models are cached by the fingerprint of the schema, so building the same schema
+    again returns the same model. When there are more than `max_size` models in the cache,
+    the least recently used one is removed.
+
+    Attributes:
+        base_class: base class of the models, AvroModel or AvroBaseModel
+        max_size: max amount of models in the cache
+        models: the cache, models by schema fingerprint
+    """
+
+    base_class: str = BaseClassEnum.AVRO_MODEL.value
+    max_size: int = 128
+    models: "OrderedDict[str, typing.Type]" = field(default_factory=OrderedDict)
+
+    def __post_init__(self) -> None:
+        if self.base_class == BaseClassEnum.PYDANTIC_MODEL.value:
+            raise ValueError(
+                f"ModelBuilder requires {BaseClassEnum.AVRO_MODEL.value} "
+                f"or {BaseClassEnum.AVRO_DANTIC_MODEL.value} as base class"
+            )
+
+    def build(self, *, schema: JsonDict) -> typing.Type:
+        """
+        Returns the model of a record schema, from the cache if the schema was built before
+        """
+        fingerprint = get_fingerprint(schema)
+        model = self.models.get(fingerprint)
+
+        if model is not None:
+            self.models.move_to_end(fingerprint)
+            return model
+
+        fastavro.parse_schema(schema)
+        model = self.build_record(schema=schema, namespace=None, named_types={})
+
+        self.models[fingerprint] = model
+        if len(self.models) > self.max_size:
+            self.models.popitem(last=False)
+
+        return model
+
+    def build_record(
+        self, *, schema: JsonDict, namespace: typing.Optional[str], named_types: typing.Dict[str, typing.Any]
+    ) -> typing.Type:
+        name = schema["name"]
+        namespace = schema.get("namespace", namespace)
+        if "." in name:
+            namespace, name = name.rsplit(".", 1)
+
+        # while the record is built, references to it are self relationships
+        fullname = serialization._get_fullname(name, namespace)
+        named_types[fullname] = name
+
+        model_fields = []
+        for record_field in schema["fields"]:
+            python_type, default = self.parse_type(
+                avro_type=record_field["type"],
+                default=record_field.get("default", dataclasses.MISSING),
+                namespace=namespace,
+                named_types=named_types,
+            )
+            metadata = {key: record_field[key] for key in ("doc", "aliases") if key in record_field}
+            model_fields.append((record_field["name"], python_type, default, metadata))
+
+        # the fields of the class can be in a different order (see create_dataclass)
+        meta_attributes = {
+            "schema_doc": schema.get("doc", False),
+            "field_order": [record_field["name"] for record_field in schema["fields"]],
+        }
+        if namespace is not None:
+            meta_attributes["namespace"] = namespace
+        if "aliases" in schema:
+            meta_attributes["aliases"] = schema["aliases"]
+        meta = type("Meta", (), meta_attributes)
+
+        if self.base_class == BaseClassEnum.AVRO_MODEL.value:
+            model = self.create_dataclass(name=name, model_fields=model_fields, meta=meta)
+        else:
+            model = self.create_pydantic_model(name=name, model_fields=model_fields, meta=meta)
+
+        named_types[fullname] = model
+        return model
+
+    @staticmethod
+    def create_dataclass(*, name: str, model_fields: typing.List[typing.Tuple], meta: type) -> typing.Type:
+        from dataclasses_avroschema import AvroModel
+
+        dataclass_fields = []
+        for field_name, python_type, default, metadata in model_fields:
+            if isinstance(default, Factory):
+                dataclass_field = dataclasses.field(default_factory=default.factory, metadata=metadata)
+            else:
+                dataclass_field = dataclasses.field(default=default, metadata=metadata)
+            dataclass_fields.append((field_name, python_type, dataclass_field))
+
+        namespace = {"Meta": meta, "__module__": __name__}
+        if PY_VER >= (3, 10):
+            # the fields keep the order of the schema because they are keyword only
+            return dataclasses.make_dataclass(
+                name, dataclass_fields, bases=(AvroModel,), namespace=namespace, kw_only=True
+            )
+
+        # kw_only is not available, so the fields without default must be first in __init__.
+        # The schema keeps the original order with the field_order of Meta
+        required = {field_name for field_name, _, default, _ in model_fields if default is dataclasses.MISSING}
+        return dataclasses.make_dataclass(
+            name,
+            sorted(dataclass_fields, key=lambda dataclass_field: dataclass_field[0] not in required),
+            bases=(AvroModel,),
+            namespace=namespace,
+        )
+
+    @staticmethod
+    def create_pydantic_model(*, name: str, model_fields: typing.List[typing.Tuple], meta: type) -> typing.Type:
+        from pydantic import Field, create_model
+
+        from dataclasses_avroschema.avrodantic import AvroBaseModel
+
+        pydantic_fields: typing.Dict[str, typing.Any] = {}
+        for field_name, python_type, default, _ in model_fields:
+            if isinstance(default, Factory):
+                default = Field(default_factory=default.factory)
+            elif default is dataclasses.MISSING:
+                default = ...
+            pydantic_fields[field_name] = (python_type, default)
+
+        model = create_model(name, __base__=AvroBaseModel, __module__=__name__, **pydantic_fields)
+        model.Meta = meta  # type: ignore
+        return model
+
+    def parse_type(
+        self,
+        *,
+        avro_type: typing.Any,
+        default: typing.Any,
+        namespace: typing.Optional[str],
+        named_types: typing.Dict[str, typing.Any],
+    ) -> typing.Tuple[typing.Any, typing.Any]:
+        """
+        Returns the python type of an avro type and the python value of the default
+        """
+        if isinstance(avro_type, list):
+            return self.parse_union(avro_types=avro_type, default=default, namespace=namespace, named_types=named_types)
+        elif isinstance(avro_type, dict):
+            return self.parse_complex_type(
+                avro_type=avro_type, default=default, namespace=namespace, named_types=named_types
+            )
+        elif avro_type == field_utils.NULL:
+            return type(None), None
+        elif avro_type in avro_to_python_utils.AVRO_TYPE_TO_PYTHON:
+            if avro_type == field_utils.BYTES and isinstance(default, str):
+                default = default.encode()
+            return get_python_type(avro_type), default
+
+        # a reference to a named type
+        named_type = named_types.get(serialization._get_fullname(avro_type, namespace), named_types.get(avro_type))
+        if isinstance(named_type, str):
+            return typing.Type[named_type], default  # type: ignore
+        elif isinstance(named_type, types.Fixed):
+            return types.Fixed, named_type
+        return named_type, self.parse_named_type_default(python_type=named_type, default=default)
+
+    def parse_union(
+        self,
+        *,
+        avro_types: typing.List,
+        default: typing.Any,
+        namespace: typing.Optional[str],
+        named_types: typing.Dict[str, typing.Any],
+    ) -> typing.Tuple[typing.Any, typing.Any]:
+        # the default value belongs to the first type of the union
+        python_types = []
+        for position, avro_type in enumerate(avro_types):
+            if avro_type == field_utils.NULL:
+                continue
+
+            python_type, type_default = self.parse_type(
+                avro_type=avro_type,
+                default=default if position == 0 else dataclasses.MISSING,
+                namespace=namespace,
+                named_types=named_types,
+            )
+            python_types.append(python_type)
+            if position == 0:
+                default = type_default
+
+        python_union = typing.Union[tuple(python_types)]  # type: ignore
+        if field_utils.NULL in avro_types:
+            return typing.Optional[python_union], default
+        return python_union, default
+
+    def parse_complex_type(
+        self,
+        *,
+        avro_type: JsonDict,
+        default: typing.Any,
+        namespace: typing.Optional[str],
+        named_types: typing.Dict[str, typing.Any],
+    ) -> typing.Tuple[typing.Any, typing.Any]:
+        type_name = avro_type["type"]
+        logical_type = avro_type.get("logicalType")
+
+        if logical_type == field_utils.DECIMAL:
+            properties = {"scale": avro_type.get("scale", 0), "precision": avro_type["precision"]}
+            if default is not dataclasses.MISSING:
+                properties["default"] = serialization.string_to_decimal(value=default, schema=avro_type)
+            return decimal.Decimal, types.Decimal(**properties)
+        elif logical_type in avro_to_python_utils.AVRO_TYPE_TO_PYTHON:
+            if logical_type in avro_to_python_utils.LOGICAL_TYPES_TO_PYTHON and default not in (
+                dataclasses.MISSING,
+                None,
+            ):
+                default = avro_to_python_utils.LOGICAL_TYPES_TO_PYTHON[logical_type](default)
+            return get_python_type(logical_type), default
+        elif type_name == field_utils.RECORD:
+            model = self.build_record(schema=avro_type, namespace=namespace, named_types=named_types)
+            return model, self.parse_named_type_default(python_type=model, default=default)
+        elif type_name == field_utils.ENUM:
+            return self.parse_enum(avro_type=avro_type, default=default, namespace=namespace, named_types=named_types)
+        elif type_name == field_utils.FIXED:
+            fixed: types.Fixed = types.Fixed(
+                avro_type["size"],
+                namespace=avro_type.get("namespace"),
+                aliases=avro_type.get("aliases"),
+                name=avro_type["name"],
+            )
+            named_types[serialization._get_fullname(avro_type["name"], avro_type.get("namespace", namespace))] = fixed
+            return types.Fixed, fixed
+        elif type_name == field_utils.ARRAY:
+            items_type, _ = self.parse_type(
+                avro_type=avro_type["items"], default=dataclasses.MISSING, namespace=namespace, named_types=named_types
+            )
+            return typing.List[items_type], self.parse_container_default(default=default)  # type: ignore
+        elif type_name == field_utils.MAP:
+            values_type, _ = self.parse_type(
+                avro_type=avro_type["values"], default=dataclasses.MISSING, namespace=namespace, named_types=named_types
+            )
+            return typing.Dict[str, values_type], self.parse_container_default(default=default)  # type: ignore
+
+        # a primitive type with extra attributes, for example {"type": "string"}
+        return self.parse_type(avro_type=type_name, default=default, namespace=namespace, named_types=named_types)
+
+    @staticmethod
+    def parse_enum(
+        *,
+        avro_type: JsonDict,
+        default: typing.Any,
+        namespace: typing.Optional[str],
+        named_types: typing.Dict[str, typing.Any],
+    ) -> typing.Tuple[typing.Any, typing.Any]:
+        namespace = avro_type.get("namespace", namespace)
+        members: typing.List[typing.Tuple[str, typing.Any]] = [(symbol, symbol) for symbol in avro_type["symbols"]]
+
+        # the library reads the enum metadata from the Meta member
+        meta_attributes: JsonDict = {key: avro_type[key] for key in ("doc", "aliases") if key in avro_type}
+        if namespace is not None:
+            meta_attributes["namespace"] = namespace
+        if meta_attributes:
+            members.append(("Meta", type("Meta", (), meta_attributes)))
+
+        enum_type = enum.Enum(avro_type["name"], members)  # type: ignore
+        named_types[serialization._get_fullname(avro_type["name"], namespace)] = enum_type
+
+        if default not in (dataclasses.MISSING, None):
+            default = enum_type(default)
+        return enum_type, default
+
+    @staticmethod
+    def parse_named_type_default(*, python_type: typing.Any, default: typing.Any) -> typing.Any:
+        if default in (dataclasses.MISSING, None):
+            return default
+        elif isinstance(python_type, enum.EnumMeta):
+            return python_type(default)
+        elif isinstance(default, dict):
+            # a record default
+            return Factory(lambda: python_type.parse_obj(copy.deepcopy(default)))
+        return default
+
+    @staticmethod
+    def parse_container_default(*, default: typing.Any) -> typing.Any:
+        if isinstance(default, (list, dict)):
+            return Factory(lambda: copy.deepcopy(default))
+        return default
@@ -0,0 +1,364 @@
+import fnmatch
+import hashlib
+import json
+import os
+import time
+import typing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import fastavro
+import stringcase
+
+from dataclasses_avroschema import serialization
+from dataclasses_avroschema.types import JsonDict
+
+from . import templates
+from .generator import BaseClassEnum, ModelGenerator
+
+# Increase it when the rendered code changes, so old cache entries are not used
+CACHE_VERSION = 3
+
+
+@dataclass
+class SchemaReport:
+    """
+    Result of the generation of one schema file
+
+    Attributes:
+        path: schema path relative to the directory
+        elapsed: seconds spent validating and rendering the schema
+        cached: whether the rendered code was taken from the cache
+    """
+
+    path: str
+    elapsed: float
+    cached: bool
+
+
+def render_schema(
+    *,
+    schema: JsonDict,
+    base_class: str,
+    named_schemas: typing.Dict[str, JsonDict],
+    rendered_types: typing.Sequence[str] = (),
+) -> typing.Dict[str, typing.Any]:
+    """
+    Validate and render one schema. It is a module function so it can be sent to a process pool.
+
+    Attributes:
+        schema: avro schema to render
+        base_class: base class of the generated models
+        named_schemas: named types defined in other files that the schema can reference by name
+        rendered_types: fullnames of the named types that are rendered from other files, so they are not rendered
+
+    Returns the rendered class, the extras (enums and nested records) and the imports
+    that the code needs, together with the time spent.
+    """
+    start = time.perf_counter()
+    fastavro.parse_schema(schema, named_schemas=dict(named_schemas))
+
+    model_generator = ModelGenerator(
+        base_class=base_class, named_types=dict(named_schemas), rendered_types=set(rendered_types)
+    )
+    # the schema itself can be defined in another file as well
+    classes = "" if model_generator.is_rendered(schema=schema) else model_generator.render_class(schema=schema)
+
+    return {
+        "classes": classes,
+        "extras": model_generator.extras,
+        "imports": sorted(model_generator.imports),
+        "elapsed": time.perf_counter() - start,
+    }
+
+
+def collect_references(avro_type: typing.Any, namespace: typing.Optional[str], references: typing.Set[str]) -> None:
+    """
+    Walk an avro type and store the names used to reference named types. A name without
+    namespace is stored as it is and also with the namespace where it is used.
+    """
+    if isinstance(avro_type, str):
+        if avro_type not in serialization.PRIMITIVE_TYPES:
+            references.add(avro_type)
+            references.add(serialization._get_fullname(avro_type, namespace))
+    elif isinstance(avro_type, list):
+        for union_type in avro_type:
+            collect_references(union_type, namespace, references)
+    elif isinstance(avro_type, dict):
+        type_name = avro_type["type"]
+
+        if type_name == "record":
+            namespace = avro_type.get("namespace", namespace)
+            for record_field in avro_type["fields"]:
+                collect_references(record_field["type"], namespace, references)
+        elif type_name == "array":
+            collect_references(avro_type["items"], namespace, references)
+        elif type_name == "map":
+            collect_references(avro_type["values"], namespace, references)
+        elif type_name not in serialization.NAMED_TYPES:
+            collect_references(type_name, namespace, references)
+
+
+@dataclass
+class DirectoryModelGenerator:
+    """
+    Render one module with the models of all the schemas (avsc files) of a directory.
+
+    Each schema is validated and rendered independently, so the work is distributed in a process pool.
+    When `cache_path` is set, the rendered code of each schema is stored by the hash of the file
+    and of the files that define the types that it references, and only the files that changed
+    (or which referenced types changed) since the previous run are rendered again.
+    Each named type (record or enum) is rendered only from the first file (in path order) that defines it,
+    and the files are included in the module after the files that define the types that they use.
+
+    Attributes:
+        base_class: base class of the generated models
+        cache_path: json file where the rendered code of each schema is stored between runs
+        max_workers: number of processes. With 1 the schemas are rendered in the current process
+        pattern: glob pattern of the schema files
+        reports: generation time of each schema of the last run
+    """
+
+    base_class: str = BaseClassEnum.AVRO_MODEL.value
+    cache_path: typing.Optional[str] = None
+    max_workers: typing.Optional[int] = None
+    pattern: str = "*.avsc"
+    reports: typing.List[SchemaReport] = field(default_factory=list)
+
+    def find_schemas(self, *, path: str) -> typing.List[str]:
+        """
+        Return the schema files of the directory (recursively) relative to it and sorted
+        """
+        schema_paths = []
+        for root, _, files in os.walk(path):
+            for file_name in fnmatch.filter(files, self.pattern):
+                schema_paths.append(os.path.relpath(os.path.join(root, file_name), path))
+
+        return sorted(schema_paths)
+
+    def load_cache(self) -> typing.Dict[str, JsonDict]:
+        if self.cache_path is None or not os.path.exists(self.cache_path):
+            return {}
+
+        with open(self.cache_path) as cache_file:
+            cache = json.load(cache_file)
+
+        if cache.get("version") != CACHE_VERSION or cache.get("base_class") != self.base_class:
+            return {}
+        return cache["schemas"]
+
+    def save_cache(self, *, schemas: typing.Dict[str, JsonDict]) -> None:
+        if self.cache_path is None:
+            return
+
+        cache = {"version": CACHE_VERSION, "base_class": self.base_class, "schemas": schemas}
+        with open(self.cache_path, mode="w") as cache_file:
+            json.dump(cache, cache_file)
+
+    def render_directory(self, *, path: str) -> str:
+        """
+        Render the module with the classes generated from the schemas of the directory
+        """
+        cache = self.load_cache()
+        rendered: typing.Dict[str, JsonDict] = {}
+        schemas: typing.Dict[str, JsonDict] = {}
+        digests: typing.Dict[str, str] = {}
+        pending: typing.List[str] = []
+        self.reports = []
+
+        # all the schemas are loaded because the changed ones can reference their named types
+        for schema_path in self.find_schemas(path=path):
+            with open(os.path.join(path, schema_path), mode="rb") as schema_file:
+                content = schema_file.read()
+
+            digests[schema_path] = hashlib.sha256(content).hexdigest()
+            schemas[schema_path] = json.loads(content)
+
+        named_types = self.get_named_types(schemas=schemas)
+
+        for schema_path in schemas:
+            # the rendered code also depends on the types that are defined in other files
+            dependencies = sorted(
+                (fullname, digests[named_types[fullname][0]])
+                for fullname in self.get_rendered_types(schema_path=schema_path, named_types=named_types)
+            )
+            digest = hashlib.sha256(json.dumps([digests[schema_path], dependencies]).encode()).hexdigest()
+            cached = cache.get(schema_path)
+
+            if cached is not None and cached["hash"] == digest:
+                rendered[schema_path] = cached
+                self.reports.append(SchemaReport(path=schema_path, elapsed=0.0, cached=True))
+            else:
+                rendered[schema_path] = {"hash": digest}
+                pending.append(schema_path)
+
+        if pending:
+            self.render_schemas(schemas=schemas, named_types=named_types, pending=pending, rendered=rendered)
+
+        self.save_cache(schemas=rendered)
+        self.reports.sort(key=lambda report: report.path)
+
+        files_dependencies = {
+            schema_path: {
+                named_types[fullname][0]
+                for fullname in self.get_rendered_types(schema_path=schema_path, named_types=named_types)
+            }
+            for schema_path in schemas
+        }
+        return self.render_module(rendered=list(rendered.items()), dependencies=files_dependencies)
+
+    @staticmethod
+    def get_named_types(
+        *, schemas: typing.Dict[str, JsonDict]
+    ) -> typing.Dict[str, typing.Tuple[str, JsonDict, typing.Set[str], typing.Set[str]]]:
+        """
+        Returns the named types of all the schemas by fullname, with the first file that defines them,
+        their definition, the files that define them and the fullnames that they reference.
+        A ValueError is raised when a type is defined with different schemas, or when two types
+        are rendered with the same class name.
+        """
+        named_types: typing.Dict[str, typing.Tuple[str, JsonDict, typing.Set[str], typing.Set[str]]] = {}
+        for schema_path, schema in schemas.items():
+            file_types: typing.Dict[str, JsonDict] = {}
+            serialization._collect_named_types(schema, None, file_types)
+
+            for fullname, definition in file_types.items():
+                if fullname not in named_types:
+                    references: typing.Set[str] = set()
+                    collect_references(definition, None, references)
+                    named_types[fullname] = (schema_path, definition, set(), references)
+                named_types[fullname][2].add(schema_path)
+
+        # the definitions are compared with the nested named types replaced by references
+        fullnames = set(named_types)
+        for schema_path, schema in schemas.items():
+            file_types = {}
+            serialization._collect_named_types(schema, None, file_types)
+
+            for fullname, definition in file_types.items():
+                defined_in, first_definition, _, _ = named_types[fullname]
+                other_names = fullnames - {fullname}
+                if serialization._reference_named_types(
+                    definition, None, other_names
+                ) != serialization._reference_named_types(first_definition, None, other_names):
+                    raise ValueError(f"{fullname} is defined in {defined_in} and {schema_path} with different schemas")
+
+        class_names: typing.Dict[str, str] = {}
+        for fullname, (_, definition, _, _) in named_types.items():
+            if definition["type"] == "fixed":
+                # fixed types are rendered inline
+                continue
+
+            class_name = stringcase.pascalcase(definition["name"].split(".")[-1])
+            other_fullname = class_names.setdefault(class_name, fullname)
+            if other_fullname != fullname:
+                raise ValueError(f"{other_fullname} and {fullname} are rendered with the same class name {class_name}")
+
+        return named_types
+
+    @staticmethod
+    def get_rendered_types(
+        *,
+        schema_path: str,
+        named_types: typing.Dict[str, typing.Tuple[str, JsonDict, typing.Set[str], typing.Set[str]]],
+    ) -> typing.Set[str]:
+        """
+        Returns the fullnames of the named types that the schema uses (also through other types)
+        and that are rendered from other files
+        """
+        rendered_types: typing.Set[str] = set()
+        pending = [fullname for fullname, (_, _, files, _) in named_types.items() if schema_path in files]
+
+        while pending:
+            fullname = pending.pop()
+            if fullname in rendered_types or fullname not in named_types:
+                continue
+
+            defined_in, _, files, references = named_types[fullname]
+            if defined_in != schema_path:
+                rendered_types.add(fullname)
+            pending.extend(references)
+
+        return rendered_types
+
+    def render_schemas(
+        self,
+        *,
+        schemas: typing.Dict[str, JsonDict],
+        named_types: typing.Dict[str, typing.Tuple[str, JsonDict, typing.Set[str], typing.Set[str]]],
+        pending: typing.List[str],
+        rendered: typing.Dict[str, JsonDict],
+    ) -> None:
+        """
+        Render the pending schemas and store the result in rendered
+        """
+        jobs: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+        for schema_path in pending:
+            rendered_types = self.get_rendered_types(schema_path=schema_path, named_types=named_types)
+            jobs[schema_path] = {
+                "schema": schemas[schema_path],
+                "base_class": self.base_class,
+                # only the types that the schema does not define itself, otherwise they are redefined
+                # during the validation
+                "named_schemas": {
+                    fullname: named_types[fullname][1]
+                    for fullname in rendered_types
+                    if schema_path not in named_types[fullname][2]
+                },
+                "rendered_types": sorted(rendered_types),
+            }
+
+        if self.max_workers == 1 or len(jobs) == 1:
+            results = {schema_path: render_schema(**job) for schema_path, job in jobs.items()}
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {schema_path: executor.submit(render_schema, **job) for schema_path, job in jobs.items()}
+                results = {schema_path: future.result() for schema_path, future in futures.items()}
+
+        for schema_path, result in results.items():
+            elapsed = result.pop("elapsed")
+            rendered[schema_path].update(result)
+            self.reports.append(SchemaReport(path=schema_path, elapsed=elapsed, cached=False))
+
+    @staticmethod
+    def render_module(
+        *, rendered: typing.List[typing.Tuple[str, JsonDict]], dependencies: typing.Dict[str, typing.Set[str]]
+    ) -> str:
+        """
+        Join the rendered schemas in one module. The code of each file goes after the code of the files
+        that define the types that it uses (dependencies), so the classes are defined before they are used.
+        """
+        rendered_by_path = dict(rendered)
+        ordered: typing.List[str] = []
+        visited: typing.Set[str] = set()
+
+        def visit(schema_path: str) -> None:
+            # the files that depend on each other are kept in path order
+            if schema_path in visited:
+                return
+            visited.add(schema_path)
+            for dependency in sorted(dependencies.get(schema_path, ())):
+                visit(dependency)
+            ordered.append(schema_path)
+
+        for schema_path, _ in rendered:
+            visit(schema_path)
+
+        imports: typing.Set[str] = set()
+        blocks: typing.List[str] = []
+        for schema_path in ordered:
+            result = rendered_by_path[schema_path]
+            imports.update(result["imports"])
+            # the enums and nested records go before the class that uses them
+            blocks.extend(result["extras"])
+            if result["classes"]:
+                blocks.append("\n" + result["classes"])
+
+        return (
+            templates.module_template.safe_substitute(
+                classes="",
+                imports=templates.imports_template.safe_substitute(imports="\n".join(sorted(imports))),
+                extras="".join(blocks),
+            ).strip("\n")
+            + "\n"
+        )
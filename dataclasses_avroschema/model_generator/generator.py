@@ -1,3 +1,4 @@
+import copy
 import enum
 import typing
 from dataclasses import dataclass, field
@@ -5,6 +6,7 @@ from string import Template
 
 import fastavro
 import stringcase
+from fastavro.schema import UnknownType
 
 from dataclasses_avroschema import field_utils, serialization
 from dataclasses_avroschema.types import JsonDict
@@ -50,6 +52,20 @@ class ModelGenerator:
     )
     # represent the decorator to add in the base class
     base_class_decotator: str = ""
+    # render the schemas as constants and encode/decode functions for each class
+    include_serializers: bool = False
+    # repository with the named types (records, enums and fixed) of all the schemas that were rendered
+    # by fullname, so a schema can reference the types of other schemas, also in different calls.
+    # parsed_named_types contains the same types parsed by fastavro, so each type is parsed once
+    named_types: typing.Dict[str, JsonDict] = field(default_factory=dict)
+    parsed_named_types: typing.Dict[str, JsonDict] = field(default_factory=dict)
+    # fullnames of the named types already rendered in the current module
+    rendered_types: typing.Set[str] = field(default_factory=set)
+    # namespace of the record that is being rendered
+    current_namespace: typing.Optional[str] = None
+    # classes with one-to-self-relationships in the current module, rendered as typing.Type
+    self_references: typing.Set[str] = field(default_factory=set, init=False, repr=False)
+    initial_imports: typing.Set[str] = field(default_factory=set, init=False, repr=False)
 
     def __post_init__(self) -> None:
         self.imports.add(self.base_class_to_imports[self.base_class])
@@ -60,6 +76,14 @@ class ModelGenerator:
         else:
             self.dataclass_field_template = templates.pydantic_field_template
 
+        if self.include_serializers and self.base_class == BaseClassEnum.PYDANTIC_MODEL.value:
+            raise ValueError(
+                f"include_serializers requires {BaseClassEnum.AVRO_MODEL.value} "
+                f"or {BaseClassEnum.AVRO_DANTIC_MODEL.value} as base class"
+            )
+
+        self.initial_imports = set(self.imports)
+
     @staticmethod
     def validate_schema(*, schema: JsonDict) -> None:
         """
@@ -67,6 +91,42 @@ class ModelGenerator:
         """
         fastavro.parse_schema(schema)
 
+    def add_schema(self, *, schema: JsonDict) -> None:
+        """
+        Validate the schema and add its named types to the repository.
+
+        The schema can reference the named types that are already in the repository, which
+        are not parsed again. A named type can be defined again only with the same schema.
+        """
+        named_types: typing.Dict[str, JsonDict] = {}
+        serialization._collect_named_types(schema, None, named_types)
+        known_types = set(self.named_types)
+
+        for fullname, definition in named_types.items():
+            if fullname in self.named_types:
+                other_names = known_types - {fullname}
+                if serialization._reference_named_types(
+                    definition, None, other_names
+                ) != serialization._reference_named_types(self.named_types[fullname], None, other_names):
+                    raise ValueError(f"{fullname} is already defined with a different schema")
+
+        # fastavro adds the new named types to parsed_named_types, so a copy is used in case that the schema is invalid
+        parsed_named_types = dict(self.parsed_named_types)
+        fastavro.parse_schema(
+            serialization._reference_named_types(schema, None, known_types), named_schemas=parsed_named_types
+        )
+        self.parsed_named_types = parsed_named_types
+
+        for fullname, definition in named_types.items():
+            # a copy because render_class sorts the fields of the schema
+            self.named_types.setdefault(fullname, copy.deepcopy(definition))
+
+    def get_fullname(self, *, schema: JsonDict) -> str:
+        return serialization._get_fullname(schema["name"], schema.get("namespace", self.current_namespace))
+
+    def is_rendered(self, *, schema: JsonDict) -> bool:
+        return self.get_fullname(schema=schema) in self.rendered_types
+
     def render_imports(self) -> str:
         """
         Render the imports needed for the python classes.
@@ -113,6 +173,10 @@ class ModelGenerator:
         """
         name: str = stringcase.pascalcase(schema["name"])
         record_fields: typing.List[JsonDict] = schema["fields"]
+        self.rendered_types.add(self.get_fullname(schema=schema))
+
+        enclosing_namespace = self.current_namespace
+        self.current_namespace = schema.get("namespace", enclosing_namespace)
 
         # Sort the fields according whether it has a default value
         record_fields.sort(key=lambda field: 1 if "default" in field.keys() or field_utils.NULL in field["type"] else 0)
@@ -129,6 +193,7 @@ class ModelGenerator:
         if class_metadata is not None:
             rendered_class += class_metadata
 
+        self.current_namespace = enclosing_namespace
         return rendered_class
 
     def render_dataclass_field(self, properties: str) -> str:
@@ -145,12 +210,44 @@ class ModelGenerator:
 
     def render_module(self, *, schemas: typing.List[JsonDict]) -> str:
         """
-        Render the module with the classes generated from the schemas
+        Render the module with the classes generated from the schemas.
+
+        The schemas can reference by name the named types of the schemas rendered before
+        by the same generator, and each class is rendered only once in the module.
         """
-        for schema in schemas:
-            self.validate_schema(schema=schema)
+        self.imports = set(self.initial_imports)
+        self.extras = []
+        self.rendered_types = set()
+        self.self_references = set()
+
+        # a schema can reference the named types of the schemas that are after it,
+        # so the schemas are added (and later parsed by the serializers) in dependency order
+        pending = schemas
+        added_schemas = []
+        while pending:
+            deferred = []
+            for schema in pending:
+                try:
+                    self.add_schema(schema=schema)
+                except UnknownType as error:
+                    unknown_type_error = error
+                    deferred.append(schema)
+                else:
+                    added_schemas.append(schema)
+
+            if len(deferred) == len(pending):
+                raise unknown_type_error
+            pending = deferred
+
+        # render_class sorts the fields, so a copy of the schemas is kept to encode with the original order
+        original_schemas = copy.deepcopy(added_schemas) if self.include_serializers else []
+        # a schema could have been rendered already if another schema contains it or references it
+        classes = "\n".join(
+            self.render_class(schema=schema) for schema in schemas if not self.is_rendered(schema=schema)
+        )
 
-        classes = "\n".join(self.render_class(schema=schema) for schema in schemas)
+        if self.include_serializers:
+            classes += self.render_serializers(schemas=original_schemas)
         imports = self.render_imports()
         extras = self.render_extras()
 
@@ -160,6 +257,72 @@ class ModelGenerator:
             extras=extras,
         ).lstrip("\n")
 
+    def render_serializers(self, *, schemas: typing.List[JsonDict]) -> str:
+        """
+        Render each schema as a module constant, parsed with fastavro when the module is imported,
+        and the functions to encode and decode each class with it. Then, the generated models
+        do not need to generate their schemas in order to be serialized.
+
+        The schemas are parsed in order with the same named schemas, so they can reference
+        the named types of the schemas before them.
+        """
+        self.imports.update(
+            {
+                "import fastavro",
+                "from dataclasses_avroschema import serialization",
+                "from dataclasses_avroschema import types",
+            }
+        )
+
+        if self.base_class == BaseClassEnum.AVRO_MODEL.value:
+            self.imports.update({"import dacite", "import enum"})
+            instance_template = templates.dacite_instance_template
+            # the records can reference themselves or the records defined after them, so all of them
+            # are forward references, like in AvroModel.config
+            record_names = [
+                stringcase.pascalcase(definition["name"])
+                for fullname, definition in self.named_types.items()
+                if definition["type"] == field_utils.RECORD and fullname in self.rendered_types
+            ]
+            forward_references = ", ".join(
+                templates.forward_reference_template.safe_substitute(name=name) for name in record_names
+            )
+            # dacite does not create the instances of typing.Type fields, so a hook creates them
+            type_hooks = ", ".join(
+                templates.type_hook_template.safe_substitute(name=name) for name in sorted(self.self_references)
+            )
+            rendered = [
+                templates.dacite_config_template.safe_substitute(
+                    forward_references=forward_references,
+                    type_hooks=f", type_hooks={{{type_hooks}}}" if type_hooks else "",
+                )
+            ]
+        else:
+            instance_template = templates.pydantic_instance_template
+            rendered = []
+
+        rendered.append(templates.NAMED_SCHEMAS_TEMPLATE)
+        for schema in schemas:
+            name = stringcase.pascalcase(schema["name"])
+            constant_name = stringcase.constcase(name)
+            parsed_name = f"{constant_name}_PARSED_SCHEMA"
+
+            rendered.append(
+                templates.schema_constant_template.safe_substitute(
+                    name=f"{constant_name}_SCHEMA", schema=repr(schema), parsed_name=parsed_name
+                )
+            )
+            rendered.append(
+                templates.serializers_template.safe_substitute(
+                    name=name,
+                    function_name=stringcase.snakecase(name),
+                    parsed_name=parsed_name,
+                    instance=instance_template.safe_substitute(name=name),
+                )
+            )
+
+        return "\n" + "".join(rendered)
+
     def render_field(self, field: JsonDict, model_name: str) -> str:
         """
         Render an avro field.
@@ -204,10 +367,12 @@ class ModelGenerator:
             is_complex_type = True
             language_type = self.parse_fixed(field=field)
         elif type == field_utils.RECORD:
-            record = f"\n{self.render_class(schema=field)}"
             is_complex_type = True
-            self.extras.append(record)
             language_type = stringcase.pascalcase(field["name"])
+
+            if not self.is_rendered(schema=field):
+                record = f"\n{self.render_class(schema=field)}"
+                self.extras.append(record)
         else:
             # Native field or Logical type using a native
             language_type = self.get_language_type(type=type)
@@ -393,6 +558,11 @@ class ModelGenerator:
 
         field_name: str = field["name"]
         enum_name = stringcase.pascalcase(field_name)
+
+        if self.is_rendered(schema=field):
+            return enum_name
+        self.rendered_types.add(self.get_fullname(schema=field))
+
         symbols = self.field_identation.join(
             [
                 templates.enum_symbol_template.safe_substitute(key=stringcase.uppercase(symbol), value=f'"{symbol}"')
@@ -428,12 +598,51 @@ class ModelGenerator:
 
         if type == model_name:
             # it means that it is a one-to-self-relationship
+            self.self_references.add(type)
             return templates.type_template.safe_substitute(type=type)
 
+        named_type = self.get_named_type(name=type)
+        if named_type is not None:
+            return self.render_named_type(schema=named_type, model_name=model_name)
+
         if default is not None:
             return str(avro_to_python_utils.AVRO_TYPE_TO_PYTHON.get(type, default))
         return str(avro_to_python_utils.AVRO_TYPE_TO_PYTHON.get(type, type))
 
+    def get_named_type(self, *, name: str) -> typing.Optional[JsonDict]:
+        """
+        Returns the definition of a named type from the repository using the reference name,
+        which can be the fullname or the name relative to the current namespace
+        """
+        if name in avro_to_python_utils.AVRO_TYPE_TO_PYTHON:
+            return None
+
+        named_type = self.named_types.get(serialization._get_fullname(name, self.current_namespace))
+        if named_type is None:
+            named_type = self.named_types.get(name)
+        return named_type
+
+    def render_named_type(self, *, schema: JsonDict, model_name: typing.Optional[str] = None) -> str:
+        """
+        Render a named type that is referenced by name. Records and enums are rendered only
+        if they were not rendered in the module yet, and fixed types are rendered inline
+        """
+        name = stringcase.pascalcase(schema["name"])
+
+        if schema["type"] == field_utils.FIXED:
+            return self.parse_fixed(field=schema)
+        elif name == model_name:
+            # a one-to-self-relationship using the fullname
+            self.self_references.add(name)
+            return templates.type_template.safe_substitute(type=name)
+        elif schema["type"] == field_utils.ENUM:
+            return self.parse_enum(field=schema)
+        elif not self.is_rendered(schema=schema):
+            # a copy because render_class sorts the fields and the repository keeps the original order
+            record = f"\n{self.render_class(schema=copy.deepcopy(schema))}"
+            self.extras.append(record)
+        return name
+
     def get_field_default(self, *, field_type: str, default: typing.Any, name: str) -> typing.Any:
         """
         Returns the default value according to the field type
@@ -47,6 +47,37 @@ $extras
 $classes
 """
 
+# the schemas are parsed in dependency order, so they can reference the named types of the schemas parsed before
+NAMED_SCHEMAS_TEMPLATE = """
+_NAMED_SCHEMAS: dict = {}
+"""
+
+SCHEMA_CONSTANT_TEMPLATE = """
+$name = $schema
+$parsed_name = fastavro.parse_schema($name, named_schemas=_NAMED_SCHEMAS)
+"""
+
+DACITE_CONFIG_TEMPLATE = """
+DACITE_CONFIG = dacite.Config(check_types=False, cast=[enum.Enum], forward_references={$forward_references}$type_hooks)
+"""
+FORWARD_REFERENCE_TEMPLATE = '"$name": $name'
+TYPE_HOOK_TEMPLATE = (
+    "typing.Type[$name]: lambda data: dacite.from_dict(data_class=$name, data=data, config=DACITE_CONFIG)"
+)
+
+SERIALIZERS_TEMPLATE = """
+
+def encode_$function_name(instance: $name, serialization_type: str = "avro") -> bytes:
+    return serialization.serialize(instance.asdict(), $parsed_name, serialization_type=serialization_type)
+
+
+def decode_$function_name(data: types.BytesLike, serialization_type: str = "avro") -> $name:
+    payload = serialization.deserialize(data, $parsed_name, serialization_type=serialization_type)
+    return $instance
+"""
+DACITE_INSTANCE_TEMPLATE = "dacite.from_dict(data_class=$name, data=payload, config=DACITE_CONFIG)"
+PYDANTIC_INSTANCE_TEMPLATE = "$name.parse_obj(payload)"
+
 # Pydanntic specific
 PYDANTIC_FIELD = "Field($properties)"
 PYDANTIC_DECIMAL_TYPE_TEMPLATE = "condecimal(max_digits=$precision, decimal_places=$scale)"
@@ -75,5 +106,12 @@ time_template = Template(TIME_TEMPLATE)
 time_micros_template = Template(TIME_MICROS_TEMPLATE)
 datetime_template = Template(DATETIME_TEMPLATE)
 datetime_micros_template = Template(DATETIME_MICROS_TEMPLATE)
+schema_constant_template = Template(SCHEMA_CONSTANT_TEMPLATE)
+dacite_config_template = Template(DACITE_CONFIG_TEMPLATE)
+forward_reference_template = Template(FORWARD_REFERENCE_TEMPLATE)
+type_hook_template = Template(TYPE_HOOK_TEMPLATE)
+serializers_template = Template(SERIALIZERS_TEMPLATE)
+dacite_instance_template = Template(DACITE_INSTANCE_TEMPLATE)
+pydantic_instance_template = Template(PYDANTIC_INSTANCE_TEMPLATE)
 imports_template = Template(IMPORTS_TEMPLATE.strip())
 module_template = Template(MODULE_TEMPLATE.strip())
@@ -0,0 +1,239 @@
+import atexit
+import dataclasses
+import enum
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+import typing
+
+from . import utils
+from .types import JsonDict
+
+# Increase it when the content of the entries changes, so old cache files are not used
+CACHE_VERSION = 2
+
+# keys that an entry must have to be used
+ENTRY_KEYS = ("hash", "schema", "fingerprints", "parsed_schema", "features", "enum_fields")
+
+_active_cache: typing.Optional["SchemaCache"] = None
+
+
+def get_library_version() -> str:
+    try:
+        from importlib.metadata import version
+
+        return version("dataclasses-avroschema")
+    except ImportError:
+        # python 3.7 or the package is not installed
+        return "unknown"
+
+
+def get_model_key(model: type) -> str:
+    return f"{model.__module__}:{model.__qualname__}"
+
+
+def get_definition_hash(model: type) -> str:
+    """
+    Returns a hash of everything that the schema of the model is rendered from: the fields
+    (name, type, default and metadata), the Meta class and the docstring of the model and of
+    the records and enums that it uses, together with the library version.
+    """
+    description = [CACHE_VERSION, get_library_version(), _Describer().describe(model)]
+    return hashlib.sha256(json.dumps(description).encode()).hexdigest()
+
+
+def enable(path: typing.Union[str, os.PathLike]) -> "SchemaCache":
+    """
+    Use the schema cache stored in path for all the models. The entries created while
+    it is enabled are saved when the process ends, or with `SchemaCache.save`.
+    """
+    global _active_cache
+
+    _active_cache = SchemaCache(path)
+    atexit.register(_active_cache.save)
+    return _active_cache
+
+
+def disable() -> None:
+    global _active_cache
+
+    if _active_cache is not None:
+        atexit.unregister(_active_cache.save)
+        _active_cache.save()
+    _active_cache = None
+
+
+def get_active() -> typing.Optional["SchemaCache"]:
+    return _active_cache
+
+
+class SchemaCache:
+    """
+    Persistent cache of the rendered schema, the fingerprints, the parsed schema of models
+    and what the first serialization needs (the features of the schema and the fields with enums),
+    so a new process does not render them again.
+
+    The entries are stored by model module and qualified name together with the hash of the
+    model definition (see `get_definition_hash`). An entry is only used when its hash is the
+    hash of the current definition, otherwise the model is rendered and the entry replaced.
+
+    Attributes:
+        path: json file where the entries are stored
+        entries: the entries by model key
+    """
+
+    def __init__(self, path: typing.Union[str, os.PathLike]) -> None:
+        self.path = path
+        self.entries = self.load()
+        self.dirty = False
+
+    def load(self) -> typing.Dict[str, JsonDict]:
+        """
+        Returns the entries stored in the file. A file that can not be read, that was
+        created with a different cache format or library version is ignored
+        """
+        try:
+            with open(self.path) as cache_file:
+                cache = json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+
+        if (
+            not isinstance(cache, dict)
+            or cache.get("version") != CACHE_VERSION
+            or cache.get("library_version") != get_library_version()
+            or not isinstance(cache.get("models"), dict)
+        ):
+            return {}
+
+        return {
+            key: entry
+            for key, entry in cache["models"].items()
+            if isinstance(entry, dict) and all(entry_key in entry for entry_key in ENTRY_KEYS)
+        }
+
+    def get(self, model: type, definition_hash: str) -> typing.Optional[JsonDict]:
+        """
+        Returns the entry of the model when it was created from the same definition
+        """
+        entry = self.entries.get(get_model_key(model))
+        if entry is None or entry["hash"] != definition_hash:
+            return None
+        return entry
+
+    def set(self, model: type, entry: JsonDict) -> None:
+        self.entries[get_model_key(model)] = entry
+        self.dirty = True
+
+    def save(self) -> None:
+        """
+        Write the entries in the file when there are new ones. The entries that other processes
+        saved in the meantime are kept, and the file is replaced atomically.
+        """
+        if not self.dirty:
+            return
+
+        entries = self.load()
+        entries.update(self.entries)
+        cache = {"version": CACHE_VERSION, "library_version": get_library_version(), "models": entries}
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        file_descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, mode="w") as cache_file:
+                json.dump(cache, cache_file)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+        self.dirty = False
+
+
+class _Describer:
+    """
+    Builds a json description of the definition of a model, including the
+    records and enums used by its fields, that is stable between processes
+    """
+
+    def __init__(self) -> None:
+        self.seen: typing.Set[int] = set()
+
+    def describe(self, value: typing.Any) -> typing.Any:
+        if value is None or isinstance(value, (str, int, float, bool)):
+            return value
+        elif value is dataclasses.MISSING:
+            return "MISSING"
+        elif isinstance(value, enum.Enum):
+            return f"{type(value).__qualname__}.{value.name}"
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            return [self.describe(item) for item in value]
+        elif isinstance(value, dict):
+            return [[self.describe(key), self.describe(item)] for key, item in value.items()]
+        elif inspect.isclass(value):
+            return self.describe_class(value)
+        elif hasattr(value, "__origin__") or hasattr(value, "__args__"):
+            # typing constructions, the arguments can be records or enums
+            return [repr(value), [self.describe(arg) for arg in getattr(value, "__args__", ())]]
+        elif callable(value) and hasattr(value, "__qualname__"):
+            # for example a default_factory. The code is included because lambdas have the same name
+            code = getattr(value, "__code__", None)
+            if code is None:
+                return f"{value.__module__}.{value.__qualname__}"
+            constants = [constant for constant in code.co_consts if isinstance(constant, (str, int, float, bool))]
+            return [f"{value.__module__}.{value.__qualname__}", code.co_code.hex(), constants]
+        elif hasattr(value, "__dict__") and id(value) not in self.seen:
+            # for example the types.Decimal and types.Fixed defaults, their repr is not complete
+            self.seen.add(id(value))
+            return [type(value).__qualname__, self.describe(vars(value))]
+        return repr(value)
+
+    def describe_class(self, klass: type) -> typing.Any:
+        name = f"{klass.__module__}.{klass.__qualname__}"
+        if id(klass) in self.seen:
+            return name
+        elif issubclass(klass, enum.Enum):
+            self.seen.add(id(klass))
+            return [name, klass.__doc__, [[member.name, self.describe_meta(member.value)] for member in klass]]
+        elif not (
+            dataclasses.is_dataclass(klass) or utils.is_pydantic_model(klass) or hasattr(klass, "generate_dataclass")
+        ):
+            return name
+
+        self.seen.add(id(klass))
+        return [name, klass.__doc__, self.describe_meta(getattr(klass, "Meta", None)), self.describe_fields(klass)]
+
+    def describe_meta(self, meta: typing.Any) -> typing.Any:
+        if not inspect.isclass(meta):
+            return self.describe(meta)
+        return [[key, self.describe(value)] for key, value in vars(meta).items() if not key.startswith("__")]
+
+    def describe_fields(self, klass: typing.Any) -> typing.Any:
+        if utils.is_pydantic_model(klass):
+            return [
+                [
+                    model_field.name,
+                    self.describe(model_field.annotation),
+                    model_field.required,
+                    self.describe(model_field.default),
+                    self.describe(model_field.default_factory),
+                ]
+                for model_field in klass.__fields__.values()
+            ]
+
+        if not dataclasses.is_dataclass(klass):
+            # AvroModel classes that are not decorated become dataclasses when the schema is generated
+            klass = klass.generate_dataclass()
+
+        return [
+            [
+                dataclass_field.name,
+                self.describe(dataclass_field.type),
+                self.describe(dataclass_field.default),
+                self.describe(dataclass_field.default_factory),
+                self.describe(dict(dataclass_field.metadata)),
+            ]
+            for dataclass_field in dataclasses.fields(klass)
+        ]
@@ -54,6 +54,11 @@ class AvroSchemaDefinition(BaseSchemaDefinition):
     def __post_init__(self) -> None:
         self.fields = self.parse_dataclasses_fields()
 
+        if self.metadata.field_order is not None:
+            # the fields that are not in field_order keep their order after the others
+            positions = {name: position for position, name in enumerate(self.metadata.field_order)}
+            self.fields.sort(key=lambda field: positions.get(field.name, len(positions)))
+
     def parse_dataclasses_fields(self) -> typing.List[FieldType]:
         if utils.is_faust_model(self.klass):
             return self.parse_faust_fields()
@@ -3,17 +3,44 @@ import enum
 import inspect
 import json
 from collections import OrderedDict
-from typing import Any, Dict, List, Optional, Set, Type, TypeVar, Union
-
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_type_hints,
+)
+
+import fastavro
 from dacite import Config, from_dict
 from fastavro.validation import validate
 
-from . import case
-from .fields import EnumField, FieldType, RecordField, UnionField
+from . import case, compatibility, iterative, schema_cache, schema_ir, serialization, union_tags
+from .exceptions import DecodeLimitExceeded
+from .fields import EnumField, FieldType, RecordField, SelfReferenceField, UnionField
+from .lazy import LazyRecord
+from .limits import DecodeLimits, PayloadChecker
 from .schema_definition import AvroSchemaDefinition
-from .serialization import deserialize, serialize, to_json
-from .types import Decimal, Fixed, JsonDict
-from .utils import SchemaMetadata, is_dataclass_or_pydantic_model
+from .serialization import (
+    deserialize,
+    deserialize_many,
+    load_jsonl,
+    serialize,
+    serialize_into,
+    serialize_many,
+)
+from .types import BytesLike, Decimal, Fixed, JsonDict
+from .utils import SchemaMetadata, is_dataclass_or_pydantic_model, is_typed_array
 
 AVRO = "avro"
 AVRO_JSON = "avro-json"
@@ -69,10 +96,20 @@ class AvroModel:
     def avro_schema(cls: Type[CT], case_type: Optional[str] = None) -> str:
         avro_schema = cls.generate_schema(schema_type=AVRO)
 
-        if case_type is not None:
-            avro_schema = case.case_record(cls.rendered_schema, case_type)  # type: ignore
+        if case_type is None:
+            return json.dumps(avro_schema)
+
+        # Each case variant is rendered only once. The cache entry is valid
+        # while the rendered schema that it was created from is the current one
+        class_cache = cls._get_class_cache()
+        key = ("case", case_type)
+        rendered_schema, cased_schema = class_cache.get(key, (None, None))
+
+        if rendered_schema is not avro_schema:
+            cased_schema = json.dumps(case.case_record(avro_schema, case_type))  # type: ignore
+            class_cache[key] = (avro_schema, cased_schema)
 
-        return json.dumps(avro_schema)
+        return cased_schema  # type: ignore
 
     @classmethod
     def avro_schema_to_python(cls: Type[CT], parent: Optional["AvroModel"] = None) -> Dict[str, Any]:
@@ -90,7 +127,17 @@ class AvroModel:
             # After generating the A.avro_schema the parent of B is A,
             # if we want to do B.avro_schema (now B is the root)
             # B should clean the data that was only valid when it was the child
-            cls._reset_schema_definition()
+            #
+            # The schema of the root is rendered only once (or taken from the schema cache)
+            class_cache = cls._get_class_cache()
+
+            if "avro_schema" not in class_cache:
+                cls._reset_schema_definition()
+                persisted_entry = cls._get_persisted_entry()
+                class_cache["avro_schema"] = (
+                    persisted_entry["schema"] if persisted_entry is not None else cls.avro_schema()
+                )
+            return json.loads(class_cache["avro_schema"])
 
         return json.loads(cls.avro_schema())
 
@@ -100,18 +147,80 @@ class AvroModel:
             cls.generate_schema()
         return cls.schema_def.fields  # type: ignore
 
+    @classmethod
+    def _has_self_reference(cls: Type[CT]) -> bool:
+        return any(isinstance(field, SelfReferenceField) for field in cls.get_fields())
+
     @classmethod
     def _get_enum_type_map(cls: Type[CT]) -> Dict[str, enum.EnumMeta]:
-        enum_types = {}
+        class_cache = cls._get_class_cache()
+        if "enum_type_map" in class_cache:
+            return class_cache["enum_type_map"]
+
+        persisted_entry = cls._get_persisted_entry()
+        enum_types = cls._resolve_enum_fields(persisted_entry["enum_fields"]) if persisted_entry is not None else None
+
+        if enum_types is None:
+            enum_types = {}
+            for field_type in cls.get_fields():
+                if isinstance(field_type, EnumField):
+                    enum_types[field_type.name] = field_type.type
+                elif isinstance(field_type, UnionField):
+                    for sub_type in field_type.type.__args__:
+                        if inspect.isclass(sub_type) and issubclass(sub_type, enum.Enum):
+                            enum_types[field_type.name] = sub_type
+                elif isinstance(field_type, RecordField):
+                    enum_types.update(field_type.type._get_enum_type_map())
+
+        class_cache["enum_type_map"] = enum_types
+        return enum_types
+
+    @classmethod
+    def _get_enum_fields(cls: Type[CT]) -> Dict[str, str]:
+        """
+        Returns the names of the fields that the enum type map is built from, to store them in
+        the schema cache: `enum` for the fields with enums and `record` for the records with them
+        """
+        enum_fields = {}
         for field_type in cls.get_fields():
-            if isinstance(field_type, EnumField):
-                enum_types[field_type.name] = field_type.type
-            elif isinstance(field_type, UnionField):
-                for sub_type in field_type.type.__args__:
+            if isinstance(field_type, EnumField) or (
+                isinstance(field_type, UnionField)
+                and any(
+                    inspect.isclass(sub_type) and issubclass(sub_type, enum.Enum)
+                    for sub_type in field_type.type.__args__
+                )
+            ):
+                enum_fields[field_type.name] = "enum"
+            elif isinstance(field_type, RecordField) and field_type.type._get_enum_type_map():
+                enum_fields[field_type.name] = "record"
+        return enum_fields
+
+    @classmethod
+    def _resolve_enum_fields(cls: Type[CT], enum_fields: Dict[str, str]) -> Optional[Dict[str, enum.EnumMeta]]:
+        """
+        Returns the enum type map of the fields stored in the schema cache, with the enums taken
+        from the type hints of the class so its fields are not created.
+        None when the type hints can not be resolved.
+        """
+        try:
+            type_hints = get_type_hints(cls)
+        except (NameError, TypeError):
+            return None
+
+        enum_types = {}
+        for name, kind in enum_fields.items():
+            if name not in type_hints:
+                return None
+
+            type_hint = type_hints[name]
+            if kind == "record":
+                enum_types.update(type_hint._get_enum_type_map())
+            elif inspect.isclass(type_hint) and issubclass(type_hint, enum.Enum):
+                enum_types[name] = type_hint
+            else:
+                for sub_type in getattr(type_hint, "__args__", ()):
                     if inspect.isclass(sub_type) and issubclass(sub_type, enum.Enum):
-                        enum_types[field_type.name] = sub_type
-            elif isinstance(field_type, RecordField):
-                enum_types.update(field_type.type._get_enum_type_map())
+                        enum_types[name] = sub_type
         return enum_types
 
     @classmethod
@@ -131,6 +240,195 @@ class AvroModel:
                 output[field] = value
         return output
 
+    @classmethod
+    def _get_class_cache(cls: Type[CT]) -> Dict[Any, Any]:
+        """
+        Returns the cache of the class. The cache is stored in the class itself
+        so subclasses never share it with their parents.
+        """
+        if "_class_cache" not in cls.__dict__:
+            cls._class_cache = {}  # type: ignore
+        return cls.__dict__["_class_cache"]
+
+    @classmethod
+    def get_projected_schema(cls: Type[CT], fields: Sequence[str]) -> JsonDict:
+        """
+        Returns the parsed avro schema that contains only the fields provided.
+        The result is cached by class and set of fields.
+        """
+        class_cache = cls._get_class_cache()
+        key = ("projection", frozenset(fields))
+
+        if key not in class_cache:
+            schema = serialization.project_schema(cls.avro_schema_to_python(), fields)
+            class_cache[key] = fastavro.parse_schema(schema)
+        return class_cache[key]
+
+    @classmethod
+    def get_schema_ir(cls: Type[CT]) -> schema_ir.RecordNode:
+        """
+        Returns the intermediate representation of the avro schema: immutable and hashable
+        nodes, where the repeated types are shared. The result is cached per class.
+
+        The IR is built from the rendered schema and it is used for what compares or walks
+        schemas: the canonical form, the fingerprints, the compatibility checks and the record codec.
+        The schema and the parsed schema are not derived from it.
+        """
+        class_cache = cls._get_class_cache()
+
+        if "schema_ir" not in class_cache:
+            class_cache["schema_ir"] = schema_ir.build(cls.avro_schema_to_python())
+        return class_cache["schema_ir"]
+
+    @classmethod
+    def get_fingerprint(cls: Type[CT], algorithm: str = "CRC-64-AVRO") -> str:
+        """
+        Returns the fingerprint of the Parsing Canonical Form of the avro schema,
+        as a hex string. The result is cached per class and algorithm.
+
+        Attributes:
+            algorithm: `CRC-64-AVRO` (the Rabin fingerprint), `MD5`, `SHA-256` or any `hashlib` algorithm
+        """
+        class_cache = cls._get_class_cache()
+        key = ("fingerprint", algorithm)
+
+        if key not in class_cache:
+            persisted_entry = cls._get_persisted_entry()
+
+            if persisted_entry is not None and algorithm in persisted_entry["fingerprints"]:
+                class_cache[key] = persisted_entry["fingerprints"][algorithm]
+            else:
+                class_cache[key] = schema_ir.fingerprint(cls.get_schema_ir(), algorithm)
+
+                if persisted_entry is not None:
+                    persisted_entry["fingerprints"][algorithm] = class_cache[key]
+                    schema_cache.get_active().set(cls, persisted_entry)  # type: ignore
+        return class_cache[key]
+
+    @classmethod
+    def is_compatible(cls: Type[CT], other: Type["AvroModel"], mode: str = compatibility.BACKWARD) -> bool:
+        """
+        Whether the schema of the class (the new version) is compatible with the schema of other
+        (the old version), checked statically with the avro schema resolution rules.
+        The result is cached per pair of classes and mode.
+
+        Attributes:
+            other: the AvroModel to compare with
+            mode: `backward` (the class reads data of other), `forward` (other reads data of the class)
+                or `full` (both)
+        """
+        class_cache = cls._get_class_cache()
+        key = ("compatibility", other, mode)
+
+        if key not in class_cache:
+            class_cache[key] = compatibility.is_compatible(cls.get_schema_ir(), other.get_schema_ir(), mode=mode)
+        return class_cache[key]
+
+    @classmethod
+    def get_parsed_schema(cls: Type[CT]) -> JsonDict:
+        """
+        Returns the avro schema of the class parsed by fastavro, so it can be used
+        to encode and decode without parsing it again. The result is cached per class.
+        """
+        class_cache = cls._get_class_cache()
+
+        if "parsed_schema" not in class_cache:
+            persisted_entry = cls._get_persisted_entry()
+
+            if persisted_entry is not None:
+                class_cache["parsed_schema"] = persisted_entry["parsed_schema"]
+            else:
+                class_cache["parsed_schema"] = fastavro.parse_schema(cls.avro_schema_to_python())
+        return class_cache["parsed_schema"]
+
+    @classmethod
+    def warmup(cls: Type[CT]) -> None:
+        """
+        Build everything that is cached per class and otherwise created on the first use:
+        the schema, the parsed schema, the fingerprint and the plans to encode and decode.
+        See `dataclasses_avroschema.warmup` to warm up many models.
+        """
+        cls.avro_schema_to_python()
+        cls.get_fields()
+        cls.get_parsed_schema()
+        cls.get_fingerprint()
+        cls._get_enum_type_map()
+        cls._get_union_tagger()
+        cls._get_union_resolver()
+        cls._get_record_codec()
+        cls.get_json_plan()
+        cls.config()
+
+        if cls._get_decode_limits() is not None:
+            cls._get_payload_checker()
+
+    @classmethod
+    def _get_persisted_entry(cls: Type[CT]) -> Optional[JsonDict]:
+        """
+        Returns the entry of the class in the schema cache when it is enabled (`schema_cache.enable`).
+        If the cache does not have an entry for the current definition of the class,
+        the schema is rendered and the entry is created. The result is cached per class.
+        """
+        persistent_cache = schema_cache.get_active()
+        if persistent_cache is None:
+            return None
+
+        class_cache = cls._get_class_cache()
+        if "persisted_entry" not in class_cache:
+            definition_hash = schema_cache.get_definition_hash(cls)
+            entry = persistent_cache.get(cls, definition_hash)
+
+            if entry is None:
+                cls._reset_schema_definition()
+                schema = cls.avro_schema()
+                python_schema = json.loads(schema)
+                node: schema_ir.RecordNode = schema_ir.build(python_schema)  # type: ignore
+                entry = {
+                    "hash": definition_hash,
+                    "schema": schema,
+                    "fingerprints": {"CRC-64-AVRO": schema_ir.fingerprint(node)},
+                    "parsed_schema": fastavro.parse_schema(python_schema),
+                    "features": {
+                        **iterative.RecordCodec.get_features(node),
+                        "named_unions": schema_ir.has_named_unions(node),
+                    },
+                    "enum_fields": cls._get_enum_fields(),
+                }
+                persistent_cache.set(cls, entry)
+
+            class_cache["persisted_entry"] = entry
+        return class_cache["persisted_entry"]
+
+    @classmethod
+    def _lacks_feature(cls: Type[CT], feature: str) -> bool:
+        """
+        Whether the entry of the class in the schema cache says that its schema does not have
+        the feature, so what is built for it can be skipped without rendering the schema
+        """
+        persisted_entry = cls._get_persisted_entry()
+        return persisted_entry is not None and not persisted_entry["features"][feature]
+
+    @classmethod
+    def _get_case_mapping(cls: Type[CT], case_type: str) -> Tuple[JsonDict, case.FieldsMapping, case.FieldsMapping]:
+        """
+        Returns the parsed schema of the case and the mappings to rename the fields
+        from the model to the case and from the case to the model.
+        The result is cached per class and case.
+        """
+        class_cache = cls._get_class_cache()
+        key = ("case_mapping", case_type)
+
+        if key not in class_cache:
+            schema = cls.avro_schema_to_python()
+            case_schema = case.case_record(schema, case_type)
+
+            class_cache[key] = (
+                fastavro.parse_schema(case_schema),
+                case.FieldsMapping(schema, case_schema),
+                case.FieldsMapping(case_schema, schema),
+            )
+        return class_cache[key]
+
     @classmethod
     def _reset_schema_definition(cls: Type[CT]) -> None:
         """
@@ -148,6 +446,8 @@ class AvroModel:
             return {k: AvroModel.standardize_custom_type(v) for k, v in value.items()}
         elif isinstance(value, (list, tuple)):
             return [AvroModel.standardize_custom_type(v) for v in value]
+        elif is_typed_array(value):
+            return value.tolist()
         elif issubclass(type(value), enum.Enum):
             return value.value
         return value
@@ -157,32 +457,372 @@ class AvroModel:
             self, dict_factory=lambda x: {key: self.standardize_custom_type(value) for key, value in x}
         )
 
-    def serialize(self, serialization_type: str = AVRO) -> bytes:
-        schema = self.avro_schema_to_python()
+    def _get_avro_payload(self) -> JsonDict:
+        """
+        Returns the payload to encode: the asdict representation where the values of unions
+        of records and enums are tagged with their branch, as `(name, value)` tuples
+        """
+        payload = self.asdict()
+        tagger = self._get_union_tagger()
+        return payload if tagger is None else tagger(self, payload)
 
-        return serialize(self.asdict(), schema, serialization_type=serialization_type)
+    @classmethod
+    def _get_union_tagger(cls: Type[CT]) -> Optional[union_tags.PayloadTagger]:
+        class_cache = cls._get_class_cache()
+
+        if "union_tagger" not in class_cache:
+            if cls._lacks_feature("named_unions"):
+                class_cache["union_tagger"] = None
+            else:
+                schema = cls.avro_schema_to_python()
+                # the fields of the schema definition are the ones that rendered the schema
+                class_cache["union_tagger"] = union_tags.get_record_tagger(cls.get_fields(), schema)
+        return class_cache["union_tagger"]
+
+    def serialize(self, serialization_type: str = AVRO, case_type: Optional[str] = None) -> bytes:
+        """
+        Serialize the instance.
+
+        Attributes:
+            case_type: Optional case to apply to the field names, for example `case.CAMELCASE`.
+                The data is encoded with the schema of the case and its field names are renamed
+                accordingly, including nested records, arrays and maps.
+        """
+        if case_type is not None:
+            case_schema, to_case, _ = self._get_case_mapping(case_type)
+            return serialize(to_case(self.asdict()), case_schema, serialization_type=serialization_type)
+
+        record_codec = self._get_record_codec()
+        if record_codec is not None and serialization_type == AVRO:
+            return record_codec.encode(self)
+
+        schema = self.get_parsed_schema()
+
+        return serialize(self._get_avro_payload(), schema, serialization_type=serialization_type)
+
+    def serialize_into(
+        self, buffer: Union[bytearray, memoryview], offset: int = 0, serialization_type: str = AVRO
+    ) -> int:
+        """
+        Serialize the instance and write the result into the caller's preallocated buffer
+        starting at offset, instead of returning a new bytes object.
+
+        Returns:
+            int: the number of bytes written
+        """
+        record_codec = self._get_record_codec()
+        if record_codec is not None and serialization_type == AVRO:
+            return serialization.BufferWriter(buffer, offset=offset).write(record_codec.encode(self))
+
+        schema = self.get_parsed_schema()
+
+        return serialize_into(
+            self._get_avro_payload(), schema, buffer, offset=offset, serialization_type=serialization_type
+        )
+
+    @classmethod
+    def serialize_many(cls: Type[CT], instances: Iterable[CT], serialization_type: str = AVRO) -> bytes:
+        """
+        Serialize many instances at once, parsing the schema only once.
+
+        With `avro` the records are concatenated and with `avro-json` the result is
+        JSON Lines, one record per line. Use `deserialize_many` to decode it.
+        """
+        record_codec = cls._get_record_codec()
+        if record_codec is not None and serialization_type == AVRO:
+            return b"".join(record_codec.encode(instance) for instance in instances)
+
+        schema = cls.get_parsed_schema()
+
+        return serialize_many(
+            (instance._get_avro_payload() for instance in instances), schema, serialization_type=serialization_type
+        )
 
     @classmethod
     def deserialize(
         cls: Type[CT],
-        data: bytes,
+        data: BytesLike,
         serialization_type: str = AVRO,
         create_instance: bool = True,
         writer_schema: Optional[Union[JsonDict, Type[CT]]] = None,
-    ) -> Union[JsonDict, CT]:
+        fields: Optional[Sequence[str]] = None,
+        lazy: bool = False,
+        case_type: Optional[str] = None,
+        limits: Optional[DecodeLimits] = None,
+    ) -> Union[JsonDict, CT, LazyRecord]:
+        """
+        Deserialize data into a new instance or a python dict.
+
+        Attributes:
+            fields: Optional list of field names to decode. When it is provided the payload is decoded
+                with a reader schema that contains only these fields, so the rest of the fields are
+                skipped instead of decoded, and the result is always a partial python dict.
+            lazy: If True a read-only `LazyRecord` backed by data is returned. Each field is decoded
+                on its first access, nested records are python dicts. Only available with `avro` serialization
+                and it can not be combined with `fields`, `case_type` or `create_instance=False`.
+            case_type: Optional case used to serialize the data, for example `case.CAMELCASE`.
+                The field names are renamed back to the model field names.
+            limits: Optional `DecodeLimits` of the payload, by default the `decode_limits` of `class Meta`.
+                `DecodeLimitExceeded` is raised when the payload exceeds them.
+        """
         if inspect.isclass(writer_schema) and issubclass(writer_schema, AvroModel):
             # mypy does not undersdtand redefinitions
             writer_schema: JsonDict = writer_schema.avro_schema_to_python()  # type: ignore
 
-        schema = cls.avro_schema_to_python()
+        cls._check_decode_limits(data, serialization_type, writer_schema, limits)  # type: ignore
+
+        if lazy:
+            if serialization_type != AVRO:
+                raise ValueError(f"Lazy deserialization is only supported with {AVRO} serialization type")
+            if case_type is not None:
+                raise ValueError("Lazy deserialization does not support case_type")
+            if fields is not None:
+                raise ValueError("Lazy deserialization does not support fields, only the fields accessed are decoded")
+            if not create_instance:
+                raise ValueError(
+                    "Lazy deserialization does not support create_instance, the fields are always python values"
+                )
+            return LazyRecord(cls, data, writer_schema=writer_schema)  # type: ignore
+
+        record_codec = cls._get_record_codec()
+        if (
+            record_codec is not None
+            and record_codec.decodes
+            and cls._use_record_codec(serialization_type, writer_schema, fields, case_type)
+        ):
+            record, _ = record_codec.decode(data, create_instance=create_instance)
+            return record
+
+        if case_type is not None:
+            case_schema, _, from_case = cls._get_case_mapping(case_type)
+            payload = deserialize(
+                data, case_schema, serialization_type=serialization_type, writer_schema=writer_schema  # type: ignore
+            )
+            return cls._payload_to_output(from_case(payload), create_instance=create_instance, fields=fields)
+
+        return_record_name = cls._return_record_name(create_instance, writer_schema, fields)  # type: ignore
+        reader_schema, writer_schema = cls._get_deserialization_schemas(
+            serialization_type, writer_schema, fields  # type: ignore
+        )
         payload = deserialize(
-            data, schema, serialization_type=serialization_type, writer_schema=writer_schema  # type: ignore
+            data,
+            reader_schema,
+            serialization_type=serialization_type,
+            writer_schema=writer_schema,
+            return_record_name=return_record_name,
         )
-        output = cls._deserialize_complex_types(payload)
 
-        if create_instance:
-            return cls.parse_obj(data=output)
-        return output
+        return cls._payload_to_output(payload, create_instance=create_instance, fields=fields)
+
+    @classmethod
+    def deserialize_many(
+        cls: Type[CT],
+        data: BytesLike,
+        serialization_type: str = AVRO,
+        create_instance: bool = True,
+        writer_schema: Optional[Union[JsonDict, Type[CT]]] = None,
+        fields: Optional[Sequence[str]] = None,
+        limits: Optional[DecodeLimits] = None,
+    ) -> List[Union[JsonDict, CT]]:
+        """
+        Deserialize data created with `serialize_many`. The schemas are parsed only once for all the records.
+        The attributes have the same meaning as in `deserialize`, `limits.max_bytes` applies to the whole data.
+        """
+        if inspect.isclass(writer_schema) and issubclass(writer_schema, AvroModel):
+            writer_schema: JsonDict = writer_schema.avro_schema_to_python()  # type: ignore
+
+        cls._check_decode_limits(data, serialization_type, writer_schema, limits, many=True)  # type: ignore
+
+        record_codec = cls._get_record_codec()
+        if (
+            record_codec is not None
+            and record_codec.decodes
+            and cls._use_record_codec(serialization_type, writer_schema, fields, None)
+        ):
+            records = []
+            offset = 0
+            while offset < len(data):
+                record, offset = record_codec.decode(data, offset=offset, create_instance=create_instance)
+                records.append(record)
+            return records
+
+        return_record_name = cls._return_record_name(create_instance, writer_schema, fields)  # type: ignore
+        reader_schema, writer_schema = cls._get_deserialization_schemas(
+            serialization_type, writer_schema, fields  # type: ignore
+        )
+        payloads = deserialize_many(
+            data,
+            reader_schema,
+            serialization_type=serialization_type,
+            writer_schema=writer_schema,
+            return_record_name=return_record_name,
+        )
+
+        return [cls._payload_to_output(payload, create_instance=create_instance, fields=fields) for payload in payloads]
+
+    @classmethod
+    def load_jsonl(cls: Type[CT], fileobj: IO, create_instance: bool = True) -> Iterator[Union[JsonDict, CT]]:
+        """
+        Iterate over the records of a JSON Lines file object that contains `avro-json` records,
+        for example created with `serialize_many(serialization_type="avro-json")`.
+        The records are streamed, so the file is never loaded completely in memory.
+        """
+        schema = cls.get_parsed_schema()
+
+        for payload in load_jsonl(fileobj, schema):
+            yield cls._payload_to_output(payload, create_instance=create_instance)
+
+    @classmethod
+    def _check_decode_limits(
+        cls: Type[CT],
+        data: BytesLike,
+        serialization_type: str,
+        writer_schema: Optional[JsonDict],
+        limits: Optional[DecodeLimits],
+        many: bool = False,
+    ) -> None:
+        """
+        Raise DecodeLimitExceeded when data exceeds the limits, by default the ones of `class Meta`
+        """
+        if limits is None:
+            limits = cls._get_decode_limits()
+            if limits is None:
+                return
+
+        if serialization_type != AVRO:
+            # json payloads do not have lengths that can claim more than their size
+            if limits.max_bytes is not None and len(data) > limits.max_bytes:
+                raise DecodeLimitExceeded("max_bytes", len(data), limits.max_bytes)
+            return
+
+        cls._get_payload_checker(writer_schema).check(data, limits, many=many)
+
+    @classmethod
+    def _get_decode_limits(cls: Type[CT]) -> Optional[DecodeLimits]:
+        class_cache = cls._get_class_cache()
+
+        if "decode_limits" not in class_cache:
+            class_cache["decode_limits"] = SchemaMetadata.create(getattr(cls, "Meta", type)).decode_limits
+        return class_cache["decode_limits"]
+
+    @classmethod
+    def _get_payload_checker(cls: Type[CT], writer_schema: Optional[JsonDict] = None) -> PayloadChecker:
+        """
+        Returns the checker of the decode limits of the payloads of the class, or of the payloads
+        written with writer_schema. The checkers are cached per class, the ones of the writer schemas
+        by the fingerprint of their Parsing Canonical Form, which has all that the checker uses.
+        """
+        class_cache = cls._get_class_cache()
+
+        if writer_schema is None:
+            if "payload_checker" not in class_cache:
+                class_cache["payload_checker"] = PayloadChecker(cls.get_parsed_schema())
+            return class_cache["payload_checker"]
+
+        canonical_form = fastavro.schema.to_parsing_canonical_form(writer_schema)
+        key = ("payload_checker", fastavro.schema.fingerprint(canonical_form, "CRC-64-AVRO"))
+
+        if key not in class_cache:
+            class_cache[key] = PayloadChecker(writer_schema)
+        return class_cache[key]
+
+    @classmethod
+    def _get_deserialization_schemas(
+        cls: Type[CT], serialization_type: str, writer_schema: Optional[JsonDict], fields: Optional[Sequence[str]]
+    ) -> Tuple[JsonDict, Optional[JsonDict]]:
+        """
+        Returns the reader and writer schemas to use during deserialization
+        """
+        schema = cls.get_parsed_schema()
+
+        # A self reference points to the whole record, so when the model has one
+        # the payload is fully decoded and the projection is applied after decoding
+        if fields is not None and serialization_type == AVRO and not cls._has_self_reference():
+            return cls.get_projected_schema(fields), writer_schema or schema
+        return schema, writer_schema
+
+    @classmethod
+    def _return_record_name(
+        cls: Type[CT], create_instance: bool, writer_schema: Optional[JsonDict], fields: Optional[Sequence[str]]
+    ) -> bool:
+        """
+        Whether to decode the unions of records with their record names, so the class of each
+        branch is taken from the name. The names must be the ones of the model schema.
+        """
+        return create_instance and fields is None and writer_schema is None and cls._get_union_resolver() is not None
+
+    @classmethod
+    def _get_record_codec(cls: Type[CT]) -> Optional[iterative.RecordCodec]:
+        """
+        Returns the codec that encodes and decodes without recursion, only for models with
+        self relationships or arrays of numbers and without a custom dacite config.
+        The result is cached per class.
+
+        With the schema cache, the schema is not rendered for models that do not use the codec.
+        """
+        class_cache = cls._get_class_cache()
+
+        if "record_codec" not in class_cache:
+            metadata = SchemaMetadata.create(getattr(cls, "Meta", type))
+
+            if metadata.dacite_config is not None or (
+                cls._lacks_feature("recursive") and cls._lacks_feature("number_arrays")
+            ):
+                class_cache["record_codec"] = None
+            else:
+                # the schema is generated before the fields, so they are the ones that rendered it
+                node = cls.get_schema_ir()
+                fields = cls.get_fields()
+                codec = iterative.RecordCodec.create(node, cls, fields, typed_arrays=metadata.typed_arrays)
+                class_cache["record_codec"] = codec if codec.recursive or codec.number_arrays else None
+        return class_cache["record_codec"]
+
+    @staticmethod
+    def _use_record_codec(
+        serialization_type: str,
+        writer_schema: Any,
+        fields: Optional[Sequence[str]],
+        case_type: Optional[str],
+    ) -> bool:
+        # the codec only knows the binary encoding of the model schema
+        return serialization_type == AVRO and writer_schema is None and fields is None and case_type is None
+
+    @classmethod
+    def _get_union_resolver(cls: Type[CT]) -> Optional[union_tags.PayloadResolver]:
+        class_cache = cls._get_class_cache()
+
+        if "union_resolver" not in class_cache:
+            if cls._lacks_feature("named_unions"):
+                class_cache["union_resolver"] = None
+            else:
+                schema = cls.avro_schema_to_python()
+                # the fields of the schema definition are the ones that rendered the schema
+                class_cache["union_resolver"] = union_tags.get_record_resolver(cls.get_fields(), schema)
+        return class_cache["union_resolver"]
+
+    @classmethod
+    def _payload_to_output(
+        cls: Type[CT], payload: JsonDict, create_instance: bool = True, fields: Optional[Sequence[str]] = None
+    ) -> Union[JsonDict, CT]:
+        if fields is not None:
+            # the payload could contain more fields if they could not be skipped during decoding
+            projected_schema = cls.get_projected_schema(fields)
+            payload = {field["name"]: payload[field["name"]] for field in projected_schema["fields"]}
+
+        if create_instance and fields is None:
+            resolver = cls._get_union_resolver()
+            if resolver is not None:
+                payload = resolver(payload)
+            return cls._create_instance(cls._deserialize_complex_types(payload))
+
+        return cls._deserialize_complex_types(payload)
+
+    @classmethod
+    def _create_instance(cls: Type[CT], data: Dict) -> Union[JsonDict, CT]:
+        """
+        Create an instance from a decoded payload
+        """
+        return cls.parse_obj(data=data)
 
     @classmethod
     def parse_obj(cls: Type[CT], data: Dict) -> Union[JsonDict, CT]:
@@ -198,17 +838,61 @@ class AvroModel:
         return self.asdict()
 
     def to_json(self) -> str:
-        data = to_json(self.asdict())
+        data = self.get_json_plan()(self)
         return json.dumps(data)
 
+    @classmethod
+    def to_json_many(cls: Type[CT], instances: Iterable[CT]) -> str:
+        """
+        Returns a json array with the json representation of all the instances
+        """
+        plan = cls.get_json_plan()
+        return json.dumps([plan(instance) for instance in instances])
+
+    @classmethod
+    def get_json_plan(cls: Type[CT]) -> Callable[[Any], JsonDict]:
+        """
+        Returns a function that converts an instance of the class into its json representation.
+
+        The converter of each field is chosen only once, according to its type,
+        so values are not inspected one by one to decide how to convert them.
+        The plan is cached per class.
+        """
+        class_cache = cls._get_class_cache()
+
+        if "json_plan" not in class_cache:
+            # the plan only needs the fields, so the schema is not rendered
+            klass = cls.generate_dataclass()
+            metadata = SchemaMetadata.create(getattr(klass, "Meta", type))
+            schema_def = AvroSchemaDefinition("record", klass, metadata=metadata, parent=cls)
+            converters = [(field.name, field.get_json_converter()) for field in schema_def.fields]
+
+            def plan(instance: Any) -> JsonDict:
+                json_data = {}
+
+                for name, converter in converters:
+                    value = getattr(instance, name)
+                    json_data[name] = value if value is None or converter is None else converter(value)
+                return json_data
+
+            class_cache["json_plan"] = plan
+        return class_cache["json_plan"]
+
     @classmethod
     def config(cls: Type[CT]) -> JsonDict:
         """
         Get the default config for dacite and always include the self reference
         """
-        # We need to make sure that the `avro schemas` has been generated, otherwise cls.klass is empty
-        # It won't affect the performance because the rendered schema will be store in cls.rendered_schema
-        cls.generate_schema()
+        # We need to make sure that the `avro schemas` has been generated, otherwise cls.klass is empty.
+        # Only the class and its metadata are needed, so the schema is not rendered again when the class
+        # already has them (models that are not direct subclasses of AvroModel are always rendered again)
+        if "klass" not in cls.__dict__ or "metadata" not in cls.__dict__:
+            if cls._get_persisted_entry() is not None:
+                # the schema is taken from the schema cache, so it is not rendered only for them
+                cls.klass = cls.generate_dataclass()
+                cls.metadata = cls.generate_metadata()
+            else:
+                cls.generate_schema()
         dacite_user_config = cls.metadata.dacite_config  # type: ignore
 
         dacite_config = {
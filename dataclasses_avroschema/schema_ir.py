@@ -0,0 +1,271 @@
+import json
+import typing
+
+import fastavro
+
+from . import serialization
+from .types import JsonDict
+
+# The attributes that are not part of the structure of a type (doc, aliases, default, logicalType, ...)
+# in the order of the rendered schema, with their values as JSON strings so the nodes are hashable
+Properties = typing.Tuple[typing.Tuple[str, str], ...]
+
+# attributes of the types that are nodes (or names) in the IR, the rest are properties
+RECORD_KEYS = ("type", "name", "namespace", "fields")
+FIELD_KEYS = ("name", "type")
+ENUM_KEYS = ("type", "name", "namespace", "symbols")
+FIXED_KEYS = ("type", "name", "namespace", "size")
+ARRAY_KEYS = ("type", "items")
+MAP_KEYS = ("type", "values")
+
+
+class PrimitiveNode(typing.NamedTuple):
+    """A primitive type, with its logical type attributes as properties"""
+
+    type: str
+    properties: Properties = ()
+
+
+class ReferenceNode(typing.NamedTuple):
+    """A reference to a named type that was defined before, name is the one used in the schema"""
+
+    name: str
+    fullname: str
+
+
+class ArrayNode(typing.NamedTuple):
+    items: "Node"
+    properties: Properties = ()
+
+
+class MapNode(typing.NamedTuple):
+    values: "Node"
+    properties: Properties = ()
+
+
+class UnionNode(typing.NamedTuple):
+    types: typing.Tuple["Node", ...]
+
+
+class FixedNode(typing.NamedTuple):
+    name: str
+    namespace: typing.Optional[str]
+    fullname: str
+    size: int
+    properties: Properties = ()
+
+
+class EnumNode(typing.NamedTuple):
+    name: str
+    namespace: typing.Optional[str]
+    fullname: str
+    symbols: typing.Tuple[str, ...]
+    properties: Properties = ()
+
+
+class FieldNode(typing.NamedTuple):
+    name: str
+    type: "Node"
+    properties: Properties = ()
+
+
+class RecordNode(typing.NamedTuple):
+    name: str
+    namespace: typing.Optional[str]
+    fullname: str
+    fields: typing.Tuple[FieldNode, ...]
+    properties: Properties = ()
+    type: str = "record"
+
+
+Node = typing.Union[
+    PrimitiveNode, ReferenceNode, ArrayNode, MapNode, UnionNode, FixedNode, EnumNode, RecordNode, FieldNode
+]
+NamedNode = typing.Union[FixedNode, EnumNode, RecordNode]
+N = typing.TypeVar("N", bound=Node)
+
+
+def build(schema: typing.Any) -> Node:
+    """
+    Returns the intermediate representation (IR) of a rendered (not parsed) schema.
+
+    The nodes are immutable and hashable named tuples. Equal nodes are built only once
+    and shared, for example the same array or the references to the same named type.
+    """
+    return _Builder().build(schema, None)
+
+
+def to_python(node: Node) -> typing.Any:
+    """
+    Returns the schema of the node, equal to the rendered schema that it was built from
+    """
+    if isinstance(node, PrimitiveNode):
+        return {"type": node.type, **_load_properties(node.properties)} if node.properties else node.type
+    elif isinstance(node, ReferenceNode):
+        return node.name
+    elif isinstance(node, UnionNode):
+        return [to_python(union_type) for union_type in node.types]
+    elif isinstance(node, ArrayNode):
+        return {"type": "array", "items": to_python(node.items), **_load_properties(node.properties)}
+    elif isinstance(node, MapNode):
+        return {"type": "map", "values": to_python(node.values), **_load_properties(node.properties)}
+    elif isinstance(node, FieldNode):
+        return {"name": node.name, "type": to_python(node.type), **_load_properties(node.properties)}
+
+    schema: JsonDict = {"name": node.name}
+    if node.namespace is not None:
+        schema["namespace"] = node.namespace
+
+    if isinstance(node, RecordNode):
+        schema.update(type=node.type, fields=[to_python(field) for field in node.fields])
+    elif isinstance(node, EnumNode):
+        schema.update(type="enum", symbols=list(node.symbols))
+    else:
+        schema.update(type="fixed", size=node.size)
+
+    schema.update(_load_properties(node.properties))
+    return schema
+
+
+def get_named_types(node: Node, named_types: typing.Optional[typing.Dict[str, NamedNode]] = None) -> typing.Dict:
+    """
+    Returns the named types (records, enums and fixed) defined in the node by fullname
+    """
+    named_types = {} if named_types is None else named_types
+
+    if isinstance(node, (RecordNode, EnumNode, FixedNode)):
+        named_types[node.fullname] = node
+    for child in _get_children(node):
+        get_named_types(child, named_types)
+
+    return named_types
+
+
+def has_named_unions(node: Node) -> bool:
+    """
+    Whether the node has unions with records or enums (defined or referenced) as branches
+    """
+    if isinstance(node, UnionNode) and any(
+        isinstance(union_type, (RecordNode, EnumNode, ReferenceNode)) for union_type in node.types
+    ):
+        return True
+    return any(has_named_unions(child) for child in _get_children(node))
+
+
+def canonical_form(node: Node) -> str:
+    """
+    Returns the Parsing Canonical Form of the schema as defined in the Avro specification:
+    only the attributes that are relevant for reading data, with full names and without spaces
+    """
+    return json.dumps(_canonical(node), separators=(",", ":"))
+
+
+def fingerprint(node: Node, algorithm: str = "CRC-64-AVRO") -> str:
+    """
+    Returns the fingerprint of the Parsing Canonical Form of the schema, as a hex string.
+    The algorithms are the ones supported by `fastavro.schema.fingerprint`
+    """
+    return fastavro.schema.fingerprint(canonical_form(node), algorithm)
+
+
+def _canonical(node: Node) -> typing.Any:
+    if isinstance(node, PrimitiveNode):
+        return node.type
+    elif isinstance(node, ReferenceNode):
+        return node.fullname
+    elif isinstance(node, UnionNode):
+        return [_canonical(union_type) for union_type in node.types]
+    elif isinstance(node, ArrayNode):
+        return {"type": "array", "items": _canonical(node.items)}
+    elif isinstance(node, MapNode):
+        return {"type": "map", "values": _canonical(node.values)}
+    elif isinstance(node, FieldNode):
+        return {"name": node.name, "type": _canonical(node.type)}
+    elif isinstance(node, RecordNode):
+        return {"name": node.fullname, "type": node.type, "fields": [_canonical(field) for field in node.fields]}
+    elif isinstance(node, EnumNode):
+        return {"name": node.fullname, "type": "enum", "symbols": list(node.symbols)}
+    return {"name": node.fullname, "type": "fixed", "size": node.size}
+
+
+def _get_children(node: Node) -> typing.Tuple[Node, ...]:
+    if isinstance(node, UnionNode):
+        return node.types
+    elif isinstance(node, ArrayNode):
+        return (node.items,)
+    elif isinstance(node, MapNode):
+        return (node.values,)
+    elif isinstance(node, RecordNode):
+        return node.fields
+    elif isinstance(node, FieldNode):
+        return (node.type,)
+    return ()
+
+
+def _get_properties(schema: JsonDict, keys: typing.Tuple[str, ...]) -> Properties:
+    return tuple((key, json.dumps(value)) for key, value in schema.items() if key not in keys)
+
+
+def _load_properties(properties: Properties) -> JsonDict:
+    return {key: json.loads(value) for key, value in properties}
+
+
+class _Builder:
+    def __init__(self) -> None:
+        # every node built, so equal nodes are shared
+        self.nodes: typing.Dict[typing.Any, typing.Any] = {}
+
+    def share(self, node: N) -> N:
+        return self.nodes.setdefault(node, node)
+
+    def build(self, schema: typing.Any, namespace: typing.Optional[str]) -> Node:
+        if isinstance(schema, str):
+            if schema in serialization.PRIMITIVE_TYPES:
+                return self.share(PrimitiveNode(schema))
+            return self.share(ReferenceNode(schema, serialization._get_fullname(schema, namespace)))
+        elif isinstance(schema, list):
+            return self.share(UnionNode(tuple(self.build(union_type, namespace) for union_type in schema)))
+
+        type_name = schema["type"]
+        if isinstance(type_name, (list, dict)):
+            # for example {"type": {"type": "array", ...}}
+            return self.build(type_name, namespace)
+        elif type_name in ("record", "error"):
+            return self.build_record(schema, namespace)
+        elif type_name == "enum":
+            name, record_namespace, fullname = self.get_names(schema, namespace)
+            return self.share(
+                EnumNode(name, record_namespace, fullname, tuple(schema["symbols"]), _get_properties(schema, ENUM_KEYS))
+            )
+        elif type_name == "fixed":
+            name, record_namespace, fullname = self.get_names(schema, namespace)
+            return self.share(
+                FixedNode(name, record_namespace, fullname, schema["size"], _get_properties(schema, FIXED_KEYS))
+            )
+        elif type_name == "array":
+            return self.share(ArrayNode(self.build(schema["items"], namespace), _get_properties(schema, ARRAY_KEYS)))
+        elif type_name == "map":
+            return self.share(MapNode(self.build(schema["values"], namespace), _get_properties(schema, MAP_KEYS)))
+        return self.share(PrimitiveNode(type_name, _get_properties(schema, ("type",))))
+
+    def build_record(self, schema: JsonDict, namespace: typing.Optional[str]) -> Node:
+        name, record_namespace, fullname = self.get_names(schema, namespace)
+        # the namespace of a name with dots is the part before the last dot
+        fields_namespace = fullname.rsplit(".", 1)[0] if "." in fullname else None
+
+        fields = tuple(
+            self.share(
+                FieldNode(
+                    field["name"], self.build(field["type"], fields_namespace), _get_properties(field, FIELD_KEYS)
+                )
+            )
+            for field in schema["fields"]
+        )
+        return self.share(
+            RecordNode(name, record_namespace, fullname, fields, _get_properties(schema, RECORD_KEYS), schema["type"])
+        )
+
+    @staticmethod
+    def get_names(schema: JsonDict, namespace: typing.Optional[str]) -> typing.Tuple[str, typing.Optional[str], str]:
+        fullname = serialization._get_fullname(schema["name"], schema.get("namespace", namespace))
+        return schema["name"], schema.get("namespace"), fullname
@@ -1,18 +1,57 @@
+import copy
 import datetime
 import decimal
 import io
+import itertools
 import typing
 import uuid
 
 import fastavro
 
-from .types import JsonDict
+from .types import BytesLike, JsonDict
 
 DATETIME_STR_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
 DATE_STR_FORMAT = "%Y-%m-%d"
 TIME_STR_FORMAT = "%H:%M:%S"
 
-decimal_context = decimal.Context()
+PRIMITIVE_TYPES = ("null", "boolean", "int", "long", "float", "double", "bytes", "string")
+NAMED_TYPES = ("record", "enum", "fixed")
+
+# amount of JSON Lines decoded by the same fastavro json reader
+JSONL_CHUNK_SIZE = 1000
+
+
+class BufferWriter:
+    """
+    File-like object that writes into a preallocated buffer, for example
+    a `bytearray` or a writable `memoryview`, starting at offset
+    """
+
+    def __init__(self, buffer: typing.Union[bytearray, memoryview], offset: int = 0) -> None:
+        self.buffer = memoryview(buffer).cast("B")
+
+        if self.buffer.readonly:
+            raise ValueError("The buffer must be writable")
+
+        self.offset = offset
+        self.position = offset
+
+    def write(self, data: BytesLike) -> int:
+        end = self.position + len(data)
+
+        if end > len(self.buffer):
+            raise ValueError(f"Buffer too small. At least {end - len(self.buffer)} more bytes are required")
+
+        self.buffer[self.position : end] = data
+        self.position = end
+        return len(data)
+
+    def flush(self) -> None:
+        ...
+
+    @property
+    def bytes_written(self) -> int:
+        return self.position - self.offset
 
 
 def serialize(payload: typing.Dict, schema: typing.Dict, serialization_type: str = "avro") -> bytes:
@@ -34,23 +73,58 @@ def serialize(payload: typing.Dict, schema: typing.Dict, serialization_type: str
     return value  # type: ignore
 
 
+def serialize_into(
+    payload: typing.Dict,
+    schema: typing.Dict,
+    buffer: typing.Union[bytearray, memoryview],
+    offset: int = 0,
+    serialization_type: str = "avro",
+) -> int:
+    """
+    Serialize payload and write the result into buffer starting at offset.
+
+    Returns:
+        int: the number of bytes written
+    """
+    if serialization_type == "avro":
+        output = BufferWriter(buffer, offset=offset)
+        fastavro.schemaless_writer(output, schema, payload)  # type: ignore
+    elif serialization_type == "avro-json":
+        output = BufferWriter(buffer, offset=offset)
+        output.write(serialize(payload, schema, serialization_type=serialization_type))
+    else:
+        raise ValueError(f"Serialization type should be `avro` or `avro-json`, not {serialization_type}")
+
+    return output.bytes_written
+
+
 def deserialize(
-    data: bytes,
+    data: BytesLike,
     schema: typing.Dict,
     serialization_type: str = "avro",
     writer_schema: typing.Optional[JsonDict] = None,
+    return_record_name: bool = False,
 ) -> typing.Dict:
+    """
+    Attributes:
+        return_record_name: with `avro`, the records of unions that have more than one record
+            are returned as `(name, record)` tuples
+    """
     if serialization_type == "avro":
+        # io.BytesIO shares the memory of a bytes object and for bytearray or memoryview
+        # only the slice given is copied, because fastavro reads bytes
         input_stream: typing.Union[io.BytesIO, io.StringIO] = io.BytesIO(data)
 
         payload = fastavro.schemaless_reader(
             input_stream,
             writer_schema=writer_schema or schema,
             reader_schema=schema,
+            return_record_name=return_record_name,
+            return_record_name_override=return_record_name,
         )
 
     elif serialization_type == "avro-json":
-        input_stream = io.StringIO(data.decode())
+        input_stream = io.StringIO(str(data, "utf-8"))
         # This is an iterator, but not a container
         records = fastavro.json_reader(input_stream, schema)
         # records can have multiple payloads, but in this case we return the first one
@@ -63,66 +137,364 @@ def deserialize(
     return payload
 
 
+def serialize_many(
+    payloads: typing.Iterable[typing.Dict], schema: typing.Dict, serialization_type: str = "avro"
+) -> bytes:
+    """
+    Serialize many payloads parsing the schema only once.
+
+    With `avro` the records are concatenated one after the other, and with
+    `avro-json` the result is JSON Lines, one record per line.
+    """
+    parsed_schema = fastavro.parse_schema(schema)
+
+    if serialization_type == "avro":
+        binary_output = io.BytesIO()
+
+        for payload in payloads:
+            fastavro.schemaless_writer(binary_output, parsed_schema, payload)
+
+        return binary_output.getvalue()
+    elif serialization_type == "avro-json":
+        json_output = io.StringIO()
+        fastavro.json_writer(json_output, parsed_schema, payloads)
+
+        return json_output.getvalue().encode("utf-8")
+
+    raise ValueError(f"Serialization type should be `avro` or `avro-json`, not {serialization_type}")
+
+
+def deserialize_many(
+    data: BytesLike,
+    schema: typing.Dict,
+    serialization_type: str = "avro",
+    writer_schema: typing.Optional[JsonDict] = None,
+    return_record_name: bool = False,
+) -> typing.List[typing.Dict]:
+    """
+    Deserialize data created with `serialize_many`. `return_record_name` has the same meaning as in `deserialize`
+    """
+    if serialization_type == "avro":
+        reader_schema = fastavro.parse_schema(schema)
+        parsed_writer_schema = fastavro.parse_schema(writer_schema) if writer_schema is not None else reader_schema
+
+        input_stream = io.BytesIO(data)
+        size = len(input_stream.getbuffer())
+        payloads = []
+
+        while input_stream.tell() < size:
+            payloads.append(
+                fastavro.schemaless_reader(
+                    input_stream,
+                    parsed_writer_schema,
+                    reader_schema,
+                    return_record_name=return_record_name,
+                    return_record_name_override=return_record_name,
+                )
+            )
+
+        return payloads  # type: ignore
+    elif serialization_type == "avro-json":
+        return list(load_jsonl(io.StringIO(str(data, "utf-8")), schema))
+
+    raise ValueError(f"Serialization type should be `avro` or `avro-json`, not {serialization_type}")
+
+
+def load_jsonl(
+    fileobj: typing.IO, schema: typing.Dict, chunk_size: int = JSONL_CHUNK_SIZE
+) -> typing.Iterator[typing.Dict]:
+    """
+    Iterate over the `avro-json` records of a JSON Lines file object.
+
+    The schema is parsed once and the lines are decoded in chunks of chunk_size,
+    so the memory used does not depend on the size of the file.
+    """
+    parsed_schema = fastavro.parse_schema(schema)
+    lines = (line for line in fileobj if line.strip())
+
+    while True:
+        chunk = list(itertools.islice(lines, chunk_size))
+
+        if not chunk:
+            return
+        yield from fastavro.json_reader(chunk, parsed_schema)  # type: ignore
+
+
+def _get_fullname(name: str, namespace: typing.Optional[str]) -> str:
+    if "." in name or not namespace:
+        return name
+    return f"{namespace}.{name}"
+
+
+def _collect_named_types(
+    avro_type: typing.Any, namespace: typing.Optional[str], named_types: typing.Dict[str, JsonDict]
+) -> None:
+    """
+    Walk an avro type and store every named type definition (record, enum, fixed)
+    by its fullname. The namespace of each definition is made explicit so it can be
+    moved to a different position of the schema without changing its meaning.
+    """
+    if isinstance(avro_type, list):
+        for union_type in avro_type:
+            _collect_named_types(union_type, namespace, named_types)
+    elif isinstance(avro_type, dict):
+        type_name = avro_type["type"]
+
+        if type_name in NAMED_TYPES:
+            namespace = avro_type.get("namespace", namespace)
+            fullname = _get_fullname(avro_type["name"], namespace)
+            definition = dict(avro_type)
+
+            if namespace and "." not in avro_type["name"]:
+                definition["namespace"] = namespace
+
+            named_types.setdefault(fullname, definition)
+
+            for field in avro_type.get("fields", []):
+                _collect_named_types(field["type"], namespace, named_types)
+        elif type_name == "array":
+            _collect_named_types(avro_type["items"], namespace, named_types)
+        elif type_name == "map":
+            _collect_named_types(avro_type["values"], namespace, named_types)
+        elif isinstance(type_name, (dict, list)):
+            _collect_named_types(type_name, namespace, named_types)
+
+
+def _inline_named_types(
+    avro_type: typing.Any,
+    namespace: typing.Optional[str],
+    named_types: typing.Dict[str, JsonDict],
+    defined: typing.Set[str],
+) -> typing.Any:
+    """
+    Return a copy of avro_type where references to named types that were not
+    defined yet are replaced by their definition.
+    """
+    if isinstance(avro_type, str):
+        if avro_type in PRIMITIVE_TYPES:
+            return avro_type
+
+        fullname = avro_type if avro_type in named_types else _get_fullname(avro_type, namespace)
+        if fullname in defined or fullname not in named_types:
+            return avro_type
+
+        return _inline_named_types(named_types[fullname], namespace, named_types, defined)
+    elif isinstance(avro_type, list):
+        return [_inline_named_types(union_type, namespace, named_types, defined) for union_type in avro_type]
+    elif isinstance(avro_type, dict):
+        new_type = dict(avro_type)
+        type_name = avro_type["type"]
+
+        if type_name in NAMED_TYPES:
+            namespace = avro_type.get("namespace", namespace)
+            fullname = _get_fullname(avro_type["name"], namespace)
+
+            if fullname in defined:
+                # the definition was moved before this position, so a reference is enough
+                return fullname
+            defined.add(fullname)
+
+            if "fields" in avro_type:
+                new_type["fields"] = [
+                    {**field, "type": _inline_named_types(field["type"], namespace, named_types, defined)}
+                    for field in avro_type["fields"]
+                ]
+        elif type_name == "array":
+            new_type["items"] = _inline_named_types(avro_type["items"], namespace, named_types, defined)
+        elif type_name == "map":
+            new_type["values"] = _inline_named_types(avro_type["values"], namespace, named_types, defined)
+        elif isinstance(type_name, (dict, list)):
+            new_type["type"] = _inline_named_types(type_name, namespace, named_types, defined)
+
+        return new_type
+
+    return avro_type
+
+
+def _reference_named_types(
+    avro_type: typing.Any, namespace: typing.Optional[str], fullnames: typing.Set[str]
+) -> typing.Any:
+    """
+    Return a copy of avro_type where the definitions of the named types in fullnames
+    are replaced by a reference (their fullname).
+    """
+    if isinstance(avro_type, list):
+        return [_reference_named_types(union_type, namespace, fullnames) for union_type in avro_type]
+    elif isinstance(avro_type, dict):
+        new_type = dict(avro_type)
+        type_name = avro_type["type"]
+
+        if type_name in NAMED_TYPES:
+            namespace = avro_type.get("namespace", namespace)
+            fullname = _get_fullname(avro_type["name"], namespace)
+
+            if fullname in fullnames:
+                return fullname
+
+            if "fields" in avro_type:
+                new_type["fields"] = [
+                    {**field, "type": _reference_named_types(field["type"], namespace, fullnames)}
+                    for field in avro_type["fields"]
+                ]
+        elif type_name == "array":
+            new_type["items"] = _reference_named_types(avro_type["items"], namespace, fullnames)
+        elif type_name == "map":
+            new_type["values"] = _reference_named_types(avro_type["values"], namespace, fullnames)
+        elif isinstance(type_name, (dict, list)):
+            new_type["type"] = _reference_named_types(type_name, namespace, fullnames)
+
+        return new_type
+
+    return avro_type
+
+
+def project_schema(schema: JsonDict, field_names: typing.Sequence[str]) -> JsonDict:
+    """
+    Returns a copy of a record schema that only contains the fields in field_names.
+
+    Named types that are referenced by the selected fields but defined in a
+    discarded field are moved into the projected schema, so the result is
+    always a valid schema that can be used as a reader schema.
+
+    Arguments:
+        schema (JsonDict): record schema
+        field_names (typing.Sequence[str]): names of the fields to keep
+
+    Returns:
+        JsonDict
+    """
+    fields_by_name = {field["name"]: field for field in schema["fields"]}
+    unknown_fields = [name for name in field_names if name not in fields_by_name]
+
+    if unknown_fields:
+        raise ValueError(f"Fields {unknown_fields} are not part of the schema {schema['name']}")
+
+    namespace = schema.get("namespace")
+    named_types: typing.Dict[str, JsonDict] = {}
+    _collect_named_types(schema, namespace, named_types)
+
+    # the record itself is always defined, so self references are not inlined
+    defined = {_get_fullname(schema["name"], namespace)}
+    fields = [
+        {**field, "type": _inline_named_types(field["type"], namespace, named_types, defined)}
+        for field in schema["fields"]
+        if field["name"] in field_names
+    ]
+
+    return copy.deepcopy({**schema, "fields": fields})
+
+
 def datetime_to_str(value: datetime.datetime) -> str:
-    return value.strftime(DATETIME_STR_FORMAT)
+    # same result as value.strftime(DATETIME_STR_FORMAT) but much faster:
+    # the isoformat offset `+HH:MM` is converted to the `%z` format `+HHMM`.
+    # isoformat pads the years before 1000 with zeros and strftime does not (it depends on the platform)
+    if value.year < 1000:
+        return value.strftime(DATETIME_STR_FORMAT)
+    iso_datetime = value.isoformat(timespec="seconds")
+    return iso_datetime[:19] + iso_datetime[19:].replace(":", "")
 
 
 def date_to_str(value: datetime.date) -> str:
-    return value.strftime(DATE_STR_FORMAT)
+    # same result as value.strftime(DATE_STR_FORMAT), also when value is a datetime
+    if value.year < 1000:
+        return value.strftime(DATE_STR_FORMAT)
+    return datetime.date.isoformat(value)
 
 
 def time_to_str(value: datetime.time) -> str:
-    return value.strftime(TIME_STR_FORMAT)
+    # same result as value.strftime(TIME_STR_FORMAT)
+    return f"{value.hour:02d}:{value.minute:02d}:{value.second:02d}"
 
 
-def decimal_to_str(value: decimal.Decimal, precision: int, scale: int = 0) -> str:
-    value_bytes = prepare_bytes_decimal(value, precision, scale)
-    return r"\u" + value_bytes.hex()
+class DecimalCodec:
+    """
+    Encode and decode the decimals of a `bytes` decimal schema: the unscaled integer
+    as big-endian two's-complement bytes, and the hex string (prefixed with `\\u`) used for defaults.
 
+    Each codec has its own `decimal.Context` with the precision of the schema, so it can be
+    shared between threads. The scaling is done with integer arithmetic.
 
-def string_to_decimal(*, value: str, schema: JsonDict) -> decimal.Decimal:
-    # first remove the Unicode character
-    value = value.replace(r"\u", "")
+    The unscaled integer must have at most `precision` digits, otherwise ValueError is raised
+    both when encoding and decoding. fastavro only checks the digits of the decimal before
+    scaling it and rounds the decoded values, so it accepts `Decimal("123")` with precision 7
+    and scale 5.
 
-    # then concert to bytes
-    decimal_bytes = bytes.fromhex(value)
+    Attributes:
+        precision: precision of the decimal schema
+        scale: scale of the decimal schema
+    """
 
-    # finally get the decimal.Decimal
-    scale = schema.get("scale", 0)
-    precision = schema["precision"]
-    unscaled_datum = int.from_bytes(decimal_bytes, byteorder="big", signed=True)
-    decimal_context.prec = precision
+    def __init__(self, precision: int, scale: int = 0) -> None:
+        self.precision = precision
+        self.scale = scale
+        self.context = decimal.Context(prec=precision)
+        # the smallest unscaled integer with more digits than the precision
+        self.max_unscaled = 10**precision
 
-    return decimal_context.create_decimal(unscaled_datum).scaleb(-scale, decimal_context)
+    def to_bytes(self, value: decimal.Decimal) -> bytes:
+        _, digits, exp = value.as_tuple()
 
+        if not isinstance(exp, int):
+            raise ValueError(f"{value} can not be represented as an avro decimal")
+        elif len(digits) > self.precision:
+            raise ValueError("The decimal precision is bigger than allowed by schema")
+        elif exp + self.scale < 0:
+            raise ValueError("Scale provided in schema does not match the decimal")
 
-# This is an almost complete copy of fastavro's _logical_writers_py.prepare_bytes_decimal
-# the only tweak is to pass in scale/precision directly instead of a schema
-# This is needed to properly serialize a default decimal.Decimal into the avro schema
-def prepare_bytes_decimal(data: decimal.Decimal, precision: int, scale: int = 0) -> bytes:
-    """Convert decimal.Decimal to bytes"""
-    sign, digits, exp = data.as_tuple()
+        # the value has at most `precision` digits and no more decimals than the scale,
+        # so scaling it with the context is exact and the result is an integer
+        unscaled_datum = int(value.scaleb(self.scale, self.context))
+        if abs(unscaled_datum) >= self.max_unscaled:
+            raise ValueError("The decimal precision is bigger than allowed by schema")
 
-    if len(digits) > precision:
-        raise ValueError("The decimal precision is bigger than allowed by schema")
+        bytes_req = (abs(unscaled_datum).bit_length() + 8) // 8
+        return unscaled_datum.to_bytes(bytes_req, byteorder="big", signed=True)
 
-    delta = int(exp) + scale
+    def from_bytes(self, value: bytes) -> decimal.Decimal:
+        unscaled_datum = int.from_bytes(value, byteorder="big", signed=True)
+        if abs(unscaled_datum) >= self.max_unscaled:
+            raise ValueError("The decimal precision is bigger than allowed by schema")
 
-    if delta < 0:
-        raise ValueError("Scale provided in schema does not match the decimal")
+        return decimal.Decimal(unscaled_datum).scaleb(-self.scale, self.context)
 
-    unscaled_datum = 0
-    for digit in digits:
-        unscaled_datum = (unscaled_datum * 10) + digit
+    def to_str(self, value: decimal.Decimal) -> str:
+        return r"\u" + self.to_bytes(value).hex()
 
-    unscaled_datum = 10**delta * unscaled_datum
+    def from_str(self, value: str) -> decimal.Decimal:
+        return self.from_bytes(bytes.fromhex(value.replace(r"\u", "")))
 
-    bytes_req = (unscaled_datum.bit_length() + 8) // 8
+    def encode_many(self, values: typing.Iterable[decimal.Decimal]) -> typing.List[bytes]:
+        to_bytes = self.to_bytes
+        return [to_bytes(value) for value in values]
 
-    if sign:
-        unscaled_datum = -unscaled_datum
+    def decode_many(self, values: typing.Iterable[bytes]) -> typing.List[decimal.Decimal]:
+        from_bytes = self.from_bytes
+        return [from_bytes(value) for value in values]
 
-    return unscaled_datum.to_bytes(bytes_req, byteorder="big", signed=True)
+
+# codecs by (precision, scale), they do not change after they are created
+_decimal_codecs: typing.Dict[typing.Tuple[int, int], DecimalCodec] = {}
+
+
+def get_decimal_codec(precision: int, scale: int = 0) -> DecimalCodec:
+    codec = _decimal_codecs.get((precision, scale))
+
+    if codec is None:
+        codec = _decimal_codecs.setdefault((precision, scale), DecimalCodec(precision, scale))
+    return codec
+
+
+def decimal_to_str(value: decimal.Decimal, precision: int, scale: int = 0) -> str:
+    return get_decimal_codec(precision, scale).to_str(value)
+
+
+def string_to_decimal(*, value: str, schema: JsonDict) -> decimal.Decimal:
+    return get_decimal_codec(schema["precision"], schema.get("scale", 0)).from_str(value)
+
+
+def prepare_bytes_decimal(data: decimal.Decimal, precision: int, scale: int = 0) -> bytes:
+    """Convert decimal.Decimal to bytes"""
+    return get_decimal_codec(precision, scale).to_bytes(data)
 
 
 def serialize_value(*, value: typing.Any) -> typing.Any:
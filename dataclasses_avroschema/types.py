@@ -15,6 +15,7 @@ else:
 
 T = typing.TypeVar("T")
 JsonDict = typing.Dict[str, typing.Any]
+BytesLike = typing.Union[bytes, bytearray, memoryview]
 
 CUSTOM_TYPES = (
     "Fixed",
@@ -42,17 +43,30 @@ class Fixed(typing.Generic[T]):
     Represents an Avro Fixed type
 
     size (int): Specifying the number of bytes per value
+    name (str): Name of the fixed. Default the singular name of the field
     """
 
     size: int
     default: typing.Any = dataclasses.field(default=MissingSentinel)
     namespace: typing.Optional[str] = None
     aliases: typing.Optional[typing.List] = None
+    name: typing.Optional[str] = None
     _dataclasses_custom_type: str = "Fixed"
 
     def __repr__(self) -> str:
         return f"{self.size}"
 
+    @classmethod
+    def __get_validators__(cls) -> typing.Iterator[typing.Callable[[typing.Any], bytes]]:
+        # the values of the fixed fields of pydantic models are bytes, not instances of Fixed
+        yield cls.validate_value
+
+    @staticmethod
+    def validate_value(value: typing.Any) -> bytes:
+        if not isinstance(value, bytes):
+            raise TypeError(f"bytes expected, got {type(value).__name__}")
+        return value
+
 
 class Decimal:
     """
@@ -0,0 +1,264 @@
+import typing
+
+from . import serialization
+from .fields import DictField, EnumField, ListField, NoneField, RecordField, UnionField
+from .types import JsonDict
+
+# Receives a python value and its payload (the asdict representation) and returns the payload to encode
+PayloadTagger = typing.Callable[[typing.Any, typing.Any], typing.Any]
+
+# Receives a decoded payload, with the record names of the unions, and returns the payload to create instances
+PayloadResolver = typing.Callable[[typing.Any], typing.Any]
+
+Plan = typing.Callable[..., typing.Any]
+
+
+def get_record_tagger(fields: typing.List, schema: JsonDict) -> typing.Optional[PayloadTagger]:
+    """
+    Returns a function that replaces, in the payload of a record, the values of unions
+    whose branch is a record or an enum by fastavro's `(name, value)` tuple notation.
+    The branch is chosen from the python class of the value, so fastavro does not need
+    to test the value against every branch. None means that the record has nothing to tag.
+
+    Attributes:
+        fields: fields of the model, as they were created when the schema was rendered
+        schema: the rendered (not parsed) schema of the model
+    """
+    return _TaggerBuilder(schema).record_plan(fields, schema, None)
+
+
+def get_record_resolver(fields: typing.List, schema: JsonDict) -> typing.Optional[PayloadResolver]:
+    """
+    Returns a function that replaces, in a payload decoded with `return_record_name`,
+    the `(name, value)` tuples of unions by an instance of the class of the branch.
+    The classes are looked up by name in a table, so dacite (or pydantic) does not need
+    to try every class of the union. None means that the record has no unions of records.
+
+    Attributes:
+        fields: fields of the model, as they were created when the schema was rendered
+        schema: the rendered (not parsed) schema of the model
+    """
+    return _ResolverBuilder(schema).record_plan(fields, schema, None)
+
+
+def _get_namespace(fullname: str) -> typing.Optional[str]:
+    return fullname.rsplit(".", 1)[0] if "." in fullname else None
+
+
+def _get_branch_fullname(avro_type: typing.Any, namespace: typing.Optional[str]) -> str:
+    if isinstance(avro_type, str):
+        return serialization._get_fullname(avro_type, namespace)
+    return serialization._get_fullname(avro_type["name"], avro_type.get("namespace", namespace))
+
+
+def _get_union_branches(
+    union_field: UnionField, avro_types: typing.List
+) -> typing.List[typing.Tuple[typing.Any, typing.Any]]:
+    """
+    Pair each internal field of a union with its avro type. The null type that is added
+    when the default is None does not have an internal field.
+    """
+    branches = []
+    internal_fields = iter(union_field.internal_fields)
+
+    for avro_type in avro_types:
+        if avro_type == "null" and not any(isinstance(field, NoneField) for field in union_field.internal_fields):
+            continue
+
+        internal_field = next(internal_fields, None)
+        if internal_field is None:
+            break
+        branches.append((internal_field, avro_type))
+
+    return branches
+
+
+class _PlanBuilder:
+    """
+    Walk the fields of a model together with its rendered schema and create a plan (a function)
+    for each field that contains unions of named types. Subclasses define what the plans do.
+    """
+
+    def __init__(self, schema: JsonDict) -> None:
+        self.named_types: typing.Dict[str, JsonDict] = {}
+        serialization._collect_named_types(schema, None, self.named_types)
+
+        # plans of the records already built, so recursive relationships end
+        self.record_plans: typing.Dict[typing.Tuple[typing.Any, str], typing.Optional[Plan]] = {}
+
+    def record_plan(
+        self, fields: typing.List, schema: JsonDict, namespace: typing.Optional[str]
+    ) -> typing.Optional[Plan]:
+        record_namespace = _get_namespace(_get_branch_fullname(schema, namespace))
+
+        plans = []
+        for field, schema_field in zip(fields, schema["fields"]):
+            plan = self.field_plan(field, schema_field["type"], record_namespace)
+            if plan is not None:
+                plans.append((field.name, plan))
+
+        return self.make_record_plan(plans) if plans else None
+
+    def field_plan(
+        self, field: typing.Any, avro_type: typing.Any, namespace: typing.Optional[str]
+    ) -> typing.Optional[Plan]:
+        if isinstance(avro_type, list) and not isinstance(field, UnionField):
+            # fields with None as default, for example [null, record]
+            avro_type = next((union_type for union_type in avro_type if union_type != "null"), None)
+
+        if isinstance(field, UnionField):
+            return self.union_plan(field, avro_type, namespace)
+        elif isinstance(field, RecordField):
+            return self.nested_record_plan(field, avro_type, namespace)
+        elif isinstance(field, ListField) and isinstance(avro_type, dict):
+            items_plan = self.field_plan(field.internal_field, avro_type["items"], namespace)
+            return None if items_plan is None else self.make_list_plan(items_plan)
+        elif isinstance(field, DictField) and isinstance(avro_type, dict):
+            values_plan = self.field_plan(field.internal_field, avro_type["values"], namespace)
+            return None if values_plan is None else self.make_dict_plan(values_plan)
+        return None
+
+    def union_plan(
+        self, field: UnionField, avro_types: typing.List, namespace: typing.Optional[str]
+    ) -> typing.Optional[Plan]:
+        branches = []
+        for internal_field, avro_type in _get_union_branches(field, avro_types):
+            if isinstance(internal_field, (RecordField, EnumField)):
+                branch_name = _get_branch_fullname(avro_type, namespace)
+                plan = self.field_plan(internal_field, avro_type, namespace)
+                branches.append((internal_field, branch_name, plan))
+
+        return self.make_union_plan(branches, avro_types) if branches else None
+
+    def nested_record_plan(
+        self, field: RecordField, avro_type: typing.Any, namespace: typing.Optional[str]
+    ) -> typing.Optional[Plan]:
+        fullname = _get_branch_fullname(avro_type, namespace)
+        schema = avro_type if isinstance(avro_type, dict) else self.named_types.get(fullname)
+        schema_def = field.type.schema_def
+        key = (field.type, fullname)
+
+        if schema is None or schema_def is None:
+            return None
+        elif key in self.record_plans:
+            # a recursive relationship: the plan of the record is taken when it is used
+            return lambda *args: self.run_record_plan(key, *args)
+
+        self.record_plans[key] = None
+        self.record_plans[key] = self.record_plan(schema_def.fields, schema, _get_namespace(fullname))
+        return self.record_plans[key]
+
+    def run_record_plan(self, key: typing.Tuple[typing.Any, str], *args: typing.Any) -> typing.Any:
+        plan = self.record_plans[key]
+        # the payload is always the last argument
+        return args[-1] if plan is None else plan(*args)
+
+    def make_record_plan(self, plans: typing.List[typing.Tuple[str, Plan]]) -> Plan:
+        ...  # pragma: no cover
+
+    def make_union_plan(
+        self, branches: typing.List[typing.Tuple[typing.Any, str, typing.Optional[Plan]]], avro_types: typing.List
+    ) -> typing.Optional[Plan]:
+        ...  # pragma: no cover
+
+    def make_list_plan(self, items_plan: Plan) -> Plan:
+        ...  # pragma: no cover
+
+    def make_dict_plan(self, values_plan: Plan) -> Plan:
+        ...  # pragma: no cover
+
+
+class _TaggerBuilder(_PlanBuilder):
+    def make_record_plan(self, plans: typing.List[typing.Tuple[str, Plan]]) -> Plan:
+        def tag(instance: typing.Any, payload: JsonDict) -> JsonDict:
+            for name, tagger in plans:
+                value = getattr(instance, name)
+                if value is not None:
+                    payload[name] = tagger(value, payload[name])
+            return payload
+
+        return tag
+
+    def make_union_plan(
+        self, branches: typing.List[typing.Tuple[typing.Any, str, typing.Optional[Plan]]], avro_types: typing.List
+    ) -> typing.Optional[Plan]:
+        branch_by_type = {field.type: (branch_name, plan) for field, branch_name, plan in branches}
+
+        def tag(value: typing.Any, payload: typing.Any) -> typing.Any:
+            branch = branch_by_type.get(type(value))
+            if branch is None:
+                return payload
+
+            branch_name, tagger = branch
+            return (branch_name, payload if tagger is None else tagger(value, payload))
+
+        return tag
+
+    def make_list_plan(self, items_plan: Plan) -> Plan:
+        def tag(values: typing.Sequence, payloads: typing.List) -> typing.List:
+            return [
+                payload if value is None else items_plan(value, payload) for value, payload in zip(values, payloads)
+            ]
+
+        return tag
+
+    def make_dict_plan(self, values_plan: Plan) -> Plan:
+        def tag(values: typing.Mapping, payloads: JsonDict) -> JsonDict:
+            return {
+                key: payload if values[key] is None else values_plan(values[key], payload)
+                for key, payload in payloads.items()
+            }
+
+        return tag
+
+
+class _ResolverBuilder(_PlanBuilder):
+    def make_record_plan(self, plans: typing.List[typing.Tuple[str, Plan]]) -> Plan:
+        def resolve(payload: JsonDict) -> JsonDict:
+            for name, resolver in plans:
+                value = payload.get(name)
+                if value is not None:
+                    payload[name] = resolver(value)
+            return payload
+
+        return resolve
+
+    def make_union_plan(
+        self, branches: typing.List[typing.Tuple[typing.Any, str, typing.Optional[Plan]]], avro_types: typing.List
+    ) -> typing.Optional[Plan]:
+        # fastavro returns the name only for records, and only when the union has more than one record
+        records = {
+            branch_name: (field.type, plan) for field, branch_name, plan in branches if isinstance(field, RecordField)
+        }
+        if not records:
+            return None
+
+        has_maps = any(isinstance(avro_type, dict) and avro_type["type"] == "map" for avro_type in avro_types)
+        single_record = next(iter(records.values())) if len(records) == 1 and not has_maps else None
+
+        def resolve(payload: typing.Any) -> typing.Any:
+            if isinstance(payload, tuple):
+                branch_name, data = payload
+                branch = records.get(branch_name)
+                if branch is None:
+                    return data
+
+                record_type, resolver = branch
+                if resolver is not None:
+                    data = resolver(data)
+                return record_type._create_instance(record_type._deserialize_complex_types(data))
+            elif single_record is not None and isinstance(payload, dict):
+                # the only record of the union, dacite creates the instance
+                _, resolver = single_record
+                return payload if resolver is None else resolver(payload)
+            return payload
+
+        return resolve
+
+    def make_list_plan(self, items_plan: Plan) -> Plan:
+        return lambda payloads: [None if payload is None else items_plan(payload) for payload in payloads]
+
+    def make_dict_plan(self, values_plan: Plan) -> Plan:
+        return lambda payloads: {
+            key: None if payload is None else values_plan(payload) for key, payload in payloads.items()
+        }
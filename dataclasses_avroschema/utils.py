@@ -1,9 +1,11 @@
+import array
 import dataclasses
 import typing
 from datetime import datetime
 
 from pytz import utc
 
+from .limits import DecodeLimits
 from .types import JsonDict
 
 try:
@@ -33,6 +35,14 @@ def is_faust_model(klass: type) -> bool:
     return False
 
 
+def is_typed_array(value: typing.Any) -> bool:
+    """
+    Whether the value is an `array.array` or a NumPy array, the values
+    that are accepted for arrays of numbers besides lists
+    """
+    return isinstance(value, array.array) or (type(value).__module__ == "numpy" and hasattr(value, "tolist"))
+
+
 def is_union(a_type: type) -> bool:
     """
     Given a python type, return True if is typing.Union, otherwise False
@@ -77,6 +87,11 @@ class SchemaMetadata:
     aliases: typing.Optional[typing.List[str]] = None
     alias_nested_items: typing.Dict[str, str] = dataclasses.field(default_factory=dict)
     dacite_config: typing.Optional[JsonDict] = None
+    trusted: bool = False
+    warmup: bool = False
+    typed_arrays: bool = False
+    decode_limits: typing.Optional[DecodeLimits] = None
+    field_order: typing.Optional[typing.List[str]] = None
 
     @classmethod
     def create(cls: typing.Type["SchemaMetadata"], klass: type) -> typing.Any:
@@ -87,6 +102,11 @@ class SchemaMetadata:
             aliases=getattr(klass, "aliases", None),
             alias_nested_items=getattr(klass, "alias_nested_items", {}),
             dacite_config=getattr(klass, "dacite_config", None),
+            trusted=getattr(klass, "trusted", False),
+            warmup=getattr(klass, "warmup", False),
+            typed_arrays=getattr(klass, "typed_arrays", False),
+            decode_limits=getattr(klass, "decode_limits", None),
+            field_order=getattr(klass, "field_order", None),
         )
 
     def get_alias_nested_items(self, name: str) -> typing.Optional[str]:
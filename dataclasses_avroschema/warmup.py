@@ -0,0 +1,77 @@
+import time
+import typing
+from dataclasses import dataclass
+
+from . import schema_cache
+from .schema_generator import AvroModel
+from .utils import SchemaMetadata
+
+
+@dataclass
+class WarmupReport:
+    """
+    Result of the warm-up of one model
+
+    Attributes:
+        model: the model
+        elapsed: seconds spent building the caches of the model
+        error: the exception raised while building them, None when the model was warmed up
+    """
+
+    model: typing.Type[AvroModel]
+    elapsed: float
+    error: typing.Optional[Exception] = None
+
+
+def get_models() -> typing.List[typing.Type[AvroModel]]:
+    """
+    Returns the AvroModel subclasses defined so far (the ones of the modules already imported)
+    with `warmup = True` in `class Meta`, except the base classes of this library
+    """
+    models = []
+    pending = list(AvroModel.__subclasses__())
+    seen = set()
+
+    while pending:
+        model = pending.pop(0)
+        if model in seen:
+            continue
+
+        seen.add(model)
+        pending.extend(model.__subclasses__())
+
+        if model.__module__.split(".")[0] == "dataclasses_avroschema":
+            continue
+        if SchemaMetadata.create(getattr(model, "Meta", type)).warmup:
+            models.append(model)
+
+    return models
+
+
+def warmup(models: typing.Optional[typing.Iterable[typing.Type[AvroModel]]] = None) -> typing.List[WarmupReport]:
+    """
+    Build ahead of time the schemas and the plans to encode and decode of the models
+    (see `AvroModel.warmup`), so the first requests do not pay for them.
+
+    Attributes:
+        models: the models to warm up. By default the AvroModel subclasses that opt in (see `get_models`)
+
+    Returns the time spent on each model. A model that fails does not stop the warm-up of the rest,
+    its error is in its report. When the schema cache is enabled the new entries are saved.
+    """
+    reports = []
+
+    for model in get_models() if models is None else models:
+        error = None
+        start = time.perf_counter()
+        try:
+            model.warmup()
+        except Exception as exception:
+            error = exception
+        reports.append(WarmupReport(model=model, elapsed=time.perf_counter() - start, error=error))
+
+    persistent_cache = schema_cache.get_active()
+    if persistent_cache is not None:
+        persistent_cache.save()
+
+    return reports
@@ -247,3 +247,32 @@ def test_case_complex_fields_nested(case_type, schema):
             schema_doc = False
 
     assert schema == UserAdvance.avro_schema(case_type=case_type)
+
+
+def test_case_schemas_are_cached(monkeypatch):
+    class Event(AvroModel):
+        event_id: str
+
+        class Meta:
+            schema_doc = False
+
+    canonical_schema = Event.avro_schema()
+    camelcase_schema = Event.avro_schema(case_type=case.CAMELCASE)
+
+    # the canonical schema is not modified
+    assert Event.avro_schema() == canonical_schema
+    assert Event.rendered_schema["fields"][0]["name"] == "event_id"
+
+    calls = []
+    case_record = case.case_record
+
+    def spy(schema, case_type):
+        calls.append(case_type)
+        return case_record(schema, case_type)
+
+    monkeypatch.setattr(case, "case_record", spy)
+
+    assert Event.avro_schema(case_type=case.CAMELCASE) == camelcase_schema
+    assert Event.avro_schema(case_type=case.CAMELCASE) == camelcase_schema
+    assert Event.avro_schema(case_type=case.PASCALCASE) == Event.avro_schema(case_type=case.PASCALCASE)
+    assert calls == [case.PASCALCASE]
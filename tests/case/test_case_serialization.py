@@ -0,0 +1,121 @@
+import dataclasses
+import enum
+import json
+import typing
+
+import pytest
+
+from dataclasses_avroschema import AvroModel, case
+
+
+class Color(enum.Enum):
+    BLUE = "BLUE"
+
+
+@dataclasses.dataclass
+class Address(AvroModel):
+    street_name: str
+
+    class Meta:
+        namespace = "types.address"
+
+
+@dataclasses.dataclass
+class Car(AvroModel):
+    engine_name: str
+
+
+@dataclasses.dataclass
+class Bus(AvroModel):
+    driver_name: str
+    total_seats: int
+
+
+@dataclasses.dataclass
+class User(AvroModel):
+    first_name: str
+    home_address: Address
+    other_addresses: typing.List[Address]
+    addresses_by_city: typing.Dict[str, Address]
+    favorite_color: Color
+    transport: typing.Union[Car, Bus]
+    work_address: typing.Optional[Address] = None
+
+
+@pytest.fixture
+def user():
+    return User(
+        first_name="john",
+        home_address=Address(street_name="first street"),
+        other_addresses=[Address(street_name="second street")],
+        addresses_by_city={"Amsterdam": Address(street_name="third street")},
+        favorite_color=Color.BLUE,
+        transport=Bus(driver_name="peter", total_seats=50),
+        work_address=Address(street_name="fourth street"),
+    )
+
+
+@pytest.mark.parametrize("serialization_type", ("avro", "avro-json"))
+def test_serialization_with_case(user, serialization_type):
+    data = user.serialize(serialization_type=serialization_type, case_type=case.CAMELCASE)
+
+    assert User.deserialize(data, serialization_type=serialization_type, case_type=case.CAMELCASE) == user
+
+
+def test_serialization_with_case_renames_nested_fields(user):
+    data = user.serialize(serialization_type="avro-json", case_type=case.CAMELCASE)
+
+    # records defined inside unions are not cased in the schema, so they keep the original field names
+    assert json.loads(data) == {
+        "firstName": "john",
+        "homeAddress": {"streetName": "first street"},
+        "otherAddresses": [{"streetName": "second street"}],
+        "addressesByCity": {"Amsterdam": {"streetName": "third street"}},
+        "favoriteColor": "BLUE",
+        "transport": {"Bus": {"driver_name": "peter", "total_seats": 50}},
+        "workAddress": {"types.address.Address": {"streetName": "fourth street"}},
+    }
+
+
+def test_case_mapping():
+    source_schema = {
+        "type": "record",
+        "name": "User",
+        "fields": [
+            {"name": "first_name", "type": "string"},
+            {"name": "best_friend", "type": ["null", "User"]},
+            {"name": "transport", "type": [{"type": "array", "items": "User"}, {"type": "map", "values": "User"}]},
+        ],
+    }
+    target_schema = case.case_record(source_schema, case.PASCALCASE)
+    mapping = case.FieldsMapping(source_schema, target_schema)
+
+    value = {
+        "first_name": "john",
+        "best_friend": {"first_name": "peter", "best_friend": None, "transport": []},
+        "transport": {"friend": {"first_name": "paul", "best_friend": None, "transport": {}}},
+    }
+
+    assert mapping(value) == {
+        "FirstName": "john",
+        "BestFriend": {"FirstName": "peter", "BestFriend": None, "Transport": []},
+        "Transport": {"friend": {"FirstName": "paul", "BestFriend": None, "Transport": {}}},
+    }
+    assert case.FieldsMapping(target_schema, source_schema)(mapping(value)) == value
+
+
+def test_case_mapping_is_cached(user, monkeypatch):
+    user.serialize(case_type=case.SNAKECASE)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the case functions should not be called")
+
+    monkeypatch.setitem(case.CASE_TO_FUNC, case.SNAKECASE, fail)
+    data = user.serialize(case_type=case.SNAKECASE)
+
+    assert User.deserialize(data, case_type=case.SNAKECASE) == user
+
+
+def test_lazy_deserialization_with_case(user):
+    with pytest.raises(ValueError):
+        User.deserialize(user.serialize(case_type=case.CAMELCASE), case_type=case.CAMELCASE, lazy=True)
@@ -445,6 +445,12 @@ def test_fixed_type():
     assert expected == field.to_dict()
 
 
+def test_fixed_type_with_name():
+    field = fields.AvroField("a_fixed_field", types.Fixed, default=types.Fixed(16, name="md5"))
+
+    assert field.to_dict() == {"name": "a_fixed_field", "type": {"type": "fixed", "name": "md5", "size": 16}}
+
+
 def test_enum_type():
     """
     When the type is enum.Enum, the Avro field type should be Enum
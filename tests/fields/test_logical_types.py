@@ -4,7 +4,7 @@ import uuid
 
 import pytest
 
-from dataclasses_avroschema import field_utils, fields, types
+from dataclasses_avroschema import field_utils, fields, serialization, types
 
 from . import consts
 
@@ -305,3 +305,39 @@ def test_decimal_type():
         field = fields.AvroField(name, python_type, default=default)
 
         field.to_dict()
+
+
+def test_decimal_codec():
+    default = types.Decimal(scale=5, precision=7, default=decimal.Decimal("3.14"))
+    field = fields.AvroField("a_decimal_field", decimal.Decimal, default=default)
+    codec = field.codec
+
+    assert codec is serialization.get_decimal_codec(7, 5)
+    assert codec.to_str(decimal.Decimal("3.14")) == "\\u04ca90"
+    assert codec.from_str("\\u04ca90") == decimal.Decimal("3.14000")
+
+    values = [decimal.Decimal("3.14"), decimal.Decimal("-0.00001"), decimal.Decimal("0"), decimal.Decimal("12")]
+    encoded = codec.encode_many(values)
+
+    # the same bytes that fastavro writes
+    schema = {"type": "bytes", "logicalType": "decimal", "precision": 7, "scale": 5}
+    assert encoded == [serialization.serialize(value, schema)[1:] for value in values]
+    assert codec.decode_many(encoded) == values
+
+    with pytest.raises(ValueError, match="The decimal precision is bigger than allowed by schema"):
+        codec.to_bytes(decimal.Decimal("12345.678"))
+
+    # the digits fit the precision, but the unscaled integer 12300000 does not
+    with pytest.raises(ValueError, match="The decimal precision is bigger than allowed by schema"):
+        codec.to_bytes(decimal.Decimal("123"))
+
+    with pytest.raises(ValueError, match="The decimal precision is bigger than allowed by schema"):
+        codec.from_bytes((12300000).to_bytes(4, byteorder="big", signed=True))
+
+    assert codec.from_bytes((-9999999).to_bytes(4, byteorder="big", signed=True)) == decimal.Decimal("-99.99999")
+
+    with pytest.raises(ValueError, match="Scale provided in schema does not match the decimal"):
+        codec.to_bytes(decimal.Decimal("0.000001"))
+
+    with pytest.raises(ValueError, match="can not be represented as an avro decimal"):
+        codec.to_bytes(decimal.Decimal("NaN"))
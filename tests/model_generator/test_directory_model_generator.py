@@ -0,0 +1,208 @@
+import json
+import typing
+
+import pytest
+
+from dataclasses_avroschema import DirectoryModelGenerator, types
+
+address_schema = {
+    "type": "record",
+    "name": "Address",
+    "fields": [
+        {"name": "street", "type": "string"},
+        {"name": "street_number", "type": "long"},
+    ],
+}
+
+color_schema = {"type": "enum", "name": "favorite_color", "symbols": ["BLUE", "YELLOW", "GREEN"]}
+
+
+def write_schemas(path, schemas: typing.Dict[str, types.JsonDict]) -> None:
+    for file_name, schema in schemas.items():
+        (path / file_name).write_text(json.dumps(schema))
+
+
+@pytest.fixture
+def schemas_dir(tmp_path):
+    schemas_dir = tmp_path / "schemas"
+    schemas_dir.mkdir()
+
+    write_schemas(
+        schemas_dir,
+        {
+            "user.avsc": {
+                "type": "record",
+                "name": "User",
+                "fields": [
+                    {"name": "name", "type": "string"},
+                    {"name": "address", "type": address_schema},
+                    {"name": "favorite_color", "type": color_schema},
+                ],
+            },
+            "company.avsc": {
+                "type": "record",
+                "name": "Company",
+                "fields": [
+                    {"name": "name", "type": "string"},
+                    {"name": "address", "type": address_schema},
+                    {"name": "color", "type": color_schema},
+                ],
+            },
+            "address.avsc": address_schema,
+            # it references a type defined in other file
+            "delivery.avsc": {
+                "type": "record",
+                "name": "Delivery",
+                "fields": [{"name": "destination", "type": "Address"}],
+            },
+        },
+    )
+    return schemas_dir
+
+
+def test_render_directory_deduplicates_named_types(schemas_dir) -> None:
+    model_generator = DirectoryModelGenerator(max_workers=1)
+    result = model_generator.render_directory(path=str(schemas_dir))
+
+    assert result.count("class Address(AvroModel):") == 1
+    assert result.count("class FavoriteColor(enum.Enum):") == 1
+    assert result.index("class Address(AvroModel):") < result.index("class Company(AvroModel):")
+
+    namespace: typing.Dict[str, typing.Any] = {}
+    exec(result, namespace)
+
+    user = namespace["User"](
+        name="john",
+        address=namespace["Address"](street="test", street_number=10),
+        favorite_color=namespace["FavoriteColor"].BLUE,
+    )
+    assert namespace["User"].deserialize(user.serialize()) == user
+    assert [report.path for report in model_generator.reports] == [
+        "address.avsc",
+        "company.avsc",
+        "delivery.avsc",
+        "user.avsc",
+    ]
+    assert not any(report.cached for report in model_generator.reports)
+
+
+def test_render_directory_with_process_pool(schemas_dir) -> None:
+    result = DirectoryModelGenerator(max_workers=2).render_directory(path=str(schemas_dir))
+    assert result == DirectoryModelGenerator(max_workers=1).render_directory(path=str(schemas_dir))
+
+
+def test_render_directory_cache(schemas_dir, tmp_path) -> None:
+    cache_path = str(tmp_path / "cache.json")
+    model_generator = DirectoryModelGenerator(cache_path=cache_path, max_workers=1)
+
+    result = model_generator.render_directory(path=str(schemas_dir))
+    assert model_generator.render_directory(path=str(schemas_dir)) == result
+    assert all(report.cached for report in model_generator.reports)
+
+    delivery_schema = {
+        "type": "record",
+        "name": "Delivery",
+        "fields": [{"name": "destination", "type": "Address"}, {"name": "notes", "type": "string"}],
+    }
+    write_schemas(schemas_dir, {"delivery.avsc": delivery_schema})
+    model_generator = DirectoryModelGenerator(cache_path=cache_path, max_workers=1)
+    result = model_generator.render_directory(path=str(schemas_dir))
+
+    assert [report.path for report in model_generator.reports if not report.cached] == ["delivery.avsc"]
+    assert "notes: str" in result
+    assert result == DirectoryModelGenerator(max_workers=1).render_directory(path=str(schemas_dir))
+
+
+def test_render_directory_conflicting_definitions(schemas_dir) -> None:
+    write_schemas(
+        schemas_dir,
+        {
+            "other_color.avsc": {
+                "type": "record",
+                "name": "Shop",
+                "fields": [{"name": "color", "type": {**color_schema, "symbols": ["RED"]}}],
+            }
+        },
+    )
+
+    with pytest.raises(ValueError, match="favorite_color is defined in"):
+        DirectoryModelGenerator(max_workers=1).render_directory(path=str(schemas_dir))
+
+
+def test_render_directory_invalid_reference(schemas_dir) -> None:
+    write_schemas(
+        schemas_dir,
+        {"order.avsc": {"type": "record", "name": "Order", "fields": [{"name": "item", "type": "Item"}]}},
+    )
+
+    with pytest.raises(ValueError, match="Item"):
+        DirectoryModelGenerator(max_workers=1).render_directory(path=str(schemas_dir))
+
+
+def test_render_directory_cache_referenced_types_changed(schemas_dir, tmp_path) -> None:
+    cache_path = str(tmp_path / "cache.json")
+    DirectoryModelGenerator(cache_path=cache_path, max_workers=1).render_directory(path=str(schemas_dir))
+
+    # delivery.avsc does not change, but the type that it references does
+    address = {**address_schema, "fields": address_schema["fields"] + [{"name": "city", "type": "string"}]}
+    write_schemas(schemas_dir, {"address.avsc": address})
+    for file_name in ("user.avsc", "company.avsc"):
+        schema = json.loads((schemas_dir / file_name).read_text())
+        schema["fields"][1]["type"] = address
+        write_schemas(schemas_dir, {file_name: schema})
+
+    model_generator = DirectoryModelGenerator(cache_path=cache_path, max_workers=1)
+    result = model_generator.render_directory(path=str(schemas_dir))
+
+    assert not any(report.cached for report in model_generator.reports)
+    assert result.count("city: str") == 1
+    assert result == DirectoryModelGenerator(max_workers=1).render_directory(path=str(schemas_dir))
+
+
+def test_render_directory_type_nested_in_other_file(tmp_path) -> None:
+    write_schemas(
+        tmp_path,
+        {
+            "a.avsc": {"type": "record", "name": "A", "namespace": "ns", "fields": [{"name": "t", "type": "ns.T"}]},
+            "b.avsc": {
+                "type": "record",
+                "name": "B",
+                "namespace": "ns",
+                "fields": [
+                    {"name": "t", "type": {"type": "record", "name": "T", "fields": [{"name": "x", "type": "long"}]}}
+                ],
+            },
+        },
+    )
+    result = DirectoryModelGenerator(max_workers=1).render_directory(path=str(tmp_path))
+
+    assert result.count("class T(AvroModel):") == 1
+    assert result.index("class T(AvroModel):") < result.index("class B(AvroModel):") < result.index("class A(")
+
+    namespace: typing.Dict[str, typing.Any] = {}
+    exec(result, namespace)
+    a = namespace["A"](t=namespace["T"](x=1))
+    assert namespace["A"].deserialize(a.serialize()) == a
+
+
+def test_render_directory_same_name_in_different_namespaces(tmp_path) -> None:
+    write_schemas(
+        tmp_path,
+        {
+            "a.avsc": {
+                "type": "record",
+                "name": "User",
+                "namespace": "first",
+                "fields": [{"name": "x", "type": "long"}],
+            },
+            "b.avsc": {
+                "type": "record",
+                "name": "User",
+                "namespace": "second",
+                "fields": [{"name": "y", "type": "long"}],
+            },
+        },
+    )
+
+    with pytest.raises(ValueError, match="first.User and second.User are rendered with the same class name User"):
+        DirectoryModelGenerator(max_workers=1).render_directory(path=str(tmp_path))
@@ -0,0 +1,157 @@
+import dataclasses
+import datetime
+import decimal
+import enum
+import io
+import typing
+import uuid
+import warnings
+
+import fastavro
+import pytest
+
+from dataclasses_avroschema import AvroModel, BaseClassEnum, ModelBuilder, types
+from dataclasses_avroschema.avrodantic import AvroBaseModel
+from dataclasses_avroschema.model_generator import builder
+
+
+@pytest.fixture
+def user_schema() -> types.JsonDict:
+    return {
+        "type": "record",
+        "name": "User",
+        "namespace": "com.example",
+        "doc": "An User",
+        "fields": [
+            {"name": "name", "type": "string", "default": "john"},
+            {"name": "age", "type": "int"},
+            {"name": "money", "type": {"type": "bytes", "logicalType": "decimal", "precision": 5, "scale": 2}},
+            {"name": "color", "type": {"type": "enum", "name": "Color", "symbols": ["BLUE", "RED"]}, "default": "RED"},
+            {"name": "other_color", "type": ["null", "Color"], "default": None},
+            {
+                "name": "address",
+                "type": {"type": "record", "name": "Address", "fields": [{"name": "street", "type": "string"}]},
+            },
+            {"name": "addresses", "type": {"type": "array", "items": "Address"}, "default": []},
+            {"name": "tags", "type": {"type": "map", "values": "long"}, "default": {"a": 1}},
+            {"name": "born", "type": {"type": "int", "logicalType": "date"}},
+            {"name": "id", "type": {"type": "string", "logicalType": "uuid"}},
+            {"name": "friend", "type": ["null", "User"], "default": None},
+            {"name": "union", "type": ["string", "long"]},
+            {"name": "payload", "type": "bytes", "default": "hi"},
+            {"name": "md5", "type": {"type": "fixed", "name": "Hash", "size": 4}},
+        ],
+    }
+
+
+def get_field_type(model: typing.Type, name: str) -> typing.Any:
+    if dataclasses.is_dataclass(model):
+        return model.__dataclass_fields__[name].type
+    return model.__fields__[name].type_
+
+
+def test_build_model(user_schema: types.JsonDict) -> None:
+    model = ModelBuilder().build(schema=user_schema)
+
+    assert issubclass(model, AvroModel)
+    assert model.__name__ == "User"
+    assert issubclass(get_field_type(model, "color"), enum.Enum)
+
+    schema = model.avro_schema_to_python()
+    assert schema["namespace"] == "com.example"
+    assert schema["doc"] == "An User"
+    assert {field["name"] for field in schema["fields"]} == {field["name"] for field in user_schema["fields"]}
+    # it can decode data encoded with the original schema
+    fastavro.parse_schema(schema)
+
+
+@pytest.mark.parametrize("base_class", [BaseClassEnum.AVRO_MODEL.value, BaseClassEnum.AVRO_DANTIC_MODEL.value])
+def test_build_model_serialization(user_schema: types.JsonDict, base_class: str) -> None:
+    model = ModelBuilder(base_class=base_class).build(schema=user_schema)
+    address = get_field_type(model, "address")(street="test")
+    instance = model(
+        age=20,
+        money=decimal.Decimal("10.25"),
+        address=address,
+        born=datetime.date(2020, 1, 1),
+        id=uuid.UUID("09f00184-7721-4266-a955-21048a5cc235"),
+        union=10,
+        md5=b"abcd",
+    )
+
+    assert instance.name == "john"
+    assert instance.color == get_field_type(model, "color").RED
+    assert instance.tags == {"a": 1}
+    assert instance.payload == b"hi"
+    assert model.deserialize(instance.serialize()) == instance
+
+    # data encoded with the original schema
+    output = io.BytesIO()
+    fastavro.schemaless_writer(output, fastavro.parse_schema(user_schema), instance.asdict())
+    assert model.deserialize(output.getvalue(), writer_schema=user_schema) == instance
+
+
+def test_build_model_base_class(user_schema: types.JsonDict) -> None:
+    model = ModelBuilder(base_class=BaseClassEnum.AVRO_DANTIC_MODEL.value).build(schema=user_schema)
+    assert issubclass(model, AvroBaseModel)
+
+    with pytest.raises(ValueError):
+        ModelBuilder(base_class=BaseClassEnum.PYDANTIC_MODEL.value)
+
+
+def test_build_model_cache(user_schema: types.JsonDict) -> None:
+    model_builder = ModelBuilder(max_size=1)
+    model = model_builder.build(schema=user_schema)
+
+    # same schema with the keys in a different order
+    assert model_builder.build(schema=dict(reversed(list(user_schema.items())))) is model
+
+    other_model = model_builder.build(schema={**user_schema, "doc": "Other User"})
+    assert other_model is not model
+    assert list(model_builder.models.values()) == [other_model]
+    assert model_builder.build(schema=user_schema) is not model
+
+
+def test_build_invalid_schema() -> None:
+    with pytest.raises(fastavro.schema.UnknownType):
+        ModelBuilder().build(schema={"type": "record", "name": "User", "fields": [{"name": "a", "type": "Unknown"}]})
+
+
+@pytest.mark.parametrize("base_class", [BaseClassEnum.AVRO_MODEL.value, BaseClassEnum.AVRO_DANTIC_MODEL.value])
+def test_build_model_keeps_fields_order(user_schema: types.JsonDict, base_class: str) -> None:
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        model = ModelBuilder(base_class=base_class).build(schema=user_schema)
+
+    schema = model.avro_schema_to_python()
+    assert [field["name"] for field in schema["fields"]] == [field["name"] for field in user_schema["fields"]]
+    assert schema["fields"][-1]["type"]["name"] == "Hash"
+    assert model.get_fingerprint() == fastavro.schema.fingerprint(
+        fastavro.schema.to_parsing_canonical_form(user_schema), "CRC-64-AVRO"
+    )
+
+    # payloads encoded with the source schema are decoded without writer_schema
+    instance = model.fake()
+    output = io.BytesIO()
+    fastavro.schemaless_writer(output, fastavro.parse_schema(user_schema), instance.asdict())
+    assert output.getvalue() == instance.serialize()
+    assert model.deserialize(output.getvalue()) == model.deserialize(instance.serialize())
+
+
+def test_build_model_keeps_fields_order_without_kw_only(user_schema: types.JsonDict, monkeypatch) -> None:
+    monkeypatch.setattr(builder, "PY_VER", (3, 9))
+    model = ModelBuilder().build(schema=user_schema)
+
+    # the fields without default are the first ones of the class, the schema keeps the original order
+    names = [field["name"] for field in user_schema["fields"]]
+    assert [field.name for field in dataclasses.fields(model)][:3] == ["age", "address", "born"]
+    assert model.Meta.field_order == names
+
+    schema = model.avro_schema_to_python()
+    assert [field["name"] for field in schema["fields"]] == names
+
+    instance = model.fake()
+    output = io.BytesIO()
+    fastavro.schemaless_writer(output, fastavro.parse_schema(user_schema), instance.asdict())
+    assert output.getvalue() == instance.serialize()
+    assert model.deserialize(output.getvalue()) == model.deserialize(instance.serialize())
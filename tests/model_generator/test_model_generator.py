@@ -1,7 +1,20 @@
+import io
+import typing
+
+import fastavro
+import pytest
+from fastavro.schema import UnknownType
+
 from dataclasses_avroschema import ModelGenerator, field_utils, types
 from dataclasses_avroschema.model_generator.avro_to_python_utils import render_datetime
 
 
+def fastavro_encode(schema: types.JsonDict, payload: types.JsonDict) -> bytes:
+    output = io.BytesIO()
+    fastavro.schemaless_writer(output, fastavro.parse_schema(schema), payload)
+    return output.getvalue()
+
+
 def test_model_generator_primitive_types(schema: types.JsonDict) -> None:
     expected_result = """
 from dataclasses_avroschema import AvroModel
@@ -372,3 +385,238 @@ class Address(AvroModel):
     model_generator = ModelGenerator()
     result = model_generator.render_module(schemas=[schema, schema_2])
     assert result.strip() == expected_result.strip()
+
+
+def test_model_generator_with_serializers(schema_2: types.JsonDict) -> None:
+    expected_result = """
+from dataclasses_avroschema import AvroModel
+from dataclasses_avroschema import serialization
+from dataclasses_avroschema import types
+import dacite
+import dataclasses
+import enum
+import fastavro
+
+
+@dataclasses.dataclass
+class Address(AvroModel):
+    street: str
+    street_number: int
+
+    class Meta:
+        schema_doc = "An Address"
+
+
+DACITE_CONFIG = dacite.Config(check_types=False, cast=[enum.Enum], forward_references={"Address": Address})
+
+_NAMED_SCHEMAS: dict = {}
+
+ADDRESS_SCHEMA = {'type': 'record', 'name': 'Address', 'fields': [{'name': 'street', 'type': 'string'}, {'name': 'street_number', 'type': 'long'}], 'doc': 'An Address'}
+ADDRESS_PARSED_SCHEMA = fastavro.parse_schema(ADDRESS_SCHEMA, named_schemas=_NAMED_SCHEMAS)
+
+
+def encode_address(instance: Address, serialization_type: str = "avro") -> bytes:
+    return serialization.serialize(instance.asdict(), ADDRESS_PARSED_SCHEMA, serialization_type=serialization_type)
+
+
+def decode_address(data: types.BytesLike, serialization_type: str = "avro") -> Address:
+    payload = serialization.deserialize(data, ADDRESS_PARSED_SCHEMA, serialization_type=serialization_type)
+    return dacite.from_dict(data_class=Address, data=payload, config=DACITE_CONFIG)
+"""  # noqa: E501
+    model_generator = ModelGenerator(include_serializers=True)
+    result = model_generator.render(schema=schema_2)
+    assert result.strip() == expected_result.strip()
+
+
+def test_model_generator_serializers_roundtrip(schema_with_enum_types: types.JsonDict) -> None:
+    model_generator = ModelGenerator(include_serializers=True)
+    module: typing.Dict[str, typing.Any] = {}
+    exec(model_generator.render(schema=schema_with_enum_types), module)
+
+    User = module["User"]
+    user = User(favorite_color=module["FavoriteColor"].BLUE, cars=module["Cars"].DUNA)
+
+    for serialization_type in ("avro", "avro-json"):
+        data = module["encode_user"](user, serialization_type=serialization_type)
+        assert module["decode_user"](data, serialization_type=serialization_type) == user
+
+    # the data is encoded with the original schema and the model did not generate its schema
+    assert module["decode_user"](
+        fastavro_encode(schema_with_enum_types, {"favorite_color": "Blue", "superheros": "batman", "cars": None})
+    ) == User(favorite_color=module["FavoriteColor"].BLUE)
+    assert User.schema_def is None
+
+
+def test_model_generator_serializers_self_reference() -> None:
+    schema = {
+        "type": "record",
+        "name": "Node",
+        "fields": [{"name": "v", "type": "long"}, {"name": "next", "type": ["null", "Node"], "default": None}],
+    }
+    model_generator = ModelGenerator(include_serializers=True)
+    module: typing.Dict[str, typing.Any] = {}
+    exec(model_generator.render(schema=schema), module)
+
+    Node = module["Node"]
+    node = Node(v=1, next=Node(v=2, next=Node(v=3)))
+    result = module["decode_node"](module["encode_node"](node))
+
+    assert result == node
+    assert isinstance(result.next.next, Node)
+    assert result == Node.deserialize(node.serialize())
+
+
+def test_model_generator_references_between_schemas() -> None:
+    address = {
+        "type": "record",
+        "name": "Address",
+        "namespace": "com.example",
+        "fields": [
+            {"name": "street", "type": "string"},
+            {"name": "kind", "type": {"type": "enum", "name": "AddressKind", "symbols": ["HOME", "WORK"]}},
+        ],
+    }
+    user = {
+        "type": "record",
+        "name": "User",
+        "fields": [
+            {"name": "address", "type": "com.example.Address"},
+            {"name": "addresses", "type": {"type": "array", "items": "com.example.Address"}},
+            {"name": "kind", "type": "com.example.AddressKind"},
+        ],
+    }
+    expected_result = """
+from dataclasses_avroschema import AvroModel
+import dataclasses
+import enum
+import typing
+
+
+class AddressKind(enum.Enum):
+    HOME = "HOME"
+    WORK = "WORK"
+
+
+@dataclasses.dataclass
+class Address(AvroModel):
+    street: str
+    kind: AddressKind
+
+    class Meta:
+        namespace = "com.example"
+
+
+@dataclasses.dataclass
+class User(AvroModel):
+    address: Address
+    addresses: typing.List[Address]
+    kind: AddressKind
+"""
+    model_generator = ModelGenerator()
+    result = model_generator.render_module(schemas=[user, address])
+    assert result.strip() == expected_result.strip()
+    assert set(model_generator.parsed_named_types) == {"com.example.Address", "com.example.AddressKind", "User"}
+
+
+def test_model_generator_serializers_references_between_schemas() -> None:
+    address = {
+        "type": "record",
+        "name": "Address",
+        "namespace": "com.example",
+        "fields": [{"name": "street", "type": "string"}],
+    }
+    user = {
+        "type": "record",
+        "name": "User",
+        "fields": [
+            {"name": "address", "type": "com.example.Address"},
+            {"name": "addresses", "type": {"type": "array", "items": "com.example.Address"}},
+        ],
+    }
+    model_generator = ModelGenerator(include_serializers=True)
+    module: typing.Dict[str, typing.Any] = {}
+    # the user schema is first, but it is parsed after the address schema that it references
+    exec(model_generator.render_module(schemas=[user, address]), module)
+
+    Address = module["Address"]
+    user_instance = module["User"](address=Address(street="a"), addresses=[Address(street="b")])
+
+    assert module["decode_user"](module["encode_user"](user_instance)) == user_instance
+    assert module["decode_address"](module["encode_address"](Address(street="c"))) == Address(street="c")
+
+
+def test_model_generator_reused_generator() -> None:
+    address = {
+        "type": "record",
+        "name": "Address",
+        "namespace": "com.example",
+        "fields": [{"name": "street", "type": "string"}, {"name": "number", "type": "long", "default": 1}],
+    }
+    user = {
+        "type": "record",
+        "name": "User",
+        "namespace": "com.example",
+        "fields": [{"name": "name", "type": "string"}, {"name": "address", "type": "Address"}],
+    }
+    model_generator = ModelGenerator()
+    address_module = model_generator.render(schema=address)
+
+    # the Address schema is rendered with the original order of the fields and only once
+    result = model_generator.render(schema=user)
+    assert result.count("class Address(AvroModel):") == 1
+    assert result.index("class Address(AvroModel):") < result.index("class User(AvroModel):")
+
+    module: typing.Dict[str, typing.Any] = {}
+    exec(result, module)
+    user_instance = module["User"](name="john", address=module["Address"](street="test"))
+    assert module["User"].deserialize(user_instance.serialize()) == user_instance
+
+    # rendering the same schema again returns the same module
+    assert model_generator.render(schema=address) == address_module
+
+
+def test_model_generator_same_named_type_in_many_schemas(schema_2: types.JsonDict) -> None:
+    user = {
+        "type": "record",
+        "name": "User",
+        "fields": [{"name": "address", "type": schema_2}],
+    }
+    company = {
+        "type": "record",
+        "name": "Company",
+        "fields": [{"name": "address", "type": schema_2}],
+    }
+    result = ModelGenerator().render_module(schemas=[user, company, schema_2])
+    assert result.count("class Address(AvroModel):") == 1
+
+
+def test_model_generator_named_type_redefined(schema_2: types.JsonDict) -> None:
+    model_generator = ModelGenerator()
+    model_generator.render(schema=schema_2)
+
+    with pytest.raises(ValueError, match="Address is already defined with a different schema"):
+        model_generator.render(schema={**schema_2, "fields": [{"name": "street", "type": "string"}]})
+
+    # the repository did not change
+    assert model_generator.named_types["Address"]["fields"] == schema_2["fields"]
+
+
+def test_model_generator_fixed_reference() -> None:
+    schema = {
+        "type": "record",
+        "name": "User",
+        "fields": [
+            {"name": "md5", "type": {"type": "fixed", "name": "md5", "size": 16}},
+            {"name": "other_md5", "type": "md5"},
+        ],
+    }
+    result = ModelGenerator().render(schema=schema)
+    assert "md5: types.Fixed = types.Fixed(16)" in result
+    assert "other_md5: types.Fixed = types.Fixed(16)" in result
+
+
+def test_model_generator_unknown_reference() -> None:
+    schema = {"type": "record", "name": "User", "fields": [{"name": "address", "type": "Address"}]}
+
+    with pytest.raises(UnknownType):
+        ModelGenerator().render(schema=schema)
@@ -1,3 +1,7 @@
+import typing
+
+import pytest
+
 from dataclasses_avroschema import BaseClassEnum, ModelGenerator, types
 
 
@@ -111,3 +115,21 @@ class Demo(AvroBaseModel):
     model_generator = ModelGenerator(base_class=BaseClassEnum.AVRO_DANTIC_MODEL.value)
     result = model_generator.render(schema=schema_with_decimal_field)
     assert result.strip() == expected_result.strip()
+
+
+def test_avro_pydantic_model_with_serializers(schema_one_to_many_map_relationship: types.JsonDict) -> None:
+    model_generator = ModelGenerator(base_class=BaseClassEnum.AVRO_DANTIC_MODEL.value, include_serializers=True)
+    result = model_generator.render(schema=schema_one_to_many_map_relationship)
+    assert "return User.parse_obj(payload)" in result
+
+    module: typing.Dict[str, typing.Any] = {}
+    exec(result, module)
+
+    address = module["Address"](street="test", street_number=10)
+    user = module["User"](name="john", age=20, addresses={"home": address}, crazy_union="crazy")
+    assert module["decode_user"](module["encode_user"](user)) == user
+
+
+def test_pydantic_model_with_serializers() -> None:
+    with pytest.raises(ValueError):
+        ModelGenerator(base_class=BaseClassEnum.PYDANTIC_MODEL.value, include_serializers=True)
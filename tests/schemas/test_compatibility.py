@@ -0,0 +1,191 @@
+import dataclasses
+import enum
+import typing
+
+import pytest
+from fastavro.read import SchemaResolutionError
+
+from dataclasses_avroschema import AvroModel, compatibility, schema_ir
+
+
+class Color(enum.Enum):
+    BLUE = "BLUE"
+    RED = "RED"
+
+    class Meta:
+        namespace = "colors"
+
+
+class NewColor(enum.Enum):
+    BLUE = "BLUE"
+    RED = "RED"
+    GREEN = "GREEN"
+
+    class Meta:
+        namespace = "colors"
+        aliases = ["Color"]
+
+
+@dataclasses.dataclass
+class User(AvroModel):
+    name: str
+    age: int
+    color: Color
+
+
+@dataclasses.dataclass
+class UserWithEmail(AvroModel):
+    name: str
+    age: int
+    color: Color
+    email: str = "no email"
+
+    class Meta:
+        schema_name = "User"
+
+
+@dataclasses.dataclass
+class UserWithRequiredEmail(AvroModel):
+    name: str
+    age: int
+    color: Color
+    email: str
+
+    class Meta:
+        schema_name = "User"
+
+
+@dataclasses.dataclass
+class UserWithoutAge(AvroModel):
+    name: str
+    color: Color
+
+    class Meta:
+        schema_name = "User"
+
+
+@dataclasses.dataclass
+class UserWithFloatAge(AvroModel):
+    name: str
+    age: float
+    color: Color
+
+    class Meta:
+        schema_name = "User"
+
+
+@dataclasses.dataclass
+class UserWithOptionalName(AvroModel):
+    name: typing.Optional[str]
+    age: int
+    color: Color
+
+    class Meta:
+        schema_name = "User"
+
+
+@dataclasses.dataclass
+class UserWithRenamedName(AvroModel):
+    full_name: str = dataclasses.field(metadata={"aliases": ["name"]})
+    age: int = 0
+    color: Color = Color.BLUE
+
+    class Meta:
+        schema_name = "User"
+
+
+@dataclasses.dataclass
+class Person(AvroModel):
+    name: str
+    age: int
+    color: Color
+
+    class Meta:
+        aliases = ["User"]
+
+
+@dataclasses.dataclass
+class Customer(AvroModel):
+    name: str
+    age: int
+    color: Color
+
+
+@pytest.mark.parametrize(
+    "new, old, backward, forward",
+    (
+        (User, User, True, True),
+        (UserWithEmail, User, True, True),
+        (UserWithRequiredEmail, User, False, True),
+        (UserWithoutAge, User, True, False),
+        (UserWithFloatAge, User, True, False),
+        (UserWithOptionalName, User, True, False),
+        (UserWithRenamedName, User, True, False),
+        (Person, User, True, False),
+        (Customer, User, False, False),
+    ),
+)
+def test_is_compatible(new, old, backward, forward):
+    assert new.is_compatible(old) is backward
+    assert new.is_compatible(old, mode="forward") is forward
+    assert new.is_compatible(old, mode="full") is (backward and forward)
+
+    # the static check has the same result as decoding the data
+    data = old.fake().serialize()
+    if backward:
+        assert new.deserialize(data, writer_schema=old, create_instance=False)
+    else:
+        with pytest.raises(SchemaResolutionError):
+            new.deserialize(data, writer_schema=old, create_instance=False)
+
+
+def test_is_compatible_is_cached():
+    assert UserWithEmail.is_compatible(User)
+    assert UserWithEmail._get_class_cache()[("compatibility", User, "backward")] is True
+
+    with pytest.raises(ValueError, match="Invalid compatibility mode"):
+        UserWithEmail.is_compatible(User, mode="transitive")
+
+
+def test_enum_symbols():
+    @dataclasses.dataclass
+    class Car(AvroModel):
+        color: Color
+
+    @dataclasses.dataclass
+    class NewCar(AvroModel):
+        color: NewColor
+
+        class Meta:
+            schema_name = "Car"
+
+    assert NewCar.is_compatible(Car)
+    assert not NewCar.is_compatible(Car, mode="forward")
+
+    # with a default symbol the unknown symbols are read as the default
+    reader = schema_ir.build({"type": "enum", "name": "Color", "symbols": ["BLUE"], "default": "BLUE"})
+    writer = schema_ir.build({"type": "enum", "name": "Color", "symbols": ["BLUE", "RED"]})
+    assert compatibility.can_read(reader, writer)
+
+
+def test_self_relationship():
+    def create_node(value_type: typing.Type, with_label: bool) -> typing.Type[AvroModel]:
+        @dataclasses.dataclass
+        class Node(AvroModel):
+            value: value_type  # type: ignore
+            next: typing.Optional[typing.Type["Node"]] = None
+
+        if not with_label:
+            return Node
+
+        @dataclasses.dataclass
+        class Node(Node):  # type: ignore
+            label: str = ""
+
+        return Node
+
+    node = create_node(int, with_label=False)
+    new_node = create_node(float, with_label=True)
+
+    assert new_node.is_compatible(node)
+    assert not new_node.is_compatible(node, mode="full")
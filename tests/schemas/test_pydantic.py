@@ -6,7 +6,7 @@ import typing
 import uuid
 
 import pytest
-from pydantic import Field, error_wrappers
+from pydantic import Field, error_wrappers, validator
 
 from dataclasses_avroschema import types, utils
 from dataclasses_avroschema.avrodantic import AvroBaseModel
@@ -271,6 +271,18 @@ def test_validate():
     assert user.validate_avro()
 
 
+def test_fixed_values():
+    class User(AvroBaseModel):
+        md5: types.Fixed = types.Fixed(4)
+
+    user = User(md5=b"abcd")
+    assert User.deserialize(user.serialize()) == user
+    assert isinstance(User.fake().md5, bytes)
+
+    with pytest.raises(error_wrappers.ValidationError):
+        User(md5=4)
+
+
 def test_json_schema(AvroBaseModel_model):
     assert AvroBaseModel_model.json_schema()
 
@@ -394,3 +406,102 @@ def test_fake(color_enum) -> None:
     # just calling fake is enougt to know that a proper instance was created,
     # otherwise a pydantic validation should have been raised
     User.fake()
+
+
+def test_trusted_deserialization(color_enum) -> None:
+    class Address(AvroBaseModel):
+        street: str
+        street_number: int
+
+        class Meta:
+            namespace = "trip.address"
+
+    class Size(enum.Enum):
+        SMALL = "SMALL"
+        BIG = "BIG"
+
+    class Trip(AvroBaseModel):
+        name: str
+        duration: types.Int32
+        price: decimal.Decimal = types.Decimal(scale=2, precision=5)
+        started_at: datetime.datetime
+        color: color_enum
+        address: Address
+        stops: typing.List[Address]
+        stops_by_name: typing.Dict[str, Address]
+        sizes: typing.List[Size]
+        destination: typing.Optional[Address] = None
+        location: typing.Union[Address, str] = "home"
+        tags: typing.List[str] = Field(default_factory=list)
+
+    class TrustedTrip(Trip):
+        class Meta:
+            schema_name = "Trip"
+            trusted = True
+
+    address = Address(street="test", street_number=10)
+    trip = Trip(
+        name="trip",
+        duration=10,
+        price=decimal.Decimal("10.25"),
+        started_at=datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc),
+        color=color_enum.BLUE,
+        address=address,
+        stops=[address],
+        stops_by_name={"first": address},
+        sizes=[Size.BIG, Size.SMALL],
+        location=address,
+        tags=["one", "two"],
+    )
+    data = trip.serialize()
+
+    trusted_trip = TrustedTrip.deserialize(data)
+    assert isinstance(trusted_trip.stops[0], Address)
+    assert isinstance(trusted_trip.location, Address)
+    assert trusted_trip.sizes == [Size.BIG, Size.SMALL]
+    assert trusted_trip.asdict() == Trip.deserialize(data).asdict() == trip.asdict()
+    assert trusted_trip.serialize() == data
+    assert TrustedTrip.deserialize_many(TrustedTrip.serialize_many([trusted_trip])) == [trusted_trip]
+
+
+def test_trusted_asdict_default_decimal() -> None:
+    class Account(AvroBaseModel):
+        balance: decimal.Decimal = types.Decimal(scale=2, precision=5, default=decimal.Decimal("1.50"))
+
+        class Meta:
+            trusted = True
+
+    assert Account().asdict() == {"balance": decimal.Decimal("1.50")}
+    assert Account.deserialize(Account().serialize()) == Account(balance=decimal.Decimal("1.50"))
+
+
+def test_not_trusted_deserialization_validates() -> None:
+    class User(AvroBaseModel):
+        name: str
+        age: int
+
+    class StrictUser(AvroBaseModel):
+        name: str
+        age: int
+
+        class Meta:
+            schema_name = "User"
+
+        @validator("age")
+        def check_age(cls, age: int) -> int:
+            if age < 18:
+                raise ValueError("age must be at least 18")
+            return age
+
+    data = User(name="john", age=10).serialize()
+
+    with pytest.raises(error_wrappers.ValidationError):
+        StrictUser.deserialize(data)
+
+    class TrustedUser(StrictUser):
+        class Meta:
+            schema_name = "User"
+            trusted = True
+
+    # the constraints of pydantic are not checked for trusted models
+    assert TrustedUser.deserialize(data).age == 10
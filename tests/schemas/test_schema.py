@@ -148,6 +148,20 @@ def test_inherit_dataclass_missing_docs():
     assert User.avro_schema()
 
 
+def test_field_order_from_meta():
+    @dataclass
+    class User(AvroModel):
+        age: int
+        name: str = "john"
+        money: float = 10.0
+
+        class Meta:
+            field_order = ["name", "age"]
+
+    assert [field["name"] for field in User.avro_schema_to_python()["fields"]] == ["name", "age", "money"]
+    assert User.deserialize(User(age=20).serialize()) == User(age=20)
+
+
 def test_get_fields():
     class Child(AvroModel):
         name: str
@@ -0,0 +1,126 @@
+import dataclasses
+import decimal
+import enum
+import json
+import typing
+
+import pytest
+
+from dataclasses_avroschema import AvroModel, schema_cache, types
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    yield tmp_path / "schemas.json"
+    schema_cache.disable()
+
+
+def create_model(doc: str = "A user", default_age: int = 20, colors: typing.Tuple[str, ...] = ("BLUE", "RED")):
+    Color = enum.Enum("Color", {color: color for color in colors})  # type: ignore
+    Color.__module__ = __name__
+
+    @dataclasses.dataclass
+    class Address(AvroModel):
+        street: str
+
+    @dataclasses.dataclass
+    class User(AvroModel):
+        name: str
+        color: Color  # type: ignore
+        addresses: typing.List[Address]
+        age: int = default_age
+        balance: decimal.Decimal = types.Decimal(precision=5, scale=2)
+
+    User.__doc__ = doc
+    return User
+
+
+def test_schema_cache(cache_path):
+    User = create_model()
+    cache = schema_cache.enable(cache_path)
+
+    schema = User.avro_schema_to_python()
+    fingerprint = User.get_fingerprint()
+    assert User.get_fingerprint("MD5")
+    cache.save()
+
+    entry = schema_cache.SchemaCache(cache_path).get(User, schema_cache.get_definition_hash(User))
+    assert json.loads(entry["schema"]) == schema
+    assert entry["fingerprints"] == {"CRC-64-AVRO": fingerprint, "MD5": User.get_fingerprint("MD5")}
+    assert entry["parsed_schema"]["__fastavro_parsed"]
+    assert entry["features"] == {"recursive": False, "number_arrays": False, "named_unions": False}
+    assert entry["enum_fields"] == {"color": "enum"}
+
+    # a new process with the same model definition uses the entry
+    entry["schema"] = json.dumps({**schema, "doc": "from the cache"})
+    with open(cache_path, "w") as cache_file:
+        json.dump(
+            {
+                "version": schema_cache.CACHE_VERSION,
+                "library_version": schema_cache.get_library_version(),
+                "models": {schema_cache.get_model_key(User): entry},
+            },
+            cache_file,
+        )
+
+    User = create_model()
+    schema_cache.enable(cache_path)
+    assert User.avro_schema_to_python()["doc"] == "from the cache"
+    assert User.get_fingerprint() == fingerprint
+
+    user = User(name="john", color=User.get_fields()[1].type.BLUE, addresses=[], balance=decimal.Decimal("1.50"))
+    assert User.deserialize(user.serialize()) == user
+
+
+def test_stale_entries_are_created_again(cache_path):
+    User = create_model()
+    schema_cache.enable(cache_path).save()
+    User.avro_schema_to_python()
+    schema_cache.disable()
+
+    NewUser = create_model(doc="A new user")
+    schema_cache.enable(cache_path)
+    assert NewUser.avro_schema_to_python()["doc"] == "A new user"
+
+    schema_cache.disable()
+    with open(cache_path) as cache_file:
+        cache = json.load(cache_file)
+    assert cache["models"][schema_cache.get_model_key(User)]["hash"] == schema_cache.get_definition_hash(NewUser)
+
+    # files of other library versions are ignored
+    cache["library_version"] = "0.0.0"
+    with open(cache_path, "w") as cache_file:
+        json.dump(cache, cache_file)
+    assert schema_cache.SchemaCache(cache_path).entries == {}
+
+
+def test_first_serialization_does_not_render_the_schema(cache_path, monkeypatch):
+    User = create_model()
+    schema_cache.enable(cache_path)
+    User.avro_schema_to_python()
+    schema_cache.disable()
+
+    # a new process with the same model definition
+    User = create_model()
+    schema_cache.enable(cache_path)
+    Color = User.__annotations__["color"]
+    Address = User.__annotations__["addresses"].__args__[0]
+    user = User(name="john", color=Color.BLUE, addresses=[Address(street="main")], balance=decimal.Decimal("1.50"))
+
+    def generate_schema(cls, schema_type="avro"):
+        raise AssertionError(f"The schema of {cls.__name__} was rendered")
+
+    monkeypatch.setattr(AvroModel, "generate_schema", classmethod(generate_schema))
+    data = user.serialize()
+
+    assert User.deserialize(data) == user
+    assert User.deserialize(data, create_instance=False)["color"] is Color.BLUE
+
+
+def test_definition_hash():
+    definition_hash = schema_cache.get_definition_hash(create_model())
+
+    assert definition_hash == schema_cache.get_definition_hash(create_model())
+    assert definition_hash != schema_cache.get_definition_hash(create_model(doc="Another doc"))
+    assert definition_hash != schema_cache.get_definition_hash(create_model(default_age=30))
+    assert definition_hash != schema_cache.get_definition_hash(create_model(colors=("BLUE", "GREEN")))
@@ -0,0 +1,58 @@
+import dataclasses
+import glob
+import json
+import os
+import typing
+
+import pytest
+from fastavro.schema import fingerprint, to_parsing_canonical_form
+
+from dataclasses_avroschema import AvroModel, schema_ir
+
+AVRO_PATH = os.path.join(os.path.dirname(__file__), "avro")
+
+
+@pytest.mark.parametrize("file_name", sorted(glob.glob(os.path.join(AVRO_PATH, "*.avsc"))))
+def test_schema_ir(file_name):
+    with open(file_name) as fp:
+        schema = json.load(fp)
+
+    node = schema_ir.build(schema)
+
+    assert hash(node) == hash(schema_ir.build(schema))
+    assert schema_ir.to_python(node) == schema
+    assert schema_ir.canonical_form(node) == to_parsing_canonical_form(schema)
+    assert schema_ir.fingerprint(node, "MD5") == fingerprint(to_parsing_canonical_form(schema), "MD5")
+
+
+def test_repeated_types_are_shared():
+    @dataclasses.dataclass
+    class Address(AvroModel):
+        street: str
+        street_number: int
+
+        class Meta:
+            namespace = "users.address"
+
+    @dataclasses.dataclass
+    class User(AvroModel):
+        name: str
+        friend_name: str
+        address: Address
+        addresses: typing.List[Address]
+        previous_addresses: typing.List[Address]
+
+        class Meta:
+            namespace = "users"
+
+    node = User.get_schema_ir()
+    address, addresses, previous_addresses = node.fields[2:]
+
+    assert node is User.get_schema_ir()
+    assert node.fields[0].type is node.fields[1].type
+    assert addresses.type.items is previous_addresses.type.items
+    assert addresses.type.items == schema_ir.ReferenceNode("users.address.Address", "users.address.Address")
+    assert schema_ir.get_named_types(node) == {"users.User": node, "users.address.Address": address.type}
+
+    assert User.get_fingerprint() == fingerprint(to_parsing_canonical_form(User.avro_schema_to_python()), "CRC-64-AVRO")
+    assert User.get_fingerprint("SHA-256") == schema_ir.fingerprint(node, "SHA-256")
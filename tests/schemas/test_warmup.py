@@ -0,0 +1,93 @@
+import dataclasses
+import typing
+
+from dataclasses_avroschema import AvroModel
+from dataclasses_avroschema.avrodantic import AvroBaseModel
+from dataclasses_avroschema.exceptions import NameSpaceRequiredException
+from dataclasses_avroschema.warmup import get_models, warmup
+
+
+def test_warmup():
+    @dataclasses.dataclass
+    class Address(AvroModel):
+        street: str
+
+    @dataclasses.dataclass
+    class User(AvroModel):
+        name: str
+        addresses: typing.List[Address]
+
+    class Event(AvroBaseModel):
+        name: str
+
+        class Meta:
+            trusted = True
+
+    reports = warmup([User, Event])
+
+    assert [report.model for report in reports] == [User, Event]
+    assert all(report.elapsed > 0 and report.error is None for report in reports)
+
+    class_cache = User._get_class_cache()
+    for key in ("avro_schema", "parsed_schema", ("fingerprint", "CRC-64-AVRO"), "union_tagger", "json_plan"):
+        assert key in class_cache
+    assert "construct_plan" in Event._get_class_cache()
+
+    user = User(name="john", addresses=[Address(street="test")])
+    assert User.deserialize(user.serialize()) == user
+    assert Event.deserialize(Event(name="an event").serialize()) == Event(name="an event")
+
+
+def test_warmup_continues_after_errors():
+    @dataclasses.dataclass
+    class Address(AvroModel):
+        street: str
+
+    @dataclasses.dataclass
+    class Invalid(AvroModel):
+        # the same record twice without a namespace
+        home: Address
+        work: Address
+
+    @dataclasses.dataclass
+    class User(AvroModel):
+        name: str
+
+    reports = warmup([Invalid, User])
+
+    assert [report.model for report in reports] == [Invalid, User]
+    assert isinstance(reports[0].error, NameSpaceRequiredException)
+    assert reports[1].error is None
+    assert "parsed_schema" in User._get_class_cache()
+
+
+def test_get_models():
+    @dataclasses.dataclass
+    class User(AvroModel):
+        name: str
+
+    @dataclasses.dataclass
+    class Event(AvroModel):
+        name: str
+
+        class Meta:
+            warmup = True
+
+    class Base(AvroModel):
+        class Meta:
+            warmup = False
+
+    @dataclasses.dataclass
+    class Child(Base):
+        name: str
+
+        class Meta:
+            warmup = True
+
+    models = get_models()
+
+    assert User not in models
+    assert Event in models
+    assert Child in models
+    assert Base not in models
+    assert AvroBaseModel not in models
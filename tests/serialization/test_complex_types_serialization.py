@@ -1,8 +1,14 @@
+import array
 import dataclasses
 import enum
+import io
 import json
+import typing
 
-from dataclasses_avroschema import AvroModel
+import fastavro
+import pytest
+
+from dataclasses_avroschema import AvroModel, types
 
 
 def test_complex_fields(user_advance_dataclass, color_enum):
@@ -281,3 +287,96 @@ def test_enum_fields_with_inner_schema():
 
     assert OuterSchema.deserialize(avro_binary) == example
     assert OuterSchema.deserialize(avro_json, serialization_type="avro-json") == example
+
+
+@dataclasses.dataclass
+class Telemetry(AvroModel):
+    name: str
+    counts: typing.List[int]
+    small_counts: typing.List[types.Int32]
+    values: typing.List[float]
+    small_values: typing.List[types.Float32]
+    extra: typing.Optional[typing.List[float]] = None
+
+
+@dataclasses.dataclass
+class TypedTelemetry(Telemetry):
+    class Meta:
+        typed_arrays = True
+
+
+def test_arrays_of_numbers():
+    payload = {
+        "name": "sensor",
+        "counts": [1, -2, 2**40],
+        "small_counts": [1, -2, 3],
+        "values": [0.5, -1.25, 1e100],
+        "small_values": [0.5, -1.25, 2.0],
+        "extra": [1.5],
+    }
+    expected = io.BytesIO()
+    fastavro.schemaless_writer(expected, Telemetry.avro_schema_to_python(), payload)
+
+    # lists and array.array are encoded in the same way
+    telemetry = Telemetry(**payload)
+    typed_telemetry = Telemetry(
+        name="sensor",
+        counts=array.array("q", payload["counts"]),
+        small_counts=array.array("i", payload["small_counts"]),
+        values=array.array("d", payload["values"]),
+        small_values=array.array("f", payload["small_values"]),
+        extra=array.array("d", payload["extra"]),
+    )
+    assert telemetry.serialize() == typed_telemetry.serialize() == expected.getvalue()
+    assert Telemetry.deserialize(typed_telemetry.serialize()) == telemetry
+    assert Telemetry.deserialize(typed_telemetry.serialize(serialization_type="avro-json"), "avro-json") == telemetry
+
+    # empty arrays
+    empty = Telemetry(name="sensor", counts=array.array("q"), small_counts=[], values=array.array("d"), small_values=[])
+    assert Telemetry.deserialize(empty.serialize()) == Telemetry("sensor", [], [], [], [])
+
+
+def test_decode_arrays_of_numbers_into_typed_arrays():
+    telemetry = TypedTelemetry(name="sensor", counts=[1, 2], small_counts=[3], values=[0.5], small_values=[1.5])
+    result = TypedTelemetry.deserialize(telemetry.serialize())
+
+    assert result.counts == array.array("q", [1, 2])
+    assert result.small_counts == array.array("i", [3])
+    assert result.values == array.array("d", [0.5])
+    assert result.small_values == array.array("f", [1.5])
+    assert result.extra is None
+    assert TypedTelemetry.deserialize_many(TypedTelemetry.serialize_many([result, result])) == [result, result]
+
+
+def test_arrays_of_numbers_validate_the_other_fields():
+    class Name(str):
+        pass
+
+    @dataclasses.dataclass
+    class Sample(AvroModel):
+        values: typing.List[int]
+        label: typing.Union[str, int]
+        md5: types.Fixed = types.Fixed(4)
+
+    # the payloads are the same that fastavro writes
+    sample = Sample(values=[1, 2], label=Name("sensor"), md5=b"abcd")
+    expected = io.BytesIO()
+    fastavro.schemaless_writer(expected, Sample.avro_schema_to_python(), {**sample.asdict(), "label": "sensor"})
+    assert sample.serialize() == expected.getvalue()
+    assert Sample.deserialize(sample.serialize()) == Sample(values=[1, 2], label="sensor", md5=b"abcd")
+
+    with pytest.raises(ValueError, match="data of length 5 does not match schema size"):
+        Sample(values=[1, 2], label=1, md5=b"abcde").serialize()
+
+
+def test_numpy_arrays_of_numbers():
+    numpy = pytest.importorskip("numpy")
+    telemetry = Telemetry(
+        name="sensor",
+        counts=numpy.array([1, 2], dtype=numpy.int64),
+        small_counts=numpy.array([3], dtype=numpy.int32),
+        values=numpy.array([0.5, 1.5]),
+        small_values=numpy.array([1.5], dtype=numpy.float32),
+    )
+
+    assert Telemetry.deserialize(telemetry.serialize()) == Telemetry("sensor", [1, 2], [3], [0.5, 1.5], [1.5])
@@ -0,0 +1,140 @@
+import dataclasses
+import json
+import typing
+
+import fastavro
+import pytest
+
+from dataclasses_avroschema import AvroModel
+from dataclasses_avroschema.container import ContainerReader, read_container_parallel
+
+
+@dataclasses.dataclass
+class User(AvroModel):
+    name: str
+    age: int
+    tags: typing.List[str] = dataclasses.field(default_factory=list)
+
+
+@dataclasses.dataclass
+class UserV2(AvroModel):
+    name: str
+    age: int
+    email: str = "unknown"
+
+    class Meta:
+        schema_name = "User"
+
+
+USERS = [User(name=f"user-{number}", age=number, tags=["a"] * (number % 3)) for number in range(100)]
+
+
+def write_container(path, codec: str = "null", sync_interval: int = 100) -> None:
+    with open(path, "wb") as fileobj:
+        fastavro.writer(fileobj, User.avro_schema_to_python(), [user.to_dict() for user in USERS], codec, sync_interval)
+
+
+@pytest.mark.parametrize("codec", ["null", "deflate"])
+def test_container_reader(tmp_path, codec):
+    path = tmp_path / "users.avro"
+    write_container(path, codec)
+
+    with ContainerReader(path, User) as reader:
+        assert len(reader) == len(USERS)
+        assert reader.blocks_count > 1
+        assert list(reader) == USERS
+        assert reader[0] == USERS[0]
+        assert reader[57] == USERS[57]
+        assert reader[-1] == USERS[-1]
+
+        with pytest.raises(IndexError):
+            reader[len(USERS)]
+
+        blocks = list(reader.blocks(1, 3))
+        assert len(blocks) == 2
+        start = sum(reader.index.counts[:1])
+        assert [user for records in blocks for user in records] == USERS[start : start + sum(map(len, blocks))]
+
+
+def test_container_reader_as_dict_and_writer_schema(tmp_path):
+    path = tmp_path / "users.avro"
+    write_container(path)
+
+    with ContainerReader(path, User, create_instance=False) as reader:
+        assert reader[3] == USERS[3].to_dict()
+
+    with ContainerReader(path, UserV2) as reader:
+        assert reader[3] == UserV2(name="user-3", age=3)
+
+
+def test_container_reader_index(tmp_path):
+    path = tmp_path / "users.avro"
+    index_path = tmp_path / "users.avro.index"
+    write_container(path)
+
+    with ContainerReader(path, User, index_path=index_path) as reader:
+        index = reader.index
+
+    with open(index_path) as fileobj:
+        assert json.load(fileobj)["counts"] == index.counts
+
+    with ContainerReader(path, User, index_path=index_path) as reader:
+        assert reader.index == index
+
+    # the file changed, so the index is stale and it is created again
+    write_container(path, sync_interval=1000)
+    with ContainerReader(path, User, index_path=index_path) as reader:
+        assert reader.index != index
+        assert list(reader) == USERS
+
+
+def test_invalid_container(tmp_path):
+    path = tmp_path / "users.avro"
+    path.write_bytes(User(name="john", age=20).serialize())
+
+    with pytest.raises(ValueError):
+        ContainerReader(path, User)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_read_container_parallel(tmp_path, workers):
+    path = tmp_path / "users.avro"
+    write_container(path, "deflate", sync_interval=50)
+
+    assert list(read_container_parallel(path, User, workers=workers, blocks_per_task=2)) == USERS
+    assert (
+        sorted(
+            read_container_parallel(path, User, workers=workers, ordered=False, blocks_per_task=2),
+            key=lambda user: user.age,
+        )
+        == USERS
+    )
+    assert list(read_container_parallel(path, User, workers=workers, create_instance=False)) == [
+        user.to_dict() for user in USERS
+    ]
+
+    batches = list(read_container_parallel(path, User, workers=workers, columns=True))
+    assert [name for batch in batches for name in batch["name"]] == [user.name for user in USERS]
+    assert [age for batch in batches for age in batch["age"]] == [user.age for user in USERS]
+
+
+def test_read_container_parallel_interleaved(tmp_path):
+    path = tmp_path / "users.avro"
+    other_path = tmp_path / "other_users.avro"
+    write_container(path, sync_interval=50)
+    with open(other_path, "wb") as fileobj:
+        fastavro.writer(fileobj, UserV2.avro_schema_to_python(), [{"name": "other", "age": 1, "email": "a@b.c"}] * 10)
+
+    # the generators decode in the current process, each one with its own file and schema
+    users = read_container_parallel(path, User, workers=1, blocks_per_task=1)
+    other_users = read_container_parallel(other_path, UserV2, workers=1, blocks_per_task=1)
+
+    result = []
+    other_result = []
+    for other_user, user in zip(other_users, users):
+        result.append(user)
+        other_result.append(other_user)
+    result.extend(users)
+
+    assert result == USERS
+    assert other_result == [UserV2(name="other", age=1, email="a@b.c")] * 10
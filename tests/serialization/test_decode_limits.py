@@ -0,0 +1,169 @@
+import dataclasses
+import typing
+
+import pytest
+
+from dataclasses_avroschema import AvroModel
+from dataclasses_avroschema.exceptions import DecodeLimitExceeded
+from dataclasses_avroschema.limits import DecodeLimits, PayloadChecker
+
+
+@dataclasses.dataclass
+class Address(AvroModel):
+    street: str
+
+
+@dataclasses.dataclass
+class User(AvroModel):
+    name: str
+    tags: typing.List[str]
+    scores: typing.Dict[str, float]
+    addresses: typing.List[Address]
+    flags: typing.List[None] = dataclasses.field(default_factory=list)
+    photo: typing.Optional[bytes] = None
+
+
+@dataclasses.dataclass
+class Node(AvroModel):
+    value: int
+    next: typing.Optional[typing.Type["Node"]] = None
+
+
+def encode_long(value: int) -> bytes:
+    value = (value << 1) ^ (value >> 63)
+    output = bytearray()
+    while value > 0x7F:
+        output.append((value & 0x7F) | 0x80)
+        value >>= 7
+    output.append(value)
+    return bytes(output)
+
+
+USER = User(name="john", tags=["a", "b"], scores={"math": 9.5}, addresses=[Address(street="test")], photo=b"\x00")
+
+
+@pytest.mark.parametrize(
+    "limits",
+    (
+        DecodeLimits(),
+        DecodeLimits(max_bytes=200, max_collection_length=2, max_string_length=4, max_depth=3),
+        DecodeLimits(max_collection_length=2),
+    ),
+)
+def test_payloads_within_limits(limits):
+    data = USER.serialize()
+
+    assert User.deserialize(data, limits=limits) == USER
+    assert User.deserialize_many(User.serialize_many([USER, USER]), limits=limits) == [USER, USER]
+    assert User.deserialize(USER.serialize(serialization_type="avro-json"), "avro-json", limits=limits) == USER
+
+
+@pytest.mark.parametrize(
+    "limits, limit, value",
+    (
+        (DecodeLimits(max_bytes=10), "max_bytes", len(USER.serialize())),
+        (DecodeLimits(max_collection_length=1), "max_collection_length", 2),
+        (DecodeLimits(max_string_length=3), "max_string_length", 4),
+        (DecodeLimits(max_depth=2), "max_depth", 3),
+    ),
+)
+def test_payloads_that_exceed_limits(limits, limit, value):
+    data = USER.serialize()
+
+    with pytest.raises(DecodeLimitExceeded) as excinfo:
+        User.deserialize(data, limits=limits)
+    assert (excinfo.value.limit, excinfo.value.value) == (limit, value)
+
+    with pytest.raises(DecodeLimitExceeded):
+        User.deserialize_many(data + data, limits=limits)
+    with pytest.raises(DecodeLimitExceeded):
+        User.deserialize(data, lazy=True, limits=limits)
+
+
+def test_meta_decode_limits():
+    @dataclasses.dataclass
+    class Message(AvroModel):
+        body: str
+
+        class Meta:
+            decode_limits = DecodeLimits(max_string_length=10)
+
+    assert Message.deserialize(Message(body="hello").serialize()) == Message(body="hello")
+
+    with pytest.raises(DecodeLimitExceeded) as excinfo:
+        Message.deserialize(Message(body="hello world").serialize())
+    assert str(excinfo.value) == "The payload exceeds the decode limit max_string_length: 11 is greater than 10"
+
+    # the limits of the call are used instead of the ones of Meta
+    data = Message(body="hello world").serialize()
+    assert Message.deserialize(data, limits=DecodeLimits()) == Message(body="hello world")
+
+
+def test_malicious_lengths():
+    limits = DecodeLimits(max_collection_length=1000, max_string_length=1000)
+
+    # an array of null items takes no bytes, so any number of them can be claimed
+    data = b"\x08john" + b"\x00\x00\x00" + encode_long(10**9) + b"\x00\x00"
+    with pytest.raises(DecodeLimitExceeded) as excinfo:
+        User.deserialize(data, limits=limits)
+    assert excinfo.value.limit == "max_collection_length"
+
+    # the claimed sizes are checked even when the payload is truncated
+    data = encode_long(2**40) + b"x" * 2000
+    with pytest.raises(DecodeLimitExceeded) as excinfo:
+        User.deserialize(data, limits=limits)
+    assert excinfo.value.value == 2**40
+
+
+def test_recursive_models_depth():
+    node = Node(value=1)
+    for value in range(2, 20):
+        node = Node(value=value, next=node)
+    data = node.serialize()
+
+    assert Node.deserialize(data, limits=DecodeLimits(max_depth=19)) == node
+    with pytest.raises(DecodeLimitExceeded) as excinfo:
+        Node.deserialize(data, limits=DecodeLimits(max_depth=18))
+    assert excinfo.value.value == 19
+
+
+def test_writer_schema_limits():
+    @dataclasses.dataclass
+    class UserV2(AvroModel):
+        name: str
+
+        class Meta:
+            schema_name = "User"
+
+    data = USER.serialize()
+
+    assert UserV2.deserialize(data, writer_schema=User, limits=DecodeLimits(max_collection_length=2)).name == "john"
+    with pytest.raises(DecodeLimitExceeded):
+        UserV2.deserialize(data, writer_schema=User, limits=DecodeLimits(max_collection_length=1))
+
+    # the checker of the writer schema is built once, the docs do not change it
+    def get_checkers():
+        return [value for key, value in UserV2._get_class_cache().items() if key[:1] == ("payload_checker",)]
+
+    checkers = get_checkers()
+    writer_schema = {**User.avro_schema_to_python(), "doc": "Other doc"}
+    UserV2.deserialize(data, writer_schema=writer_schema, limits=DecodeLimits(max_collection_length=2))
+    assert len(checkers) == 1
+    assert get_checkers() == checkers
+
+
+def test_payload_checker():
+    checker = PayloadChecker(User.avro_schema_to_python())
+
+    assert checker.has_strings and checker.has_collections and checker.empty_items
+    assert not checker.recursive
+    assert checker.depth == 3
+
+    # small payloads are not walked
+    assert not checker.needs_walk(DecodeLimits(max_string_length=100, max_depth=3), 100)
+    assert checker.needs_walk(DecodeLimits(max_string_length=100), 101)
+    assert checker.needs_walk(DecodeLimits(max_collection_length=1000), 10)
+    assert checker.needs_walk(DecodeLimits(max_depth=2), 10)
+
+    checker = PayloadChecker(Node.avro_schema_to_python())
+    assert checker.recursive and not checker.has_collections
@@ -0,0 +1,129 @@
+import enum
+import io
+import typing
+
+import fastavro
+import faust
+import pytest
+from faust.serializers import codecs
+
+from dataclasses_avroschema import AvroModel
+from dataclasses_avroschema.avrodantic import AvroBaseModel
+from dataclasses_avroschema.faust_codec import AvroCodec, register_codec
+
+
+class Color(enum.Enum):
+    BLUE = "BLUE"
+    GREEN = "GREEN"
+
+
+class Address(faust.Record, AvroModel):
+    street: str
+    street_number: int
+
+    class Meta:
+        namespace = "users.address"
+
+
+class User(faust.Record, AvroModel):
+    name: str
+    color: Color
+    addresses: typing.List[Address]
+    address_by_name: typing.Dict[str, Address]
+
+
+user_payload = {
+    "name": "john",
+    "color": "BLUE",
+    "addresses": [{"street": "test", "street_number": 10}],
+    "address_by_name": {"home": {"street": "test", "street_number": 10}},
+}
+
+
+@pytest.fixture
+def app() -> faust.App:
+    return faust.App("test-app", broker="memory://")
+
+
+@pytest.fixture
+def user() -> User:
+    address = Address(street="test", street_number=10)
+    return User(name="john", color=Color.BLUE, addresses=[address], address_by_name={"home": address})
+
+
+def fastavro_encode(payload: typing.Dict, schema: typing.Dict) -> bytes:
+    output = io.BytesIO()
+    fastavro.schemaless_writer(output, schema, payload)
+    return output.getvalue()
+
+
+def test_codec_round_trip(app: faust.App, user: User) -> None:
+    register_codec("avro-user", User)
+    topic = app.topic("users", value_type=User, value_serializer="avro-user")
+
+    data, _ = topic.prepare_value(user, None)
+    assert data == fastavro_encode(user_payload, User.avro_schema_to_python())
+
+    for _ in range(2):
+        result = app.serializers.loads_value(User, data, serializer="avro-user")
+        assert result == user
+        assert type(result.addresses[0]) is Address
+        assert result.color is Color.BLUE
+
+
+def test_codec_uses_parsed_schema(app: faust.App, user: User, monkeypatch) -> None:
+    codec = register_codec("avro-user-cached", User)
+    data = codec.dumps(user)
+
+    def avro_schema_to_python(*args: typing.Any) -> None:
+        raise AssertionError("the schema must not be generated again")
+
+    # the schema was already parsed and cached in the model
+    monkeypatch.setattr(User, "avro_schema_to_python", avro_schema_to_python)
+
+    assert codec.dumps(user) == data
+    assert app.serializers.loads_value(User, data, serializer="avro-user-cached") == user
+
+
+def test_codec_batch(app: faust.App, user: User) -> None:
+    register_codec("avro-users", User, many=True)
+    other_user = User(name="bond", color=Color.GREEN, addresses=[], address_by_name={})
+
+    data = app.serializers.dumps_value(None, [user, other_user], serializer="avro-users")
+
+    other_user_payload = {"name": "bond", "color": "GREEN", "addresses": [], "address_by_name": {}}
+    schema = User.avro_schema_to_python()
+    assert data == fastavro_encode(user_payload, schema) + fastavro_encode(other_user_payload, schema)
+    assert app.serializers.loads_value(None, data, serializer="avro-users") == [user, other_user]
+
+
+def test_codec_avro_json(app: faust.App, user: User) -> None:
+    register_codec("avro-json-user", User, serialization_type="avro-json")
+
+    data = app.serializers.dumps_value(User, user, serializer="avro-json-user")
+
+    assert b'"color": "BLUE"' in data
+    assert app.serializers.loads_value(User, data, serializer="avro-json-user") == user
+
+
+def test_codec_chain(app: faust.App, user: User) -> None:
+    codec = AvroCodec(User) | codecs.get_codec("binary")
+    codecs.register("avro-binary-user", codec)
+
+    data = app.serializers.dumps_value(User, user, serializer="avro-binary-user")
+
+    assert app.serializers.loads_value(User, data, serializer="avro-binary-user") == user
+
+
+def test_codec_pydantic_model(app: faust.App) -> None:
+    class Pet(AvroBaseModel):
+        name: str
+        color: Color
+
+    register_codec("avro-pet", Pet)
+    pet = Pet(name="lassie", color=Color.GREEN)
+
+    data = app.serializers.dumps_value(None, pet, serializer="avro-pet")
+
+    assert data == pet.serialize()
+    assert app.serializers.loads_value(None, data, serializer="avro-pet") == pet
@@ -0,0 +1,146 @@
+import copy
+import dataclasses
+import enum
+import pickle
+import typing
+
+import pytest
+
+from dataclasses_avroschema import AvroModel
+from dataclasses_avroschema.lazy import LazyRecord
+
+
+class Color(enum.Enum):
+    BLUE = "BLUE"
+    RED = "RED"
+
+
+@dataclasses.dataclass
+class Location(AvroModel):
+    latitude: float
+    longitude: float
+
+    class Meta:
+        namespace = "types.location_type"
+
+
+@dataclasses.dataclass
+class Message(AvroModel):
+    key: str
+    payload: bytes
+    origin: Location
+    destination: Location
+    tags: typing.List[str]
+    color: Color
+
+
+@pytest.fixture
+def message():
+    return Message(
+        key="a key",
+        payload=b"a big payload",
+        origin=Location(latitude=1.0, longitude=2.0),
+        destination=Location(latitude=3.0, longitude=4.0),
+        tags=["first", "second"],
+        color=Color.RED,
+    )
+
+
+def test_lazy_deserialization(message):
+    record = Message.deserialize(message.serialize(), lazy=True)
+
+    assert isinstance(record, LazyRecord)
+    assert record.destination == {"latitude": 3.0, "longitude": 4.0}
+    assert record.key == "a key"
+    assert record.color == Color.RED
+    assert record.to_dict() == Message.deserialize(message.serialize(), create_instance=False)
+
+
+def test_lazy_deserialization_decodes_fields_once(message, monkeypatch):
+    record = Message.deserialize(message.serialize(), lazy=True)
+    calls = []
+    decode_field = LazyRecord._decode_field
+
+    def spy(self, name):
+        calls.append(name)
+        return decode_field(self, name)
+
+    monkeypatch.setattr(LazyRecord, "_decode_field", spy)
+
+    assert record.tags == ["first", "second"]
+    assert record.tags == ["first", "second"]
+    assert record.payload == b"a big payload"
+    assert calls == ["tags", "payload"]
+
+
+def test_lazy_record_is_read_only(message):
+    record = Message.deserialize(message.serialize(), lazy=True)
+
+    with pytest.raises(AttributeError):
+        record.key = "another key"
+
+    with pytest.raises(AttributeError):
+        record.unknown
+
+
+def test_lazy_deserialization_with_writer_schema(message):
+    @dataclasses.dataclass
+    class MessageV2(AvroModel):
+        key: str
+        color: Color
+        priority: int = 1
+
+        class Meta:
+            schema_name = "Message"
+
+    record = MessageV2.deserialize(message.serialize(), writer_schema=Message, lazy=True)
+
+    assert record.priority == 1
+    assert record.color == Color.RED
+
+
+def test_lazy_deserialization_self_reference():
+    @dataclasses.dataclass
+    class User(AvroModel):
+        name: str
+        friend: typing.Type["User"] = None
+        age: int = 10
+
+    user = User(name="john", friend=User(name="peter", age=30), age=20)
+    record = User.deserialize(user.serialize(), lazy=True)
+
+    assert record.age == 20
+    # the whole record is decoded once
+    assert set(record._values) == {"name", "friend", "age"}
+    assert record.friend == {"name": "peter", "friend": None, "age": 30}
+    assert User.deserialize(user.serialize(), fields=["friend"]) == {
+        "friend": {"name": "peter", "friend": None, "age": 30}
+    }
+
+
+def test_lazy_deserialization_avro_json(message):
+    with pytest.raises(ValueError):
+        Message.deserialize(
+            message.serialize(serialization_type="avro-json"), serialization_type="avro-json", lazy=True
+        )
+
+
+def test_lazy_deserialization_invalid_arguments(message):
+    data = message.serialize()
+
+    with pytest.raises(ValueError):
+        Message.deserialize(data, lazy=True, fields=["key"])
+
+    with pytest.raises(ValueError):
+        Message.deserialize(data, lazy=True, create_instance=False)
+
+
+def test_lazy_record_copy_and_pickle(message):
+    record = Message.deserialize(message.serialize(), lazy=True)
+    assert record.key == "a key"
+
+    for record_copy in (copy.copy(record), copy.deepcopy(record), pickle.loads(pickle.dumps(record))):
+        assert record_copy.to_dict() == record.to_dict()
+
+    with pytest.raises(AttributeError):
+        record._unknown
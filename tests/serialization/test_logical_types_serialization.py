@@ -173,3 +173,15 @@ def test_decimals_defaults():
     assert logical_types.deserialize(avro_json, serialization_type="avro-json", create_instance=False) == data
 
     assert logical_types.to_json() == json.dumps(data_json)
+
+
+def test_dates_to_str():
+    for value in (
+        a_datetime,
+        datetime.datetime(2019, 10, 12, 17, 57, 42),
+        datetime.datetime(5, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+        datetime.datetime(999, 12, 31, 23, 59, 59),
+    ):
+        assert serialization.datetime_to_str(value) == value.strftime(serialization.DATETIME_STR_FORMAT)
+        assert serialization.date_to_str(value) == value.strftime(serialization.DATE_STR_FORMAT)
+        assert serialization.date_to_str(value.date()) == value.strftime(serialization.DATE_STR_FORMAT)
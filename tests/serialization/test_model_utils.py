@@ -1,10 +1,14 @@
+import datetime
+import decimal
+import enum
 import json
 import typing
+import uuid
 from dataclasses import dataclass
 
 import pytest
 
-from dataclasses_avroschema import AvroModel
+from dataclasses_avroschema import AvroModel, serialization, types
 from tests.serialization.test_serialization import CLASSES_DATA_BINARY
 
 
@@ -14,6 +18,16 @@ def test_to_dict_to_json(klass, data, avro_binary, avro_json, instance_json, pyt
 
     assert instance.to_dict() == python_dict
     assert instance.to_json() == json.dumps(instance_json)
+    # the json plan must produce the same output as the generic conversion
+    assert klass.get_json_plan()(instance) == serialization.to_json(instance.asdict())
+
+
+@pytest.mark.parametrize("klass, data, avro_binary, avro_json, instance_json, python_dict", CLASSES_DATA_BINARY)
+def test_to_json_many(klass, data, avro_binary, avro_json, instance_json, python_dict):
+    instances = [klass(**data), klass(**data)]
+
+    assert klass.to_json_many(instances) == json.dumps([instance_json, instance_json])
+    assert klass.get_json_plan() is klass.get_json_plan()
 
 
 def test_dacite_config():
@@ -36,7 +50,13 @@ def test_dacite_config():
     serialized_val = Trip(transport=bus).serialize()
 
     assert Trip.deserialize(serialized_val, create_instance=False) == {"transport": {"driver": "Marcos", "total": 10}}
+    # the record name of the union branch is used, so it is a Bus even with the default dacite config
     instance = Trip.deserialize(serialized_val)
+    assert instance.transport == bus
+
+    # avro-json does not include the record names, so dacite takes the first class that matches
+    serialized_val = Trip(transport=bus).serialize(serialization_type="avro-json")
+    instance = Trip.deserialize(serialized_val, serialization_type="avro-json")
     assert instance.transport == Car(total=10)
 
 
@@ -67,3 +87,52 @@ def test_custom_dacite_config():
     assert Trip.deserialize(serialized_val, create_instance=False) == {"transport": {"driver": "Marcos", "total": 10}}
     instance = Trip.deserialize(serialized_val)
     assert instance.transport == bus
+
+
+def test_json_plan_nested_types():
+    class Color(enum.Enum):
+        BLUE = "BLUE"
+
+    @dataclass
+    class Address(AvroModel):
+        street: str
+        built: datetime.date
+        color: Color = Color.BLUE
+
+    @dataclass
+    class Person(AvroModel):
+        name: str
+        addresses: typing.List[Address]
+        addresses_by_city: typing.Dict[str, Address]
+        moments: typing.List[datetime.datetime]
+        identifiers: typing.Tuple[uuid.UUID]
+        union: typing.Union[int, Address, datetime.time]
+        money: decimal.Decimal = types.Decimal(scale=2, precision=10)
+        md5: types.Fixed = types.Fixed(4, default=b"abcd")
+        optional_address: typing.Optional[Address] = None
+        friend: typing.Type["Person"] = None
+
+    address = Address(street="a street", built=datetime.date(2020, 1, 1))
+    person = Person(
+        name="john",
+        addresses=[address],
+        addresses_by_city={"Amsterdam": address},
+        moments=[datetime.datetime(2020, 1, 1, 10, 10, 10, tzinfo=datetime.timezone.utc)],
+        identifiers=(uuid.UUID("09f00184-7721-4266-a955-21048a5cc235"),),
+        union=address,
+        money=decimal.Decimal("10.25"),
+        md5=b"abcd",
+        friend=Person(
+            name="peter",
+            addresses=[],
+            addresses_by_city={},
+            moments=[],
+            identifiers=(),
+            union=datetime.time(10, 10, 10),
+            money=decimal.Decimal("1.50"),
+            md5=b"efgh",
+        ),
+    )
+
+    assert Person.get_json_plan()(person) == serialization.to_json(person.asdict())
+    assert json.loads(person.to_json())["moments"] == ["2020-01-01T10:10:10+0000"]
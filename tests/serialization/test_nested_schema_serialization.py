@@ -1,5 +1,7 @@
 import dataclasses
 import datetime
+import enum
+import json
 import typing
 
 from dataclasses_avroschema import AvroModel
@@ -251,3 +253,115 @@ def test_nested_scheamas_splitted_with_intermediates() -> None:
 
     assert d.serialize() == b""
     assert c.serialize() == b""
+
+
+def test_union_of_records_is_tagged_with_the_branch() -> None:
+    """
+    Records with the same fields are valid for any branch, so the branch
+    must come from the class of the value and not from the data
+    """
+
+    @dataclasses.dataclass
+    class Cat(AvroModel):
+        name: str
+
+        class Meta:
+            namespace = "animals"
+
+    @dataclasses.dataclass
+    class Dog(AvroModel):
+        name: str
+
+        class Meta:
+            namespace = "animals"
+
+    @dataclasses.dataclass
+    class Owner(AvroModel):
+        pet: typing.Union[Cat, Dog]
+        pets: typing.List[typing.Union[Cat, Dog]]
+        pets_by_name: typing.Dict[str, typing.Union[Cat, Dog]]
+        optional_pet: typing.Optional[typing.Union[Cat, Dog]] = None
+
+    owner = Owner(
+        pet=Dog(name="rex"),
+        pets=[Cat(name="tom"), Dog(name="rex")],
+        pets_by_name={"rex": Dog(name="rex")},
+        optional_pet=Dog(name="max"),
+    )
+
+    assert owner.serialize() == (
+        b"\x02\x06rex" + b"\x04\x00\x06tom\x02\x06rex\x00" + b"\x02\x06rex\x02\x06rex\x00" + b"\x04\x06max"
+    )
+    assert owner.serialize_many([owner, owner]) == owner.serialize() * 2
+    assert json.loads(owner.serialize(serialization_type="avro-json"))["pet"] == {"animals.Dog": {"name": "rex"}}
+
+    # the tags are only used to encode
+    assert owner.asdict()["pet"] == {"name": "rex"}
+    assert Owner(pet=Cat(name="tom"), pets=[], pets_by_name={}).serialize() == b"\x00\x06tom\x00\x00\x00"
+
+
+def test_union_of_enums_is_tagged_with_the_branch() -> None:
+    class Direction(enum.Enum):
+        UP = "UP"
+        DOWN = "DOWN"
+
+    class Vote(enum.Enum):
+        UP = "UP"
+        DOWN = "DOWN"
+
+    @dataclasses.dataclass
+    class Answer(AvroModel):
+        value: typing.Union[Direction, Vote]
+
+        class Meta:
+            namespace = "votes"
+
+    assert Answer(value=Vote.DOWN).serialize() == b"\x02\x02"
+    assert Answer(value=Direction.DOWN).serialize() == b"\x00\x02"
+
+
+def test_union_of_records_is_decoded_with_the_branch_class() -> None:
+    """
+    The record names are read from the payload, so records with the same fields
+    are created with the class that was serialized
+    """
+
+    @dataclasses.dataclass
+    class Cat(AvroModel):
+        name: str
+
+        class Meta:
+            namespace = "animals"
+
+    @dataclasses.dataclass
+    class Dog(AvroModel):
+        name: str
+
+        class Meta:
+            namespace = "animals"
+
+    @dataclasses.dataclass
+    class Walk(AvroModel):
+        pet: typing.Union[Cat, Dog]
+
+    @dataclasses.dataclass
+    class Owner(AvroModel):
+        pet: typing.Union[Cat, Dog]
+        pets: typing.List[typing.Union[Cat, Dog]]
+        pets_by_name: typing.Dict[str, typing.Union[Cat, Dog]]
+        walks: typing.List[Walk]
+        optional_pet: typing.Optional[typing.Union[Cat, Dog]] = None
+
+    owner = Owner(
+        pet=Dog(name="rex"),
+        pets=[Cat(name="tom"), Dog(name="rex")],
+        pets_by_name={"rex": Dog(name="rex")},
+        walks=[Walk(pet=Dog(name="max"))],
+        optional_pet=Dog(name="max"),
+    )
+
+    assert Owner.deserialize(owner.serialize()) == owner
+    assert Owner.deserialize_many(owner.serialize_many([owner, owner])) == [owner, owner]
+
+    # without instances the payload does not include the record names
+    assert Owner.deserialize(owner.serialize(), create_instance=False)["pet"] == {"name": "rex"}
@@ -1,7 +1,9 @@
 import dataclasses
 import typing
 
-from dataclasses_avroschema import AvroModel
+import pytest
+
+from dataclasses_avroschema import AvroModel, serialization
 
 
 def test_self_one_to_one_relationship():
@@ -148,3 +150,70 @@ def test_self_one_to_many_map_relationship():
     # TODO: Bug in dacite
     # assert User.deserialize(avro_binary) == user
     assert user.to_dict() == expected
+
+
+def test_deep_self_relationship():
+    """
+    Models with self relationships are encoded and decoded without recursion,
+    so very deep data does not hit the recursion limit
+    """
+
+    @dataclasses.dataclass
+    class Node(AvroModel):
+        value: int
+        next: typing.Optional[typing.Type["Node"]] = None
+
+    node = None
+    for value in range(100_000):
+        node = Node(value=value, next=node)
+
+    data = node.serialize()
+    decoded = Node.deserialize(data)
+
+    for value in reversed(range(100_000)):
+        assert decoded.value == value
+        decoded = decoded.next
+    assert decoded is None
+
+
+def test_self_relationship_with_containers():
+    @dataclasses.dataclass
+    class Tree(AvroModel):
+        name: str
+        children: typing.List[typing.Type["Tree"]] = dataclasses.field(default_factory=list)
+        by_name: typing.Dict[str, typing.Type["Tree"]] = dataclasses.field(default_factory=dict)
+
+    leaf = Tree(name="leaf")
+    tree = Tree(name="root", children=[leaf, Tree(name="node", children=[leaf])], by_name={"leaf": leaf})
+
+    # the same data that fastavro writes
+    data = tree.serialize()
+    assert data == serialization.serialize(tree.asdict(), Tree.avro_schema_to_python())
+
+    assert Tree.deserialize(data) == tree
+    assert Tree.deserialize(data, create_instance=False) == tree.asdict()
+    assert Tree.deserialize_many(Tree.serialize_many([tree, leaf])) == [tree, leaf]
+
+    buffer = bytearray(len(data) + 2)
+    assert tree.serialize_into(buffer, offset=2) == len(data)
+    assert buffer[2:] == data
+
+
+def test_self_relationship_truncated_data():
+    @dataclasses.dataclass
+    class Node(AvroModel):
+        name: str
+        weight: float
+        active: bool
+        children: typing.List[typing.Type["Node"]] = dataclasses.field(default_factory=list)
+
+    node = Node(name="root", weight=1.5, active=True, children=[Node(name="leaf", weight=0.5, active=False)])
+    data = node.serialize()
+
+    # as with fastavro, every truncated payload raises EOFError
+    for size in range(len(data)):
+        with pytest.raises(EOFError):
+            Node.deserialize(data[:size])
+
+    with pytest.raises(EOFError, match="Expected 4 bytes, read 3"):
+        Node.deserialize(data[:4])
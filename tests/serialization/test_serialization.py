@@ -219,3 +219,124 @@ def test_deserialization_with_writer_schema_dict():
 def test_deserialization_with_writer_schema_avro_model():
     user = User(**data_user)
     UserCompatible.deserialize(user.serialize(), writer_schema=User)
+
+
+def test_deserialization_with_fields_projection():
+    @dataclass
+    class Location(AvroModel):
+        latitude: float
+        longitude: float
+
+        class Meta:
+            namespace = "types.location_type"
+
+    @dataclass
+    class Event(AvroModel):
+        name: str
+        payload: bytes
+        extra: typing.Dict[str, str]
+        origin: Location
+        destination: Location
+        color: FavoriteColor
+
+    event = Event(
+        name="an event",
+        payload=b"a lot of data",
+        extra={"key": "value"},
+        origin=Location(latitude=1.0, longitude=2.0),
+        destination=Location(latitude=3.0, longitude=4.0),
+        color=FavoriteColor.BLUE,
+    )
+
+    for serialization_type in (AVRO, AVRO_JSON):
+        data = event.serialize(serialization_type=serialization_type)
+
+        assert Event.deserialize(data, serialization_type=serialization_type, fields=["name"]) == {"name": "an event"}
+        # the named type `Location` is defined in `origin` so it must be moved to `destination`
+        assert Event.deserialize(data, serialization_type=serialization_type, fields=["destination", "color"]) == {
+            "destination": {"latitude": 3.0, "longitude": 4.0},
+            "color": FavoriteColor.BLUE,
+        }
+
+    # the projected schema is cached per class and set of fields
+    assert Event.get_projected_schema(["destination", "color"]) is Event.get_projected_schema(["color", "destination"])
+    assert [field["name"] for field in Event.get_projected_schema(["color", "destination"])["fields"]] == [
+        "destination",
+        "color",
+    ]
+
+    with pytest.raises(ValueError):
+        Event.deserialize(event.serialize(), fields=["unknown"])
+
+
+@pytest.mark.parametrize(
+    "serialization_type, expected",
+    [(AVRO, user_avro_binary), (AVRO_JSON, user_avro_json)],
+)
+def test_serialize_into_buffer(serialization_type, expected):
+    user = User(**data_user)
+    buffer = bytearray(200)
+
+    size = user.serialize_into(buffer, offset=10, serialization_type=serialization_type)
+
+    assert size == len(expected)
+    assert buffer[10 : 10 + size] == expected
+    assert buffer[:10] == bytes(10)
+
+    # decode from a slice of the buffer without converting it to bytes
+    view = memoryview(buffer)[10 : 10 + size]
+    assert User.deserialize(view, serialization_type=serialization_type) == user
+
+
+def test_serialize_into_small_buffer():
+    user = User(**data_user)
+
+    with pytest.raises(ValueError):
+        user.serialize_into(bytearray(5))
+
+    with pytest.raises(ValueError):
+        user.serialize_into(memoryview(bytes(100)))
+
+
+@pytest.mark.parametrize("serialization_type", (AVRO, AVRO_JSON))
+def test_serialize_many(serialization_type):
+    users = [User(name=f"john {number}", age=number, addresses=[Address(**address_data)]) for number in range(5)]
+
+    data = User.serialize_many(users, serialization_type=serialization_type)
+
+    assert User.deserialize_many(data, serialization_type=serialization_type) == users
+    assert User.deserialize_many(data, serialization_type=serialization_type, fields=["age"]) == [
+        {"age": number} for number in range(5)
+    ]
+    assert UserCompatible.deserialize_many(data, serialization_type=serialization_type, writer_schema=User) == [
+        UserCompatible(name=user.name, age=user.age, addresses=user.addresses) for user in users
+    ]
+
+
+def test_serialize_many_avro_json_is_json_lines():
+    users = [User(**data_user), User(**data_user)]
+
+    data = User.serialize_many(users, serialization_type=AVRO_JSON)
+
+    assert data.split(b"\n") == [user_avro_json, user_avro_json]
+
+
+def test_load_jsonl(tmp_path):
+    users = [User(name=f"john {number}", age=number, addresses=[]) for number in range(2500)]
+    jsonl_file = tmp_path / "users.jsonl"
+    jsonl_file.write_bytes(User.serialize_many(users, serialization_type=AVRO_JSON) + b"\n")
+
+    with open(jsonl_file) as fileobj:
+        assert list(User.load_jsonl(fileobj)) == users
+
+    with open(jsonl_file, "rb") as fileobj:
+        records = User.load_jsonl(fileobj, create_instance=False)
+        assert next(records) == {"name": "john 0", "age": 0, "addresses": []}
+
+
+def test_serialize_many_invalid_serialization_type():
+    with pytest.raises(ValueError):
+        User.serialize_many([User(**data_user)], serialization_type="json")
+
+    with pytest.raises(ValueError):
+        User.deserialize_many(b"", serialization_type="json")